@@ -0,0 +1,99 @@
+"""
+minutaria benchmarks
+====================
+
+:Authors:
+    Locynaeh
+:Version:
+    1.0
+
+Measure the performances of libminutaria with the timeit standard module, to
+hold the library to numbers before and after a change.
+
+Launch it from the repository root with libminutaria installed or in the
+PYTHONPATH:
+
+    python -m benchmarks
+
+Use -h/--help arguments for more information.
+
+Modules
+-------
+timer
+    Benchmark the polling of a timer, its formatting and a real countdown.
+preset
+    Benchmark the preset operations for a growing number of presets.
+memory
+    Benchmark the memory taken by timers, presets and a loaded catalog.
+
+Functions
+---------
+measure
+    Get the best duration of a call to a function.
+percentile
+    Get a percentile of sorted values.
+report
+    Print a benchmark result.
+"""
+
+import timeit
+
+
+def measure(function, number: int = None, repeat: int = 5) -> float:
+    """Get the best duration of a call to a function.
+
+    Parameters
+    ----------
+    function: callable
+        The function to call without argument
+    number: int, optional
+        The number of calls of each measure, automatically determined for a
+        measure to last at least 0.2 second if None
+    repeat: int
+        The number of measures to keep the best from
+
+    Returns
+    -------
+    float
+        The best duration of a call in seconds.
+    """
+    timer = timeit.Timer(function)
+    if number is None:
+        number, _ = timer.autorange()
+
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def percentile(values: list, rank: float) -> float:
+    """Get a percentile of sorted values.
+
+    Parameters
+    ----------
+    values: list
+        The values sorted in ascending order
+    rank: float
+        The percentile to get, between 0 and 1
+
+    Returns
+    -------
+    float
+        The nearest value to the percentile.
+    """
+    return values[round(rank * (len(values) - 1))]
+
+
+def report(name: str, value: float, unit: str = "us") -> None:
+    """Print a benchmark result.
+
+    Parameters
+    ----------
+    name: str
+        The name of the benchmark
+    value: float
+        The result in seconds, or already in the unit if unit is not a time
+        unit
+    unit: str
+        The unit to print the result in : "ns", "us", "ms" or an other unit
+    """
+    scale = {"ns": 1e9, "us": 1e6, "ms": 1e3}.get(unit, 1)
+    print(f"{name:<44} {value * scale:>12.3f} {unit}")
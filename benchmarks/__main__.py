@@ -0,0 +1,26 @@
+"""Launch the minutaria benchmarks, use -h/--help for more information."""
+
+import argparse
+from . import timer, preset, memory
+
+parser = argparse.ArgumentParser(prog="benchmarks",
+                                 description="libminutaria benchmarks")
+parser.add_argument("-c", "--countdown",
+                    type=int,
+                    default=3,
+                    help="duration in seconds of the real countdown")
+parser.add_argument("-s", "--sizes",
+                    type=int,
+                    nargs="+",
+                    default=[10, 1000, 100000],
+                    metavar="SIZE",
+                    help="numbers of presets to benchmark")
+parser.add_argument("-b", "--backend",
+                    choices=list(preset.BACKENDS),
+                    default="json",
+                    help="backend of the preset files")
+args = parser.parse_args()
+
+timer.run(args.countdown)
+preset.run(args.sizes, args.backend)
+memory.run(args.sizes)
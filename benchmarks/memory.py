@@ -0,0 +1,77 @@
+"""
+Benchmark the memory taken by timers, presets and a loaded preset catalog.
+
+Functions
+---------
+allocated
+    Get the memory allocated by a function and kept by its result.
+run
+    Launch the memory benchmarks.
+"""
+
+import os
+import tempfile
+import tracemalloc
+from libminutaria import Timer, Preset, PresetStore
+from . import report
+
+
+def allocated(function):
+    """Get the memory allocated by a function and kept by its result.
+
+    Parameters
+    ----------
+    function: callable
+        The function to call without argument
+
+    Returns
+    -------
+    int
+        The size in bytes of the memory still allocated once called, the
+        result being kept alive.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = function()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    del result
+    return after - before
+
+
+def run(sizes=(10, 1000, 100000)) -> None:
+    """Launch the memory benchmarks.
+
+    For each number of objects, measure the memory per Timer and per Preset
+    object, then the memory of a JSON preset file loaded in its store.
+
+    Parameters
+    ----------
+    sizes: iterable of int
+        The numbers of timers and presets to benchmark
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            timers = allocated(lambda: [Timer(minutes=index % 60)
+                                        for index in range(size)])
+            report(f"Timer memory per timer ({size} timers)",
+                   timers / size, "bytes")
+
+            presets = allocated(lambda: [Preset(f"preset{index}", 0, 1, 0)
+                                         for index in range(size)])
+            report(f"Preset memory per preset ({size} presets)",
+                   presets / size, "bytes")
+
+            preset_file = os.path.join(directory, f"preset{size}.json")
+            Preset.add_many(((f"preset{index}", 0, index // 60 % 60,
+                              index % 60) for index in range(size)),
+                            preset_file)
+            PresetStore._stores.clear()
+            store = allocated(lambda: PresetStore.open(preset_file,
+                                                       create=False))
+            report(f"PresetStore memory per preset ({size} presets)",
+                   store / size, "bytes")
+            PresetStore._stores.clear()
@@ -0,0 +1,62 @@
+"""
+Benchmark the preset operations for a growing number of presets.
+
+Functions
+---------
+run
+    Launch the preset benchmarks.
+"""
+
+import os
+import itertools
+import tempfile
+from libminutaria import Preset, PresetStore
+from . import measure, report
+
+# Extension of the preset file of each backend
+BACKENDS = {"json": ".json", "jsonl": ".jsonl", "sqlite": ".sqlite"}
+
+
+def run(sizes=(10, 1000, 100000), backend: str = "json") -> None:
+    """Launch the preset benchmarks.
+
+    For each number of presets, fill a new preset file then measure the cost
+    of getting a preset, adding one and getting all the names, from the
+    stores already opened and from the file.
+
+    Parameters
+    ----------
+    sizes: iterable of int
+        The numbers of presets to benchmark
+    backend: str
+        The backend of the preset file, "json", "jsonl" or "sqlite"
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            preset_file = os.path.join(directory,
+                                       f"preset{size}{BACKENDS[backend]}")
+            Preset.add_many(((f"preset{index}", 0, index // 60 % 60,
+                              index % 60) for index in range(size)),
+                            preset_file)
+
+            preset = Preset(f"preset{size // 2}", preset_file=preset_file)
+            report(f"Preset.get ({size} presets)", measure(preset.get))
+
+            names = (f"added{index}" for index in itertools.count())
+            report(f"Preset.add ({size} presets)",
+                   measure(lambda: Preset(next(names), 0, 1, 0,
+                                          preset_file).add(),
+                           repeat=3))
+
+            report(f"Preset.get_all ({size} presets)",
+                   measure(lambda: Preset.get_all(preset_file), repeat=3))
+
+            def get_all_from_file():
+                # Forget the opened stores to load the file again
+                PresetStore._stores.clear()
+                Preset.get_all(preset_file)
+
+            report(f"Preset.get_all from file ({size} presets)",
+                   measure(get_all_from_file, repeat=3))
+
+            PresetStore._stores.clear()
@@ -0,0 +1,91 @@
+"""
+Benchmark the polling of a timer, its formatting, the polling of many timers
+and a real countdown.
+
+Functions
+---------
+run
+    Launch the timer benchmarks.
+"""
+
+import time
+import itertools
+from datetime import datetime, timedelta
+from libminutaria import Timer, TimerArray, TimingFormatter, TickScheduler
+from . import measure, percentile, report
+
+
+def run(countdown: int = 3) -> None:
+    """Launch the timer benchmarks.
+
+    Measure the cost of a poll of a timer, against the former datetime
+    polling, and of the formatting of its remaining time, against the former
+    str(timedelta), the cost of a tick of many timers as objects or in a
+    TimerArray, with and without NumPy, then run a real countdown ticked as the front ends do to get
+    the lateness of the ticks and the CPU time used.
+
+    Parameters
+    ----------
+    countdown: int
+        The duration of the real countdown in seconds
+    """
+    timer = Timer(hours=1, minutes=0, seconds=0)
+    timer.is_timing_reached()
+    report("Timer.is_timing_reached", measure(timer.is_timing_reached), "ns")
+    # The former polling, on datetime objects
+    deadline = datetime.now() + timedelta(hours=1)
+    report("datetime poll (former Timer)",
+           measure(lambda: datetime.now() >= deadline), "ns")
+    report("Timer.get_timing", measure(lambda: timer.get_timing), "ns")
+
+    formatter = TimingFormatter()
+    report("TimingFormatter.format (same tenth)",
+           measure(lambda: formatter.format(timer.get_timing_ns)), "ns")
+    timings = itertools.count(3_600_000_000_000, -100_000_000)
+    report("TimingFormatter.format (new tenth)",
+           measure(lambda: formatter.format(next(timings))), "ns")
+    # The former display, sliced by the front ends
+    report("str(timedelta) (former display)",
+           measure(lambda: str(timedelta(microseconds=next(timings) // 1000))
+                   [:9]), "ns")
+
+    # Evaluate many timers at each tick, as objects then in columns
+    timers = [Timer(hours=1, minutes=0, seconds=index) for index in
+              range(10000)]
+    report("Timer.remaining (10000 timers)",
+           measure(lambda: [timer.remaining(time.monotonic_ns()) <= 0
+                            for timer in timers]), "us")
+    # Only the NumPy path is vectorized, the other one being a Python loop
+    # as costly as the Timer objects
+    for backend, use_numpy in (("Python loop", False), ("NumPy", True)):
+        name = f"TimerArray.tick (10000 timers, {backend})"
+        timer_array = TimerArray(use_numpy=use_numpy)
+        if use_numpy and timer_array._numpy is None:
+            print(f"{name:<44} {'NumPy not installed':>15}")
+            continue
+        for index in range(10000):
+            timer_array.add(hours=1, minutes=0, seconds=index)
+        report(name, measure(timer_array.tick), "us")
+
+    # Tick a real countdown as the front ends do
+    timer = Timer(hours=0, minutes=0, seconds=countdown)
+    scheduler = TickScheduler(timer)
+    lateness = []
+    cpu_start = time.process_time()
+    start = time.monotonic_ns()
+
+    counter = timer.is_timing_reached()
+    while counter is False:
+        formatter.format(timer.get_timing_ns)
+        tick = time.monotonic_ns() + round(scheduler.next_tick() * 1e9)
+        counter = scheduler.wait()
+        lateness.append(time.monotonic_ns() - tick)
+
+    cpu = time.process_time() - cpu_start
+    elapsed = (time.monotonic_ns() - start) / 1e9
+    lateness.sort()
+    report(f"Tick lateness p50 ({len(lateness)} ticks)",
+           percentile(lateness, 0.5) / 1e9)
+    report("Tick lateness p99", percentile(lateness, 0.99) / 1e9)
+    report("Tick lateness max", lateness[-1] / 1e9)
+    report("CPU time per second of countdown", cpu / elapsed, "ms")
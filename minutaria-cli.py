@@ -15,28 +15,26 @@ This script is directly usable in a terminal. Use -h/--help arguments for more
 information on how to use the CLI provided.
 """
 
-from datetime import timedelta
-from libminutaria import Timer, Preset, logger, get_cli_args, handle_cli_args
+from libminutaria import (MonotonicClock, Timer, TimerSequence,
+                          TimingFormatter, TimerStats, TickScheduler,
+                          TimerCheckpoint, Preset, logger, get_cli_args,
+                          handle_cli_args, handle_sequence_args)
 
 if __name__ == '__main__':
     # Default parameters to be use if the script is launched without argument
     # or modified by user input
-    TIMER_HOURS = 0  # min 0, max 23
+    TIMER_HOURS = 0  # min 0, max 168
     TIMER_MIN = 0    # min 0, max 59
-    TIMER_SEC = 5    # min 0, max 59
+    TIMER_SEC = 5    # min 0, max 59.999
 
-    # Printable default duration
-    default_duration = timedelta(hours=+TIMER_HOURS,
-                                 minutes=+TIMER_MIN,
-                                 seconds=+TIMER_SEC)
-    DEFAULT = str(default_duration)
+    # Printable default duration, formatted as a timedelta without importing
+    # datetime to keep the startup fast
+    DEFAULT = f"{TIMER_HOURS}:{TIMER_MIN:02}:{TIMER_SEC:02}"
 
     # Launch CLI and get timer values if user input
     args = get_cli_args(DEFAULT)
     timer_values, debug_option = handle_cli_args(args)
-
-    # Initiate logger
-    logger = logger(debug_option)
+    program = handle_sequence_args(args)
 
     # Update timer parameters if modified by CLI
     if (timer_values["timer_hours"]
@@ -46,17 +44,81 @@ if __name__ == '__main__':
         TIMER_MIN = timer_values["timer_min"]
         TIMER_SEC = timer_values["timer_secs"]
 
-    # Initialize and launch a timer according to parameters
-    timer = Timer(hours=TIMER_HOURS, minutes=TIMER_MIN, seconds=TIMER_SEC)
+    # Instrument the timer if stats are asked or logged
+    stats = TimerStats() if args.stats or debug_option else None
+
+    # The clock of the timer and its ticks
+    clock = MonotonicClock()
+
+    # Save the running timer to resume it if the process dies, if asked
+    checkpoint = None
+    if args.checkpoint is not None:
+        checkpoint = TimerCheckpoint(args.checkpoint, clock)
+    label = args.use_preset or args.use_sequence or ''
 
-    # Check remaining time along the timer and print it
+    if args.resume:
+        if checkpoint is None:
+            print("minutaria: Error: argument --resume: requires "
+                  "--checkpoint FILE")
+            exit()
+        # Resume the saved timer, continuing it if it was paused
+        try:
+            resumed = checkpoint.load(stats)
+        except ValueError:
+            resumed = None
+        if resumed is None:
+            print(f"minutaria: Error: argument --resume: no timer to resume "
+                  f"in {args.checkpoint}")
+            exit()
+        timer = resumed["timer"]
+        label = resumed["label"]
+        if resumed["paused"]:
+            timer.continue_after_pause()
+    elif program is not None:
+        # Initialize and launch the sequence of timers
+        timer = TimerSequence(program["steps"], program["repeat"], stats,
+                              clock)
+    else:
+        # Initialize and launch a timer according to parameters
+        timer = Timer(hours=TIMER_HOURS, minutes=TIMER_MIN,
+                      seconds=TIMER_SEC, stats=stats, clock=clock)
+    if checkpoint is not None:
+        checkpoint.save(timer, label)
+    scheduler = TickScheduler(timer)
+    # Keep the same width from the initial timing down to 00:00:00
+    formatter = TimingFormatter.for_timing(timer.get_timing_ns)
+    sequence = isinstance(timer, TimerSequence)
+    step = None
+
+    # Check remaining time along the timer and print it at each tick
     counter = timer.is_timing_reached()
+    line = ""
     while counter is False:
-        print("libminutaria -", "Remaining :", timer.get_timing[:9], end='\r',
-              flush=True)
-        counter = timer.is_timing_reached()
+        if sequence and timer.step != step:
+            # Announce the end of the previous step on its own line
+            if step is not None:
+                print(("libminutaria - GONG !" + step_name).ljust(len(line)))
+            step = timer.step
+            formatter = TimingFormatter.for_timing(timer.get_step_ns)
+            step_name = (f" - {timer.step_label or 'Step'} "
+                         f"{step + 1}/{timer.step_count}")
+        line = "libminutaria - Remaining : " \
+               + formatter.format(timer.get_timing_ns)
+        if sequence:
+            line += step_name
+        print(line, end='\r', flush=True)
+        counter = scheduler.wait()
 
     # Timer reached 00:00:00
     # Print 3 "GONG !" and some spaces to clear the line
-    print("GONG ! " * 3 + ' '*17)
+    print(("GONG ! " * 3).ljust(len(line)))
+    if checkpoint is not None:
+        checkpoint.clear()
+
+    if stats is not None:
+        # Initiate the logger only to log the stats, logging being slow to
+        # import
+        stats.log(logger(debug_option))
+        if args.stats:
+            print(stats.summary())
 
@@ -24,6 +24,11 @@ isn't included in the standard library, this script contains a WINDOWS_CHECK
 parameter for this purpose.
 Nervertheless it should be usable with WSL (not tested).
 
+Classes
+-------
+TimerScreen
+    A rendering layer redrawing only the changed parts of a curses window.
+
 Functions
 ---------
 main
@@ -33,13 +38,121 @@ main
 import logging
 from os import name
 import curses  # see https://docs.python.org/fr/3.7/howto/curses.html
-from datetime import datetime, timedelta
 import libminutaria
 
 
 # Duration between flashes at the end of the timer
 FLASH_PERIOD = 1000
 
+# Help lines of the timer window
+RUNNING_HELP = "Press r to relaunch, p to pause or q to quit..."
+PAUSED_HELP = "Press r to relaunch, p to continue or q to quit..."
+
+
+class TimerScreen:
+    """
+    A rendering layer redrawing only the changed parts of a curses window
+
+    The static chrome (title and help line) is drawn once and each other line
+    is only rewritten when its text changes, so that a running timer only
+    sends its changed digits to the terminal.
+
+    Attributes
+    ----------
+    _window: curses.window
+        The window to draw on
+    _fields: dict
+        The text currently drawn on each line of the window
+    _changed: bool
+        Whether something has been drawn since the last refresh
+
+    Public methods
+    --------------
+    chrome
+        Clear the window and draw the title and an optional help line.
+    field
+        Draw a text on a line of the window if not already drawn.
+    refresh
+        Refresh the window if something has been drawn.
+    getch
+        Refresh the window and wait for a key until a given delay.
+    """
+
+    def __init__(self, window):
+        """Initialize the rendering layer of a curses window.
+
+        Parameters
+        ----------
+        window: curses.window
+            The window to draw on
+        """
+        self._window = window
+        self._fields = {}
+        self._changed = False
+
+    def chrome(self, help_line: str = None) -> None:
+        """Clear the window and draw the title and an optional help line.
+
+        Parameters
+        ----------
+        help_line: str, optional
+            The help line to draw at the bottom of the window
+        """
+        self._window.erase()
+        self._fields = {}
+        self.field(0, "libminutaria", curses.A_STANDOUT)
+        if help_line is not None:
+            self.field(4, help_line)
+
+    def field(self, row: int, text: str, attr: int = curses.A_NORMAL) -> None:
+        """Draw a text on a line of the window if not already drawn.
+
+        Parameters
+        ----------
+        row: int
+            The line of the window to draw on
+        text: str
+            The text to draw, replacing the previous one of the line
+        attr: int, optional
+            The curses attributes of the text
+        """
+        if self._fields.get(row) != text:
+            self._window.move(row, 0)
+            self._window.clrtoeol()
+            self._window.addstr(row, 0, text, attr)
+            self._fields[row] = text
+            self._changed = True
+
+    def refresh(self) -> None:
+        """Refresh the window if something has been drawn."""
+        if self._changed:
+            self._window.refresh()
+            self._changed = False
+
+    def getch(self, delay: float = None) -> int:
+        """Refresh the window and wait for a key until a given delay.
+
+        Parameters
+        ----------
+        delay: float, optional
+            The maximum duration to wait for in seconds, block until a key is
+            pressed if None
+
+        Returns
+        -------
+        int
+            The code of the pressed key, -1 if none before the delay.
+        """
+        self.refresh()
+        if delay is None:
+            self._window.timeout(-1)
+        else:
+            # curses timeouts are in milliseconds, round up to never wake up
+            # just before the tick
+            self._window.timeout(int(delay * 1000) + 1)
+
+        return self._window.getch()
+
 
 def main(stdscr) -> None:
     """ncurses main loop
@@ -70,45 +183,90 @@ def main(stdscr) -> None:
     # Block I/O calls for the base screen
     stdscr.nodelay(False)
 
+    # A resumed timer is launched at first without the start screen
+    resumed_timer = resumed
+
     mainloop = True
     while mainloop:
-        # Start or quit command
-        stdscr.clear()
-        stdscr.addstr(0, 0, "libminutaria", curses.A_STANDOUT)
-        stdscr.addstr(2, 0, "Timing : " + str(initial_timing))
-        stdscr.addstr(4, 0, "Press any key to launch or q to quit...")
-        stdscr.refresh()
-
-        start_action = stdscr.getch()
-        if start_action == ord('q'):
-            break
+        if resumed_timer is None:
+            # Start or quit command
+            stdscr.clear()
+            stdscr.addstr(0, 0, "libminutaria", curses.A_STANDOUT)
+            stdscr.addstr(2, 0, "Timing : " + initial_timing)
+            stdscr.addstr(4, 0, "Press any key to launch or q to quit...")
+            stdscr.refresh()
+
+            start_action = stdscr.getch()
+            if start_action == ord('q'):
+                break
 
         # Clean-up
         stdscr.clear()
         stdscr.refresh()
 
         # Create a windows dedicated to print timing
+        # and redraw only what changes on it
         timer_window = curses.newwin(5, 60, 0, 0)
-        # Don't block I/O calls for the timer window
-        timer_window.nodelay(True)
+        screen = TimerScreen(timer_window)
 
         # Initialize the timer and a counter
-        timer = libminutaria.Timer(hours=TIMER_HOURS,
-                                   minutes=TIMER_MIN,
-                                   seconds=TIMER_SEC)
-        counter = timer.is_timing_reached()
+        if resumed_timer is None and program is not None:
+            timer = libminutaria.TimerSequence(program["steps"],
+                                               program["repeat"],
+                                               stats, clock)
+            paused = False
+        elif resumed_timer is None:
+            timer = libminutaria.Timer(hours=TIMER_HOURS,
+                                       minutes=TIMER_MIN,
+                                       seconds=TIMER_SEC,
+                                       stats=stats,
+                                       clock=clock)
+            paused = False
+        else:
+            timer = resumed_timer["timer"]
+            paused = resumed_timer["paused"]
+            resumed_timer = None
+        scheduler = libminutaria.TickScheduler(timer)
+        # Keep the same width from the initial timing down to 00:00:00
+        formatter = libminutaria.TimingFormatter.for_timing(
+            timer.get_timing_ns)
+        counter = False if paused else timer.is_timing_reached()
+        sequence = isinstance(timer, libminutaria.TimerSequence)
+        step = None
+
+        # Save the timer to resume it if the process dies, if asked
+        if checkpoint is not None:
+            checkpoint.save(timer, label, paused)
+        choice = None
 
         # Launch the timer and print the remaining time
+        screen.chrome(RUNNING_HELP)
         timer_loop = True
         while timer_loop:
             while counter is False:
-                timer_window.addstr(0, 0, "libminutaria", curses.A_STANDOUT)
-                timer_window.addstr(2, 0, "Remaining: " + timer.get_timing[:9])
-                timer_window.addstr(4, 0, "Press r to relaunch, p to pause or "
-                                    "q to quit...")
-                counter = timer.is_timing_reached()
+                if sequence and timer.step != step:
+                    # Beep at the end of each step but the last one
+                    if step is not None:
+                        curses.beep()
+                    step = timer.step
+                    formatter = libminutaria.TimingFormatter.for_timing(
+                        timer.get_step_ns)
+                    screen.field(3, f"Step: {timer.step_label or '-'} "
+                                    f"({step + 1}/{timer.step_count})")
+                screen.field(2, "Remaining: "
+                             + formatter.format(timer.get_timing_ns))
+                if paused:
+                    # A resumed paused timer starts paused
+                    choice = ord('p')
+                    paused = False
+                else:
+                    # Wait for the user's choice until the next tick instead
+                    # of spinning
+                    choice = screen.getch(scheduler.next_tick())
+                    counter = scheduler.check()
+                    if checkpoint is not None:
+                        checkpoint.flush()
                 # Manage user's choice for the timer loop
-                choice = timer_window.getch()
                 if choice == ord('q'):
                     mainloop = False
                     timer_loop = False
@@ -123,15 +281,20 @@ def main(stdscr) -> None:
                     # So create print the actual remaining time at p pressed
                     # and wait for user instructions
                     pause = True
-                    timer_window.addstr(0, 0,
-                                        "libminutaria", curses.A_STANDOUT)
-                    timer_window.addstr(2, 0,
-                                        "Remaining: " + timer.get_timing[:9])
-                    # And ask the user what to do
+                    screen.field(2, "Remaining: "
+                                 + formatter.format(timer.get_timing_ns))
+                    screen.field(4, PAUSED_HELP)
+                    if checkpoint is not None:
+                        checkpoint.save(timer, label, paused=True)
+                    # And ask the user what to do, blocking until a key is
+                    # pressed since the timer is not running, or until the
+                    # checkpoint can be written
                     while pause:
-                        timer_window.addstr(4, 0, "Press r to relaunch, p to "
-                                            "continue or q to quit...")
-                        choice = timer_window.getch()
+                        if checkpoint is None:
+                            choice = screen.getch()
+                        else:
+                            choice = screen.getch(checkpoint.next_write())
+                            checkpoint.flush()
                         if choice == ord('q'):
                             mainloop = False
                             break
@@ -141,8 +304,9 @@ def main(stdscr) -> None:
                             # Set the initial timer and counter
                             # according to the remaining time at p press
                             timer.continue_after_pause()
-                            timer_window.clear()
-                            timer_window.refresh()
+                            if checkpoint is not None:
+                                checkpoint.save(timer, label)
+                            screen.field(4, RUNNING_HELP)
                             break
 
                     if choice == ord('q'):
@@ -152,6 +316,10 @@ def main(stdscr) -> None:
                         pause = False
                         break
 
+            # The timer ended or was left by the user
+            if checkpoint is not None:
+                checkpoint.clear()
+
             if choice == ord('q'):
                 timer_loop = False
                 break
@@ -160,25 +328,19 @@ def main(stdscr) -> None:
                 continue
 
             # Annouce timer's ending by a "Gong !" and a flash, 3 times
-            timer_window.clear()
-            timer_window.refresh()
-            timer_window.addstr(0, 0, "libminutaria", curses.A_STANDOUT)
-            timer_window.refresh()
+            screen.chrome()
             for space in range(1, 4):
-                timer_window.addstr(2, 0, "GONG ! " * space)
-                timer_window.refresh()
+                screen.field(2, "GONG ! " * space)
+                screen.refresh()
                 curses.flash()
                 curses.napms(FLASH_PERIOD)
 
             # Give the user the choice to relaunch the timer or quit
-            timer_window.clear()
+            screen.chrome()
+            screen.field(2, "Press r to relaunch or q to quit...")
             endloop = True
             while endloop:
-                timer_window.addstr(0, 0, "libminutaria", curses.A_STANDOUT)
-                timer_window.addstr(2, 0,
-                                    "Press r to relaunch or q to quit...")
-                timer_window.refresh()
-                user_input = timer_window.getch()
+                user_input = screen.getch()
                 if user_input == ord('r'):
                     timer_loop = False
                     break
@@ -191,20 +353,18 @@ def main(stdscr) -> None:
 if __name__ == '__main__':
     # Default parameters to be use if the script is launched without argument
     # or modified by user input
-    TIMER_HOURS = 0  # min 0, max 23
+    TIMER_HOURS = 0  # min 0, max 168
     TIMER_MIN = 0    # min 0, max 59
-    TIMER_SEC = 5    # min 0, max 59
+    TIMER_SEC = 5    # min 0, max 59.999
 
     # Printable default script duration
-    default_duration = timedelta(hours=+TIMER_HOURS,
-                                 minutes=+TIMER_MIN,
-                                 seconds=+TIMER_SEC)
-    DEFAULT = str(default_duration)
+    DEFAULT = f"{TIMER_HOURS}:{TIMER_MIN:02}:{TIMER_SEC:02}"
 
 
     # Launch CLI and get timer values if user input
     args = libminutaria.get_cli_args(DEFAULT)
     timer_values, debug_option = libminutaria.handle_cli_args(args)
+    program = libminutaria.handle_sequence_args(args)
 
     # Initiate logger
     logger = libminutaria.logger(debug_option)
@@ -230,10 +390,50 @@ if __name__ == '__main__':
         TIMER_MIN = timer_values["timer_min"]
         TIMER_SEC = timer_values["timer_secs"]
 
-    # Keep a timestamp of the final initial timing choosen after CLI use
-    initial_timing = timedelta(hours=TIMER_HOURS,
-                               minutes=TIMER_MIN,
-                               seconds=TIMER_SEC)
+    # Instrument the timers if stats are asked or logged
+    stats = libminutaria.TimerStats() if args.stats or debug_option else None
+
+    # The clock of the timers and their ticks
+    clock = libminutaria.MonotonicClock()
+
+    # Save the running timer to resume it if the process dies, if asked
+    checkpoint = None
+    if args.checkpoint is not None:
+        checkpoint = libminutaria.TimerCheckpoint(args.checkpoint, clock)
+    label = args.use_preset or args.use_sequence or ''
+    resumed = None
+
+    if args.resume:
+        if checkpoint is None:
+            print("minutaria: Error: argument --resume: requires "
+                  "--checkpoint FILE")
+            exit()
+        # Resume the saved timer
+        try:
+            resumed = checkpoint.load(stats)
+        except ValueError:
+            pass
+        if resumed is None:
+            print(f"minutaria: Error: argument --resume: no timer to resume "
+                  f"in {args.checkpoint}")
+            exit()
+        label = resumed["label"]
+
+    # Keep a printable initial timing choosen after CLI use, formatted as
+    # the countdown
+    initial_ns = libminutaria.Timer(hours=TIMER_HOURS,
+                                    minutes=TIMER_MIN,
+                                    seconds=TIMER_SEC).get_timing_ns
+    initial_timing = libminutaria.TimingFormatter.for_timing(
+        initial_ns).format(initial_ns)
+    if program is not None:
+        initial_timing = (f"{len(program['steps'])} step(s) repeated "
+                          f"{program['repeat']} time(s)")
 
     # Launch the curses main loop in a ncurses wrapper to manage cleaning
     curses.wrapper(main)
+
+    if stats is not None:
+        stats.log(logger)
+        if args.stats:
+            print(stats.summary())
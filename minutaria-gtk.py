@@ -34,15 +34,18 @@ PresetGrid
     A container to all the preset management elements.
 """
 
+import argparse
 import logging
 logging.basicConfig(level=logging.DEBUG)
 from datetime import timedelta
-from libminutaria import Timer, Preset, logger
+from libminutaria import (MonotonicClock, Timer, TimerSequence,
+                          TimingFormatter, TimerStats, TickScheduler,
+                          TimerCheckpoint, Preset, logger)
 from just_playback import Playback
 import gi
 gi.require_version("Gtk", "3.0")
 gi.require_version("Notify", "0.7")
-from gi.repository import Gtk, Notify, GdkPixbuf
+from gi.repository import Gtk, GLib, Notify, GdkPixbuf
 
 
 class MainWindow(Gtk.ApplicationWindow):
@@ -55,11 +58,17 @@ class MainWindow(Gtk.ApplicationWindow):
         A container to the TimerBox and PresetGrid containers
     """
 
-    def __init__(self):
+    def __init__(self, checkpoint_file=None):
         """Initialize a Gtk.ApplicationWindow.
 
         Initialize and add an AppBox instance, set the application icon, title,
         if the windows is resizable and initialize the notification system.
+
+        Parameters
+        ----------
+        checkpoint_file: str, optional
+            The checkpoint file of the running timer, default to no
+            checkpoint.
         """
 
         Gtk.ApplicationWindow.__init__(self, title="minutaria", resizable=False)
@@ -69,7 +78,7 @@ class MainWindow(Gtk.ApplicationWindow):
 
         self.set_icon_from_file("assets/porcmouth.png")
 
-        self.app_box = AppBox()
+        self.app_box = AppBox(checkpoint_file)
         self.add(self.app_box)
 
 
@@ -110,9 +119,15 @@ class AppBox(Gtk.Box):
         An instance of a PresetGrid with access to the TimerBox instance.
     """
 
-    def __init__(self):
+    def __init__(self, checkpoint_file=None):
         """Initialize a Gtk.Box with an instance of TimerBox and an instance
         of PresetGrid, giving to the last access to the first.
+
+        Parameters
+        ----------
+        checkpoint_file: str, optional
+            The checkpoint file of the running timer, default to no
+            checkpoint.
         """
 
         Gtk.Box.__init__(self,
@@ -125,7 +140,7 @@ class AppBox(Gtk.Box):
                          margin_top=7,
                          margin_bottom=7)
 
-        self.timer_box = TimerBox()
+        self.timer_box = TimerBox(checkpoint_file=checkpoint_file)
         self.pack_start(self.timer_box, False, True, 0)
 
         self.preset_grid = PresetGrid(self.timer_box)
@@ -141,10 +156,33 @@ class TimerBox(Gtk.Box):
     state: int
         The state of the timer.
         0: stopped, 1: running, 2: paused
+    clock: libminutaria.MonotonicClock
+        The clock of the timers, their ticks and the checkpoint.
     timer: libminutaria.Timer
-        An instance of libminutaria's Timer.
+        An instance of libminutaria's Timer, a TimerSequence for a sequence.
+    sequence: dict
+        The steps and repetitions of the selected sequence preset, None if
+        no sequence preset is selected.
+    step: int
+        The step of the running sequence currently displayed, None if none.
+    scheduler: libminutaria.TickScheduler
+        The tick scheduler of the current timer.
+    formatter: libminutaria.TimingFormatter
+        The formatter of the remaining time displayed.
+    stats: libminutaria.TimerStats
+        The instrumentation of the timers, logged at the end of each timer.
+    checkpoint: libminutaria.TimerCheckpoint
+        The checkpoint of the current timer, to resume it at the next launch,
+        None if no checkpoint file is given.
+    checkpoint_source: int
+        The id of the GLib timeout of the pending checkpoint write, None if
+        none.
+    tick_source: int
+        The id of the GLib timeout of the next tick, None if not running.
     counter: bool
         The bool counter used to determine if the timer's duration is reached.
+    displayed: str
+        The text currently displayed by the timing label.
     alarm: just_playback.Playback
         The Playback instance to play an alarm sound at the end of a timer.
     alarm_sound: str
@@ -173,18 +211,54 @@ class TimerBox(Gtk.Box):
         Handle reset/stop the timer and timer events like alarm.
     start_selected_timer
         Handle start/pause/restart a choosen timer and its state.
+    display
+        Display a text on the timing label if not already displayed.
+    resume_timer
+        Resume a timer saved in the checkpoint file by a previous launch.
+    save_checkpoint
+        Save the current timer in the checkpoint file.
+    flush_checkpoint
+        Write the checkpoint kept pending by its rate limit.
+    schedule_tick
+        Schedule the next tick at the next display boundary of the timer.
+    stop_ticks
+        Cancel the next scheduled tick if any.
+    tick
+        Display the remaining time or handle the end of the timer.
     zero_timing_dialog
         Display a message dialog corresponding to an empty timing selection.
     """
 
-    def __init__(self):
-        """Initialize a Gtk.Box with the timer elements."""
+    def __init__(self, clock=None, checkpoint_file=None):
+        """Initialize a Gtk.Box with the timer elements.
+
+        Parameters
+        ----------
+        clock: libminutaria.MonotonicClock, optional
+            The clock of the timers, default to the monotonic clock of the
+            system.
+        checkpoint_file: str, optional
+            The file to save the running timer in and to resume it from at
+            launch, default to no checkpoint.
+        """
 
         Gtk.Box.__init__(self, orientation=Gtk.Orientation.VERTICAL, spacing=6)
 
         self.state = 0  # 0: stopped, 1: running, 2: paused
-        self.timer = Timer(hours=0, minutes=0, seconds=0)
+        self.clock = MonotonicClock() if clock is None else clock
+        self.timer = Timer(hours=0, minutes=0, seconds=0, clock=self.clock)
+        self.sequence = None
+        self.step = None
+        self.scheduler = TickScheduler(self.timer)
+        self.formatter = TimingFormatter()
+        self.stats = TimerStats()
+        self.checkpoint = None
+        if checkpoint_file is not None:
+            self.checkpoint = TimerCheckpoint(checkpoint_file, self.clock)
+        self.checkpoint_source = None
+        self.tick_source = None
         self.counter = False
+        self.displayed = None
         self.alarm = Playback()
         self.alarm.set_volume(0.8)
         self.alarm_sound = "assets/gowlermusic__gong-hit.ogg"
@@ -203,9 +277,7 @@ class TimerBox(Gtk.Box):
         self.pack_start(self.timing_separator, False, True, 0)
 
         self.timing_print = Gtk.Label()
-        self.timing_print.set_markup(f"<span background='black' "
-                                     f"foreground='white' size='60000' >"
-                                     f"0:00:00</span>")
+        self.display(self.timing_print, "0:00:00")
         self.pack_start(self.timing_print, False, True, 10)
 
         self.start_pause_button = Gtk.Button(label="Start / Pause")
@@ -225,6 +297,15 @@ class TimerBox(Gtk.Box):
         self.end_timer_separator = SeparatorBox()
         self.pack_start(self.end_timer_separator, False, True, 0)
 
+        # Resume the timer of a previous launch if any
+        if self.checkpoint is not None:
+            try:
+                resumed = self.checkpoint.load(self.stats)
+            except ValueError:
+                resumed = None
+            if resumed is not None:
+                self.resume_timer(resumed)
+
     def zero_timing_dialog(self) -> None:
         """Display a message dialog corresponding to an empty timing selection.
 
@@ -249,6 +330,144 @@ class TimerBox(Gtk.Box):
             or response == Gtk.ResponseType.DELETE_EVENT):
             no_duration.destroy()
 
+    def display(self, label, text) -> None:
+        """Display a text on the timing label if not already displayed.
+
+        Rebuilding the markup is skipped while the text is unchanged.
+        """
+
+        if text != self.displayed:
+            label.set_markup(f"<span background='black' "
+                             f"foreground='white' size='60000' >"
+                             f"{text}</span>")
+            self.displayed = text
+
+    def resume_timer(self, resumed) -> None:
+        """Resume a timer saved in the checkpoint file by a previous launch.
+
+        Parameters
+        ----------
+        resumed: dict
+            The timer loaded from the checkpoint file and whether it is
+            paused.
+        """
+
+        self.timer = resumed["timer"]
+        self.scheduler = TickScheduler(self.timer)
+        self.formatter = TimingFormatter.for_timing(self.timer.get_timing_ns)
+        self.step = None
+        if resumed["paused"]:
+            self.state = 2
+            self.display(self.timing_print,
+                         self.formatter.format(self.timer.get_timing_ns))
+        else:
+            self.state = 1
+            self.tick(self.timing_print)
+
+    def save_checkpoint(self, paused=False) -> None:
+        """Save the current timer in the checkpoint file.
+
+        If the write is kept pending by the rate limit of the checkpoint,
+        schedule it from the GLib main loop. Nothing is saved without a
+        checkpoint file.
+        """
+
+        if self.checkpoint is None:
+            return
+        if (not self.checkpoint.save(self.timer, paused=paused)
+                and self.checkpoint_source is None):
+            delay = int(self.checkpoint.next_write() * 1000) + 1
+            self.checkpoint_source = GLib.timeout_add(delay,
+                                                      self.flush_checkpoint)
+
+    def flush_checkpoint(self) -> bool:
+        """Write the checkpoint kept pending by its rate limit.
+
+        Returns
+        -------
+        bool
+            GLib.SOURCE_REMOVE as the write is scheduled on its own.
+        """
+
+        self.checkpoint_source = None
+        self.checkpoint.flush(force=True)
+        return GLib.SOURCE_REMOVE
+
+    def schedule_tick(self) -> None:
+        """Schedule the next tick at the next display boundary of the timer.
+
+        The tick is added to the GLib main loop as a one-shot timeout, so
+        nothing runs between two changes of the displayed remaining time.
+        """
+
+        # GLib timeouts are in milliseconds, round up to never tick
+        # just before the boundary
+        delay = int(self.scheduler.next_tick() * 1000) + 1
+        self.tick_source = GLib.timeout_add(delay, self.tick,
+                                            self.timing_print)
+
+    def stop_ticks(self) -> None:
+        """Cancel the next scheduled tick if any."""
+
+        if self.tick_source is not None:
+            GLib.source_remove(self.tick_source)
+            self.tick_source = None
+
+    def tick(self, label) -> bool:
+        """Display the remaining time or handle the end of the timer.
+
+        Called by the GLib main loop at each display boundary. Once the timer
+        reached 00:00:00, print "GONG", display a notification, play the
+        alarm sound and set the state to "stopped", else schedule the next
+        tick.
+
+        Returns
+        -------
+        bool
+            GLib.SOURCE_REMOVE as each tick is scheduled on its own.
+        """
+
+        self.tick_source = None
+        self.counter = self.scheduler.check()
+        if self.counter:
+            # Timer reached 00:00:00 so print "GONG"
+            self.display(label, "GONG")
+
+            # Display a notification
+            notification = Notify.Notification.new("minutaria",
+                                                   "Time up")
+            notification.show()
+
+            # Set state to "stopped" since the timer ended
+            self.state = 0
+            if self.checkpoint is not None:
+                self.checkpoint.clear()
+
+            # Play an alarm sound
+            self.alarm.load_file(self.alarm_sound)
+            self.alarm.play()
+
+            self.stats.log(logging.getLogger(__name__))
+        else:
+            if (isinstance(self.timer, TimerSequence)
+                    and self.timer.step != self.step):
+                # Notify the end of each step but the last one
+                if self.step is not None:
+                    notification = Notify.Notification.new(
+                        "minutaria",
+                        f"Step {self.step + 1}/{self.timer.step_count} done")
+                    notification.show()
+                    self.alarm.load_file(self.alarm_sound)
+                    self.alarm.play()
+                self.step = self.timer.step
+                self.formatter = TimingFormatter.for_timing(
+                    self.timer.get_step_ns)
+            self.display(label,
+                         self.formatter.format(self.timer.get_timing_ns))
+            self.schedule_tick()
+
+        return GLib.SOURCE_REMOVE
+
     def start_selected_timer(self, button, label, timing_box) -> None:
         """Handle start/pause/restart a choosen timer and its state.
 
@@ -260,10 +479,8 @@ class TimerBox(Gtk.Box):
            according to the user selection
          - if "running", set it to "paused"
          - if "paused", set it to "running" and actualize the existing timer.
-        Finally manage the timer to run it until 00:00:00, print "GONG",
-        display a notification and play a corresponding alarm sound.
-        Checking state in the process, break if "paused".
-        At the end, set the state to "stopped".
+        Finally tick the running timer from the GLib main loop until
+        00:00:00, see tick.
         """
 
         # Get the selected timing
@@ -277,55 +494,49 @@ class TimerBox(Gtk.Box):
 
             # Actualize the state
             self.state = 0
+            self.stop_ticks()
+            if self.checkpoint is not None:
+                self.checkpoint.clear()
         else:
             # Handle state
             if self.state == 0:
                 # If state was "stopped", then change it to "running"
                 self.state = 1
 
-                # Initialize the timer according to the user selection
-                self.timer = Timer(hours=selection["timer_hours"],
-                                   minutes=selection["timer_min"],
-                                   seconds=selection["timer_secs"])
+                # Initialize the timer according to the user selection,
+                # the selected sequence preset if any
+                if self.sequence is not None:
+                    self.timer = TimerSequence(self.sequence["steps"],
+                                               self.sequence["repeat"],
+                                               self.stats, self.clock)
+                else:
+                    self.timer = Timer(hours=selection["timer_hours"],
+                                       minutes=selection["timer_min"],
+                                       seconds=selection["timer_secs"],
+                                       stats=self.stats, clock=self.clock)
+                self.step = None
+                self.scheduler = TickScheduler(self.timer)
+                self.formatter = TimingFormatter.for_timing(
+                    self.timer.get_timing_ns)
+                self.save_checkpoint()
             elif self.state == 1:
                 # If the timer was running, change the state to "paused"
                 self.state = 2
+                self.stop_ticks()
+
+                # Actualize the remaining time at the pause
+                self.counter = self.scheduler.check()
+                self.save_checkpoint(paused=True)
+                return
             elif self.state == 2:
                 # The timer was "paused" and now relauched
                 # So change the state to "started" and handle the pause effect
                 self.state = 1
                 self.timer.continue_after_pause()
+                self.save_checkpoint()
 
             # Check remaining time along the timer and print it
-            self.counter = self.timer.is_timing_reached()
-            while self.counter is False:
-                label.set_markup(f"<span background='black' "
-                                 f"foreground='white' size='60000' >"
-                                 f"{self.timer.get_timing[:9]}</span>")
-                while Gtk.events_pending():
-                    Gtk.main_iteration()
-                self.counter = self.timer.is_timing_reached()
-                # Handle a pause state
-                if self.state != 1:
-                    break
-
-            if self.counter:
-                # Timer reached 00:00:00 so print "GONG"
-                label.set_markup(f"<span background='black' "
-                                 f"foreground='white' size='60000' >"
-                                 f"GONG</span>")
-
-                # Display a notification
-                notification = Notify.Notification.new("minutaria",
-                                                       "Time up")
-                notification.show()
-
-                # Set state to "stopped" since the timer ended
-                self.state = 0
-
-                # Play an alarm sound
-                self.alarm.load_file(self.alarm_sound)
-                self.alarm.play()
+            self.tick(label)
 
     def reset_stop_timer(self, button, label, timing_box) -> None:
         """Handle reset/stop the timer and timer events.
@@ -336,18 +547,20 @@ class TimerBox(Gtk.Box):
         """
 
         self.state = 0
+        self.stop_ticks()
+        if self.checkpoint is not None:
+            self.checkpoint.clear()
         selection = timing_box.get_entry()
 
         # Stop playing alarm sound
         self.alarm.stop()
 
-        # Printable default duration
-        printable_selection = timedelta(hours=+selection["timer_hours"],
-                                     minutes=+selection["timer_min"],
-                                     seconds=+selection["timer_secs"])
-        label.set_markup(f"<span background='black' "
-                         f"foreground='white' size='60000' >"
-                         f"{str(printable_selection)}</span>")
+        # Printable default duration, as displayed by the countdown
+        selected_timing = Timer(hours=selection["timer_hours"],
+                                minutes=selection["timer_min"],
+                                seconds=selection["timer_secs"]).get_timing_ns
+        self.formatter = TimingFormatter.for_timing(selected_timing)
+        self.display(label, self.formatter.format(selected_timing))
 
 
 class IntroBox(Gtk.Box):
@@ -515,7 +728,7 @@ class TimingBox(Gtk.Box):
         self.hour_label = Gtk.Label(label="Hours")
         adjustment_hours = Gtk.Adjustment(value=0,
                                           lower=0,
-                                          upper=23,
+                                          upper=168,
                                           step_increment=1,
                                           page_increment=10,
                                           page_size=0)
@@ -738,13 +951,22 @@ class PresetGrid(Gtk.Grid):
         if ((name == "Choose a preset")
             or (name == "No preset created yet")
             or name == None):
+            timer_box.sequence = None
             return
 
         # Create the preset model to access to the get method
         selected_preset = Preset(name)
 
-        # Get the duration of the preset
-        duration = selected_preset.get()
+        # Get the duration of the preset, or the first step of a sequence
+        # preset to be run at the next start
+        try:
+            duration = selected_preset.get()
+            timer_box.sequence = None
+        except ValueError:
+            timer_box.sequence = Preset.get_sequence(name)
+            _, hours, minutes, seconds = timer_box.sequence["steps"][0]
+            duration = {"hours": hours, "minutes": minutes,
+                        "seconds": seconds}
 
         # Set the spinbuttons according to the duration
         timer_box.timing_box.hours_spin.set_value(duration["hours"])
@@ -1046,7 +1268,16 @@ class PresetGrid(Gtk.Grid):
 
 
 if __name__ == '__main__':
-    main_window = MainWindow()
+    parser = argparse.ArgumentParser(prog="minutaria-gtk",
+                                     description="GTK interface of "
+                                                 "minutaria.")
+    parser.add_argument("--checkpoint",
+                        metavar="FILE",
+                        help="save the running timer in FILE to resume it "
+                             "at the next launch (default: no checkpoint)")
+    args = parser.parse_args()
+
+    main_window = MainWindow(args.checkpoint)
     main_window.connect("destroy", Gtk.main_quit)
     main_window.show_all()
     Gtk.main()
@@ -4,8 +4,32 @@
 
 __version__ = "1.0"
 
+from .libminutaria import MonotonicClock
+from .libminutaria import FakeClock
 from .libminutaria import Timer
+from .libminutaria import TimerSequence
+from .libminutaria import ThreadSafeTimer
+from .libminutaria import TimerSnapshot
+from .libminutaria import TimingFormatter
+from .libminutaria import Histogram
+from .libminutaria import TimerStats
+from .libminutaria import TickScheduler
+from .libminutaria import TimerPool
+from .libminutaria import TimerArray
+from .libminutaria import AsyncTimer
+from .libminutaria import TimerDaemon
+from .libminutaria import TimerCheckpoint
+from .libminutaria import PresetRecord
+from .libminutaria import PresetStore
+from .libminutaria import PresetJournal
+from .libminutaria import SQLitePresetStore
 from .libminutaria import Preset
+from .libminutaria import import_presets
+from .libminutaria import export_presets
+from .libminutaria import migrate_presets
+from .libminutaria import send_daemon_command
+from .libminutaria import parse_duration
 from .libminutaria import logger
 from .libminutaria import get_cli_args
 from .libminutaria import handle_cli_args
+from .libminutaria import handle_sequence_args
@@ -19,143 +19,3404 @@ This file can also be imported as a module.
 
 Classes
 -------
+MonotonicClock
+    The monotonic clock of the system, default clock of the timers.
+FakeClock
+    A manual clock to test timers of any duration instantly.
 Timer
     Launch a given timer and provide utilies to manage it.
+TimerSequence
+    Run a program of timers one after the other from deadlines computed
+    upfront, like work/rest intervals repeated N times.
+ThreadSafeTimer
+    Share a timer between threads, read from immutable snapshots of its
+    state.
+TimerSnapshot
+    The remaining time and pause state of a ThreadSafeTimer at a point of
+    time.
+TimingFormatter
+    Format remaining times as H:MM:SS with a configurable precision, reusing
+    the previous string while the visible value doesn't change.
+Histogram
+    Count durations in constant memory to get their percentiles.
+TimerStats
+    Record the tick lateness, expiry overshoot and poll count of timers.
+TickScheduler
+    Sleep until the next display boundary of a given timer instead of
+    polling it.
+TimerPool
+    Hold many concurrent timers ordered by deadline and wait for the earliest.
+TimerArray
+    Hold thousands of timers in integer columns, vectorized with NumPy.
+AsyncTimer
+    Await a timer or iterate over its ticks inside an asyncio event loop.
+TimerDaemon
+    Serve many timers in a single process over a Unix domain socket.
+TimerCheckpoint
+    Keep the state of a timer on disk to resume it after a restart.
+PresetRecord
+    The name and duration of a timer preset held in memory by a PresetStore.
+PresetStore
+    Load a JSON preset file once in memory, indexed by preset name, and write
+    changes back to it.
+PresetJournal
+    Store presets in an append-only journal compacted from time to time.
+SQLitePresetStore
+    Store presets in a SQLite database indexed by preset name.
 Preset
     Initiate a virtual preset to perform operations on it : add tp a JSON
     file, get, delete, rename, change duration.
 
 Functions
 ---------
+import_presets
+    Import presets from a JSON or CSV stream.
+export_presets
+    Export all existing presets to a JSON or CSV stream.
+migrate_presets
+    Copy all the presets of a preset file to an other, whatever the backends.
+send_daemon_command
+    Send a command to a timer daemon and get its response.
+parse_duration
+    Parse a duration like 1h30m, 90s, 00:01:30.5 or PT1M30S.
+handle_sequence_args
+    Manage the timer sequence arguments of the CLI.
 minutaria_cli
     Manage the CLI interface and correctness of user inputs.
 logger
     Return a console logger.
 """
 
+from __future__ import annotations
+
 __all__ = ["__version__",
+           "MonotonicClock",
+           "FakeClock",
            "Timer",
+           "TimerSequence",
+           "ThreadSafeTimer",
+           "TimerSnapshot",
+           "TimingFormatter",
+           "Histogram",
+           "TimerStats",
+           "TickScheduler",
+           "TimerPool",
+           "TimerArray",
+           "AsyncTimer",
+           "TimerDaemon",
+           "TimerCheckpoint",
+           "PresetRecord",
+           "PresetStore",
+           "PresetJournal",
+           "SQLitePresetStore",
            "Preset",
+           "import_presets",
+           "export_presets",
+           "migrate_presets",
+           "send_daemon_command",
+           "parse_duration",
            "logger",
            "get_cli_args",
-           "handle_cli_args"
+           "handle_cli_args",
+           "handle_sequence_args"
            ]
 
-import logging
-from datetime import datetime, timedelta
-import argparse
-import json
+import os
+import sys
+import time
+import array
+import heapq
+import itertools
+import functools
+import contextlib
+import collections
+
+try:
+    import fcntl
+except ImportError:
+    # Advisory file locking is not available on non Posix systems
+    fcntl = None
+
+# The other modules (json, csv, sqlite3, asyncio, socket, datetime, logging,
+# argparse, numpy) are only imported when needed to keep the import of the
+# library fast for the scripts launching a simple timer.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import argparse
+    import logging
+
+
+# Nanoseconds in a second, the unit of all the timers' arithmetic
+NS_PER_SECOND = 1_000_000_000
+NS_PER_MILLISECOND = NS_PER_SECOND // 1000
+
+# Longest timer accepted by the CLI, a week
+MAX_TIMER_MILLISECONDS = 7 * 24 * 3600 * 1000
+
+
+class MonotonicClock:
+    """
+    The monotonic clock of the system
+
+    The default clock of the timers, tick schedulers and timer pools, which
+    read the current time and sleep through a clock so that an other one,
+    like a FakeClock, can be given to them instead. A clock only has to
+    provide the two methods below.
+
+    Public methods
+    --------------
+    now
+        Get the current point of time in nanoseconds.
+    sleep
+        Suspend the calling thread for a given duration in seconds.
+    """
+
+    # The functions of the time module themselves, not to add any call to
+    # the polling of the timers
+    now = staticmethod(time.monotonic_ns)
+    sleep = staticmethod(time.sleep)
+
+
+class FakeClock:
+    """
+    A manual clock, only moving forward when told to
+
+    Allow to test timers of any duration instantly and deterministically:
+    the time only passes when advanced, sleeping on the clock advancing it
+    by the duration instead of suspending the calling thread.
+
+    Attributes
+    ----------
+    _now: int
+        The current point of time in nanoseconds
+
+    Public methods
+    --------------
+    now
+        Get the current point of time in nanoseconds.
+    advance
+        Move the clock forward by a given duration.
+    sleep
+        Move the clock forward by a given duration, as if slept.
+    """
+
+    def __init__(self, start: int = 0):
+        """Initialize a clock stopped at a given point of time.
+
+        Parameters
+        ----------
+        start: int
+            The initial point of time in nanoseconds, default to 0
+        """
+        self._now = start
+
+    def now(self) -> int:
+        """Get the current point of time in nanoseconds."""
+        return self._now
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward by a given duration.
+
+        Parameters
+        ----------
+        seconds: float
+            The duration in seconds, e.g. 3600 for an hour
+
+        Raises
+        ------
+        ValueError
+            If the duration is negative.
+        """
+        if seconds < 0:
+            raise ValueError("ValueError: a clock can't go backward")
+
+        self._now += round(seconds * NS_PER_SECOND)
+
+    def sleep(self, seconds: float) -> None:
+        """Move the clock forward by a given duration, as if slept."""
+        self.advance(seconds)
+
+
+# The clock used when none is given
+_monotonic_clock = MonotonicClock()
+
+
+class Timer:
+    """
+    Simple timer printing as HH:MM:SS.n
+
+    Allow to launch a given timer, check remaining time before 00:00:00, check
+    wether timing is reached and get the current timing along the process.
+
+    The timer relies on the monotonic clock so that system clock changes (NTP
+    steps, DST changes...) can't make the countdown jump, and keeps all its
+    points of time as integer nanoseconds so that polling it doesn't allocate
+    any datetime or timedelta object. Its attributes are fixed by __slots__,
+    as the ones of its subclasses, so that a timer has no instance dict.
+
+    Attributes
+    ----------
+    _delta: int
+        The timer duration in nanoseconds
+    _deadline: int
+        The monotonic point of time to reach 00:00:00, in nanoseconds
+    _actualized_delta: int
+        The actualized duration in nanoseconds according to time passed to be
+        updated along the timer
+    _stats: TimerStats
+        The instrumentation recording each check of the timer, None if not
+        instrumented
+    _clock: MonotonicClock
+        The clock giving the current time
+    get_timing: str
+        The actual remaining time to reach 00:00:00 for a launched timer.
+    get_timing_ns: int
+        The actual remaining time to reach 00:00:00 in nanoseconds.
+
+    Public methods
+    --------------
+    remaining
+        Compute the remaining time at a point of time, without side effect.
+    is_timing_reached
+        Check if timing reached 00:00:00.
+    record_tick
+        Record the lateness of a tick in the instrumentation of the timer.
+    continue_after_pause
+        Actualize timer parameters to continue timing after a pause.
+    """
+
+    __slots__ = ("_delta", "_deadline", "_actualized_delta", "_stats",
+                 "_clock")
+
+    def __init__(self, hours: int = 0, minutes: int = 0, seconds: float = 0,
+                 stats: TimerStats = None, clock: MonotonicClock = None):
+        """Create and launch a given timer.
+
+        The quantities aren't limited to a clock face (e.g. 36 hours or 90
+        seconds) and may be fractional, the duration being rounded to the
+        nanosecond.
+
+        Parameters
+        ----------
+        hours: int
+            The hours quantity of the timer
+        minutes: int
+            The minutes quantity of the timer
+        seconds: float
+            The seconds quantity of the timer, e.g. 0.25 for 250 ms
+        stats: TimerStats, optional
+            The instrumentation to record the checks of the timer in
+        clock: MonotonicClock, optional
+            The clock giving the current time, default to the monotonic
+            clock of the system
+        """
+        self._clock = _monotonic_clock if clock is None else clock
+        self._delta = round(((hours * 60 + minutes) * 60 + seconds)
+                            * NS_PER_SECOND)
+        self._deadline = self._clock.now() + self._delta
+        self._actualized_delta = self._delta
+        self._stats = stats
+
+    def is_timing_reached(self, now: int = None) -> bool:
+        """Check if timing reached 00:00:00.
+
+        Actualize the remaining duration according to the current time.
+
+        Parameters
+        ----------
+        now: int, optional
+            The monotonic point of time in nanoseconds to check the timer
+            at, default to the current time
+
+        Returns
+        -------
+        bool
+            True if timing reached 00:00:00, else False.
+        """
+        self._actualized_delta = self.remaining(now)
+        if self._stats is not None:
+            self._stats.record_poll(self._actualized_delta)
+        return self._actualized_delta <= 0
+
+    def record_tick(self, lateness: int) -> None:
+        """Record the lateness of a tick in the instrumentation of the timer.
+
+        Nothing is recorded if the timer isn't instrumented.
+
+        Parameters
+        ----------
+        lateness: int
+            The lateness of the tick after its boundary in nanoseconds
+        """
+        if self._stats is not None:
+            self._stats.record_tick(lateness)
+
+    def remaining(self, now: int = None) -> int:
+        """Compute the remaining time at a point of time, without side effect.
+
+        Unlike get_timing_ns, the remaining time is computed from the
+        deadline on demand so that it is never stale, and nothing is stored
+        so that a batch of timers can be evaluated against a single shared
+        point of time. The timer shall be running, the remaining time of a
+        paused timer being the one of its last check.
+
+        Parameters
+        ----------
+        now: int, optional
+            The monotonic point of time in nanoseconds to compute the
+            remaining time at, default to the current time
+
+        Returns
+        -------
+        int
+            The remaining time to reach 00:00:00 in nanoseconds, negative
+            once exceeded.
+        """
+        if now is None:
+            now = self._clock.now()
+        return self._deadline - now
+
+    @property
+    def get_timing(self) -> str:
+        """The actual remaining time to reach 00:00:00.
+
+        Returns
+        -------
+        str
+            The actual remaining time to reach 00:00:00.
+        """
+        from datetime import timedelta
+
+        return str(timedelta(microseconds=self._actualized_delta // 1000))
+
+    @property
+    def get_timing_ns(self) -> int:
+        """The actual remaining time to reach 00:00:00 in nanoseconds.
+
+        To be displayed with a TimingFormatter, the value is negative once the
+        timing is exceeded.
+
+        Returns
+        -------
+        int
+            The actual remaining time to reach 00:00:00 in nanoseconds.
+        """
+        return self._actualized_delta
+
+    def continue_after_pause(self) -> None:
+        """Actualize timer parameters to continue timing after a pause.
+
+        Set a new deadline from the current time and the remaining duration
+        when the timer was last checked.
+        """
+        self._delta = self._actualized_delta
+        self._deadline = self._clock.now() + self._delta
+
+
+class TimerSequence(Timer):
+    """
+    A program of timers run one after the other, like work/rest intervals
+
+    The deadlines of all the steps of all the repetitions are computed
+    upfront from a single starting point, each step starting exactly at the
+    deadline of the previous one, so that no drift builds up from checking
+    each step late. Once checked, the timer is on its current step: its
+    remaining time is the one of the step and it only reaches 00:00:00 at
+    the end of the last step of the last repetition. A pause shifts the
+    deadlines of all the following steps.
+
+    Attributes
+    ----------
+    steps: tuple
+        The label, hours, minutes and seconds of each step of the program
+    repeat: int
+        The number of times the program is run
+    _durations: list
+        The duration of each step of each repetition in nanoseconds
+    _deadlines: list
+        The monotonic point of time to reach the end of each step of each
+        repetition, in nanoseconds
+    _step: int
+        The index of the current step in _deadlines
+    step: int
+        The index of the current step among all the repetitions.
+    step_count: int
+        The number of steps of all the repetitions.
+    step_label: str
+        The label of the current step.
+    get_step_ns: int
+        The duration of the current step in nanoseconds.
+
+    Public methods
+    --------------
+    remaining
+        Compute the remaining time of the step at a point of time.
+    is_timing_reached
+        Check if the last step reached 00:00:00, moving to the current step.
+    continue_after_pause
+        Shift the deadlines of the following steps to continue after a pause.
+    """
+
+    __slots__ = ("steps", "repeat", "_durations", "_deadlines", "_step")
+
+    def __init__(self, steps, repeat: int = 1, stats: TimerStats = None,
+                 clock: MonotonicClock = None):
+        """Create and launch a given program of timers.
+
+        Parameters
+        ----------
+        steps: iterable of tuple
+            The label, hours, minutes and seconds of each step, in order
+        repeat: int
+            The number of times to run the steps, default once
+        stats: TimerStats, optional
+            The instrumentation to record the checks of the timer in
+        clock: MonotonicClock, optional
+            The clock giving the current time, default to the monotonic
+            clock of the system
+
+        Raises
+        ------
+        ValueError
+            If there is no step, a step lasts nothing or repeat isn't
+            positive.
+        """
+        self.steps = tuple((str(label), hours, minutes, seconds)
+                           for label, hours, minutes, seconds in steps)
+        durations = [round(((hours * 60 + minutes) * 60 + seconds)
+                           * NS_PER_SECOND)
+                     for _, hours, minutes, seconds in self.steps]
+        if not durations or min(durations) <= 0:
+            raise ValueError("ValueError: a sequence shall have steps "
+                             "longer than 00:00:00")
+        if repeat < 1:
+            raise ValueError("ValueError: repeat shall be positive")
+
+        self.repeat = repeat
+        self._durations = durations * repeat
+        self._deadlines = [0] * len(self._durations)
+        self._stats = stats
+        self._clock = _monotonic_clock if clock is None else clock
+        self._schedule(0, self._durations[0])
+
+    def _schedule(self, step: int, remaining: int) -> None:
+        """Compute the deadlines from a step with a given remaining time.
+
+        Parameters
+        ----------
+        step: int
+            The index of the step to start from in _deadlines
+        remaining: int
+            The remaining time of this step in nanoseconds
+        """
+        deadlines = self._deadlines
+        deadline = self._clock.now() + remaining
+        deadlines[step] = deadline
+        for index in range(step + 1, len(deadlines)):
+            deadline += self._durations[index]
+            deadlines[index] = deadline
+
+        self._step = step
+        self._delta = remaining
+        self._deadline = deadlines[step]
+        self._actualized_delta = remaining
+
+    @property
+    def step(self) -> int:
+        """The index of the current step among all the repetitions."""
+        return self._step
+
+    @property
+    def step_count(self) -> int:
+        """The number of steps of all the repetitions."""
+        return len(self._deadlines)
+
+    @property
+    def step_label(self) -> str:
+        """The label of the current step."""
+        return self.steps[self._step % len(self.steps)][0]
+
+    @property
+    def get_step_ns(self) -> int:
+        """The duration of the current step in nanoseconds."""
+        return self._durations[self._step]
+
+    def _step_at(self, now: int) -> int:
+        """Get the index of the step including a point of time, from the
+        current step."""
+        deadlines = self._deadlines
+        step = self._step
+        last = len(deadlines) - 1
+        while step < last and deadlines[step] <= now:
+            step += 1
+        return step
+
+    def remaining(self, now: int = None) -> int:
+        """Compute the remaining time of the step at a point of time.
+
+        The step including the point of time is looked up without moving
+        the current step.
+
+        Parameters
+        ----------
+        now: int, optional
+            The monotonic point of time in nanoseconds to compute the
+            remaining time at, default to the current time
+
+        Returns
+        -------
+        int
+            The remaining time of the step in nanoseconds, negative once the
+            last step exceeded.
+        """
+        if now is None:
+            now = self._clock.now()
+        return self._deadlines[self._step_at(now)] - now
+
+    def is_timing_reached(self, now: int = None) -> bool:
+        """Check if the last step reached 00:00:00.
+
+        Move to the step including the current time and actualize its
+        remaining duration.
+
+        Parameters
+        ----------
+        now: int, optional
+            The monotonic point of time in nanoseconds to check the timer
+            at, default to the current time
+
+        Returns
+        -------
+        bool
+            True if the last step reached 00:00:00, else False.
+        """
+        if now is None:
+            now = self._clock.now()
+        step = self._step_at(now)
+        self._step = step
+        self._deadline = self._deadlines[step]
+        self._actualized_delta = self._deadline - now
+        if self._stats is not None:
+            self._stats.record_poll(self._actualized_delta)
+        return self._actualized_delta <= 0
+
+    def continue_after_pause(self) -> None:
+        """Shift the deadlines of the following steps to continue after a
+        pause.
+
+        Set new deadlines from the current time and the remaining duration
+        of the current step when the timer was last checked.
+        """
+        self._schedule(self._step, self._actualized_delta)
+
+
+TimerSnapshot = collections.namedtuple("TimerSnapshot", "remaining paused")
+TimerSnapshot.__doc__ = """\
+The remaining time and pause state of a ThreadSafeTimer at a point of time
+
+Attributes
+----------
+remaining: int
+    The remaining time to reach 00:00:00 in nanoseconds, negative once
+    exceeded
+paused: bool
+    Whether the timer is paused
+"""
+
+
+class ThreadSafeTimer(Timer):
+    """
+    A timer shared by threads, like workers driving it and a UI reading it
+
+    The state of the timer is a single immutable (deadline, paused remaining
+    time) tuple replaced as a whole: reading the timer takes the tuple once
+    without any lock, so that a reader never sees a deadline and a pause
+    state from two different transitions, while pausing and continuing
+    build the new tuple from the current one under a lock, so that
+    concurrent transitions are applied one after the other.
+
+    Attributes
+    ----------
+    _state: tuple
+        The monotonic point of time to reach 00:00:00 in nanoseconds and the
+        remaining time in nanoseconds if paused, else None
+    _lock: threading.Lock
+        The lock serializing the transitions of the state
+    _deadline: int
+        The deadline of the last transition
+    _actualized_delta: int
+        The remaining time computed by the last check, replaced as a whole
+    paused: bool
+        Whether the timer is paused.
+
+    Public methods
+    --------------
+    snapshot
+        Get the remaining time and pause state from a single read.
+    remaining
+        Compute the remaining time at a point of time from a single read.
+    is_timing_reached
+        Check if timing reached 00:00:00.
+    pause
+        Pause the timer.
+    continue_after_pause
+        Continue the timer after a pause.
+    """
+
+    __slots__ = ("_state", "_lock")
+
+    def __init__(self, hours: int = 0, minutes: int = 0, seconds: float = 0,
+                 stats: TimerStats = None, clock: MonotonicClock = None):
+        """Create and launch a given timer.
+
+        Parameters
+        ----------
+        hours: int
+            The hours quantity of the timer
+        minutes: int
+            The minutes quantity of the timer
+        seconds: float
+            The seconds quantity of the timer
+        stats: TimerStats, optional
+            The instrumentation to record the checks of the timer in, only
+            to be checked by a single thread as it isn't thread-safe
+        clock: MonotonicClock, optional
+            The clock giving the current time, default to the monotonic
+            clock of the system
+        """
+        import threading
+
+        Timer.__init__(self, hours, minutes, seconds, stats, clock)
+        self._lock = threading.Lock()
+        self._state = (self._deadline, None)
+
+    @property
+    def paused(self) -> bool:
+        """Whether the timer is paused."""
+        return self._state[1] is not None
+
+    def snapshot(self, now: int = None) -> TimerSnapshot:
+        """Get the remaining time and pause state from a single read.
+
+        Nothing is modified, so that any number of threads may read the
+        timer without locking it.
+
+        Parameters
+        ----------
+        now: int, optional
+            The monotonic point of time in nanoseconds to compute the
+            remaining time at, default to the current time
+
+        Returns
+        -------
+        TimerSnapshot
+            The remaining time and pause state of the timer.
+        """
+        deadline, remaining = self._state
+        if remaining is not None:
+            return TimerSnapshot(remaining, True)
+        if now is None:
+            now = self._clock.now()
+        return TimerSnapshot(deadline - now, False)
+
+    def remaining(self, now: int = None) -> int:
+        """Compute the remaining time at a point of time from a single read.
+
+        Parameters
+        ----------
+        now: int, optional
+            The monotonic point of time in nanoseconds to compute the
+            remaining time at, default to the current time
+
+        Returns
+        -------
+        int
+            The remaining time in nanoseconds, the one of the pause if
+            paused.
+        """
+        deadline, remaining = self._state
+        if remaining is not None:
+            return remaining
+        if now is None:
+            now = self._clock.now()
+        return deadline - now
+
+    def is_timing_reached(self, now: int = None) -> bool:
+        """Check if timing reached 00:00:00.
+
+        Actualize the remaining duration according to the current time, a
+        paused timer keeping the remaining duration of its pause.
+
+        Parameters
+        ----------
+        now: int, optional
+            The monotonic point of time in nanoseconds to check the timer
+            at, default to the current time
+
+        Returns
+        -------
+        bool
+            True if timing reached 00:00:00, else False.
+        """
+        remaining = self.remaining(now)
+        self._actualized_delta = remaining
+        if self._stats is not None:
+            self._stats.record_poll(remaining)
+        return remaining <= 0
+
+    def pause(self) -> None:
+        """Pause the timer, nothing is done if already paused."""
+        with self._lock:
+            deadline, remaining = self._state
+            if remaining is None:
+                self._state = (deadline, deadline - self._clock.now())
+
+    def continue_after_pause(self) -> None:
+        """Continue the timer after a pause.
+
+        Set a new deadline from the current time and the remaining duration
+        of the pause, or of the last check if the timer wasn't paused with
+        the pause method.
+        """
+        with self._lock:
+            remaining = self._state[1]
+            if remaining is None:
+                remaining = self._actualized_delta
+            self._delta = remaining
+            self._deadline = self._clock.now() + remaining
+            self._state = (self._deadline, None)
+
+
+class TimingFormatter:
+    """
+    A formatter of remaining times as H:MM:SS with a configurable precision
+
+    The digits are computed with integer arithmetic from nanoseconds, the
+    hours aren't limited to a day and are zero-padded to a minimum number of
+    digits so that a countdown keeps the same width, and an exceeded timing
+    is prefixed by a minus sign. As a display is refreshed far more often
+    than its visible value changes, the previous string is returned again as
+    long as the visible value is the same.
+
+    Attributes
+    ----------
+    precisions: dict
+        The nanoseconds of the smallest displayed unit of each precision
+    _unit: int
+        The nanoseconds of the smallest displayed unit
+    _digits: int
+        The number of digits displayed after the seconds
+    _units_per_second: int
+        The number of smallest displayed units in a second
+    _template: str
+        The printf-style template of the formatted string
+    _last_units: int
+        The last formatted value, in smallest displayed units
+    _last_timing: str
+        The last formatted string
+
+    Public methods
+    --------------
+    for_timing
+        Create a formatter of fixed width for a countdown from a given time.
+    format
+        Format a remaining time given in nanoseconds.
+    """
+
+    precisions = {"seconds": NS_PER_SECOND,
+                  "tenths": NS_PER_SECOND // 10,
+                  "millis": NS_PER_SECOND // 1000}
+
+    def __init__(self, precision: str = "tenths", hours_digits: int = 1):
+        """Initialize a formatter for a given precision.
+
+        Parameters
+        ----------
+        precision: str
+            The smallest displayed unit, "seconds", "tenths" or "millis",
+            default to tenths of second as displayed by the front ends
+        hours_digits: int
+            The minimum number of digits of the hours, zero-padded
+
+        Raises
+        ------
+        ValueError
+            If the precision is unknown or the hours digits not positive.
+        """
+        if precision not in self.precisions:
+            raise ValueError(f"ValueError: precision shall be one of "
+                             f"{', '.join(self.precisions)}")
+        if hours_digits < 1:
+            raise ValueError("ValueError: hours_digits shall be positive")
+
+        self._unit = self.precisions[precision]
+        self._units_per_second = NS_PER_SECOND // self._unit
+        self._digits = len(str(self._units_per_second)) - 1
+        self._template = f"%s%0{hours_digits}d:%02d:%02d"
+        if self._digits:
+            self._template += f".%0{self._digits}d"
+        self._last_units = None
+        self._last_timing = None
+
+    @classmethod
+    def for_timing(cls, timing_ns: int,
+                   precision: str = None) -> TimingFormatter:
+        """Create a formatter of fixed width for a countdown from a given time.
+
+        The hours are padded to the digits of the initial time so that the
+        display keeps its width down to 00:00:00, and the precision defaults
+        to the milliseconds if the initial time isn't whole tenths of second.
+
+        Parameters
+        ----------
+        timing_ns: int
+            The initial remaining time of the countdown in nanoseconds
+        precision: str, optional
+            The smallest displayed unit, "seconds", "tenths" or "millis"
+
+        Returns
+        -------
+        TimingFormatter
+            The formatter of the countdown.
+        """
+        if precision is None:
+            tenth = cls.precisions["tenths"]
+            precision = "millis" if timing_ns % tenth else "tenths"
+        hours = abs(timing_ns) // (3600 * NS_PER_SECOND)
+
+        return cls(precision, len(str(hours)))
+
+    def format(self, timing_ns: int) -> str:
+        """Format a remaining time given in nanoseconds.
+
+        The time is truncated toward zero to the smallest displayed unit, as
+        the countdown only shows a value once fully elapsed.
+
+        Parameters
+        ----------
+        timing_ns: int
+            The remaining time in nanoseconds, negative if exceeded
+
+        Returns
+        -------
+        str
+            The remaining time as [-]H:MM:SS[.f] with the hours padded to
+            the minimum digits, the same string object as
+            the last call if the visible value didn't change.
+        """
+        if timing_ns < 0:
+            units = -(-timing_ns // self._unit)
+        else:
+            units = timing_ns // self._unit
+
+        if units == self._last_units:
+            return self._last_timing
+
+        if units < 0:
+            sign, magnitude = "-", -units
+        else:
+            sign, magnitude = "", units
+        seconds, fraction = divmod(magnitude, self._units_per_second)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        if self._digits:
+            timing = self._template % (sign, hours, minutes, seconds, fraction)
+        else:
+            timing = self._template % (sign, hours, minutes, seconds)
+
+        self._last_units = units
+        self._last_timing = timing
+        return timing
+
+
+class Histogram:
+    """
+    A histogram of non negative integers like durations in nanoseconds
+
+    Values are counted in log-linear buckets keeping their 4 most significant
+    bits, so that recording a value takes a constant time and the memory only
+    grows with the magnitude of the values, percentiles being accurate to
+    12.5%.
+
+    Attributes
+    ----------
+    count: int
+        The number of recorded values
+    maximum: int
+        The exact maximum of the recorded values, None if none
+    _buckets: dict
+        The number of recorded values of each bucket
+
+    Public methods
+    --------------
+    record
+        Count a value.
+    percentile
+        Get a percentile of the recorded values.
+    summary
+        Get the p50, p99 and maximum of the recorded durations.
+    """
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self.count = 0
+        self.maximum = None
+        self._buckets = {}
+
+    @staticmethod
+    def _bucket(value: int) -> int:
+        """Get the bucket of a value, values below 16 having their own."""
+        if value < 16:
+            return value
+        shift = value.bit_length() - 4
+        return (shift << 3) + (value >> shift)
+
+    @staticmethod
+    def _lowest(bucket: int) -> int:
+        """Get the lowest value of a bucket."""
+        if bucket < 16:
+            return bucket
+        shift = (bucket >> 3) - 1
+        return (bucket - (shift << 3)) << shift
+
+    def record(self, value: int) -> None:
+        """Count a value.
+
+        Parameters
+        ----------
+        value: int
+            The value to count, negative values being counted as 0
+        """
+        if value < 0:
+            value = 0
+        bucket = self._bucket(value)
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+        self.count += 1
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def percentile(self, rank: float) -> int:
+        """Get a percentile of the recorded values.
+
+        Parameters
+        ----------
+        rank: float
+            The percentile to get, between 0 and 1
+
+        Returns
+        -------
+        int
+            The lowest value of the bucket of the percentile, None if no value
+            has been recorded.
+        """
+        if not self.count:
+            return None
+
+        # Number of values up to the percentile, at least one, rounded up
+        # from the thousandth to get rid of float errors
+        wanted = max(1, -(-round(rank * self.count * 1000) // 1000))
+        counted = 0
+        for bucket in sorted(self._buckets):
+            counted += self._buckets[bucket]
+            if counted >= wanted:
+                return min(self._lowest(bucket), self.maximum)
+
+    def summary(self) -> str:
+        """Get the p50, p99 and maximum of the recorded durations.
+
+        Returns
+        -------
+        str
+            The p50, p99 and maximum in milliseconds of the values recorded as
+            nanoseconds.
+        """
+        if not self.count:
+            return "no value"
+
+        return (f"p50 {self.percentile(0.5) / 1e6:.3f} ms, "
+                f"p99 {self.percentile(0.99) / 1e6:.3f} ms, "
+                f"max {self.maximum / 1e6:.3f} ms ({self.count} values)")
+
+
+class TimerStats:
+    """
+    Instrumentation of timers and of the loops displaying them
+
+    Record how late each tick of a display is after its boundary, how late
+    the end of a timer is detected after its deadline, and the number of
+    checks of the timers. A stats object may be shared by successive timers.
+
+    Attributes
+    ----------
+    lateness: Histogram
+        The lateness of each tick after its display boundary, in nanoseconds
+    overshoot: Histogram
+        The lateness of each detected end of timer after its deadline, in
+        nanoseconds
+    polls: int
+        The number of checks of the timers
+    _expired: bool
+        Whether the last checked timer was expired
+
+    Public methods
+    --------------
+    record_poll
+        Record a check of a timer.
+    record_tick
+        Record the lateness of a tick.
+    summary
+        Get a printable summary of the recorded values.
+    log
+        Log the summary of the recorded values.
+    """
+
+    def __init__(self):
+        """Initialize empty stats."""
+        self.lateness = Histogram()
+        self.overshoot = Histogram()
+        self.polls = 0
+        self._expired = False
+
+    def record_poll(self, remaining: int) -> None:
+        """Record a check of a timer.
+
+        The first check finding the timer expired records its overshoot.
+
+        Parameters
+        ----------
+        remaining: int
+            The remaining time of the timer in nanoseconds, negative once
+            the deadline is exceeded
+        """
+        self.polls += 1
+        if remaining <= 0:
+            if not self._expired:
+                self.overshoot.record(-remaining)
+            self._expired = True
+        else:
+            self._expired = False
+
+    def record_tick(self, lateness: int) -> None:
+        """Record the lateness of a tick.
+
+        Parameters
+        ----------
+        lateness: int
+            The lateness of the tick after its boundary in nanoseconds, a
+            negative lateness being a wake up before the tick (e.g. by a user
+            input) which is not recorded
+        """
+        if lateness >= 0:
+            self.lateness.record(lateness)
+
+    def summary(self) -> str:
+        """Get a printable summary of the recorded values.
+
+        Returns
+        -------
+        str
+            One line for the tick lateness, the expiry overshoot and the
+            poll count.
+        """
+        return (f"Tick lateness: {self.lateness.summary()}\n"
+                f"Expiry overshoot: {self.overshoot.summary()}\n"
+                f"Polls: {self.polls}")
+
+    def log(self, logger: logging.Logger) -> None:
+        """Log the summary of the recorded values at debug level.
+
+        Parameters
+        ----------
+        logger: logging.Logger
+            The logger to use, e.g. the one returned by the logger function
+        """
+        for line in self.summary().splitlines():
+            logger.debug("Timer stats - %s", line)
+
+
+class TickScheduler:
+    """
+    A tick scheduler for the Timer class
+
+    Allow to follow a given timer without polling it in a busy loop: the next
+    display boundary (e.g. the next tenth of second of the remaining time) is
+    computed from the timer's deadline and the scheduler sleeps until then.
+
+    Attributes
+    ----------
+    _timer: Timer
+        The timer to schedule ticks for
+    _interval: int
+        The duration between two display boundaries, in nanoseconds
+    _tick: int
+        The monotonic point of time of the last display boundary given by
+        next_tick, in nanoseconds, None once checked
+    _clock: MonotonicClock
+        The clock to read the current time from and sleep on
+
+    Public methods
+    --------------
+    next_tick
+        Get the duration to wait until the next display boundary.
+    check
+        Check the timer once woken up for a display boundary.
+    wait
+        Sleep until the next display boundary and check the timer.
+    """
+
+    def __init__(self, timer: Timer, interval: float = 0.1,
+                 clock: MonotonicClock = None):
+        """Initialize a tick scheduler for a given timer.
+
+        Parameters
+        ----------
+        timer: Timer
+            The timer to schedule ticks for
+        interval: float
+            The duration between two display boundaries, in seconds, default
+            to a tenth of second as displayed by the front ends
+        clock: MonotonicClock, optional
+            The clock to read the current time from and sleep on, default to
+            the clock of the timer
+        """
+        if interval <= 0:
+            raise ValueError("ValueError: interval shall be positive")
+
+        self._timer = timer
+        self._interval = round(interval * NS_PER_SECOND)
+        self._tick = None
+        self._clock = timer._clock if clock is None else clock
+
+    def next_tick(self) -> float:
+        """Get the duration to wait until the next display boundary.
+
+        The boundary is the next point of time where the remaining time
+        reaches a multiple of the interval, bounded by the timer's deadline.
+
+        Returns
+        -------
+        float
+            The duration to wait in seconds, 0 if the timing is reached.
+        """
+        now = self._clock.now()
+        remaining = self._timer.remaining(now)
+        if remaining <= 0:
+            self._tick = now
+            return 0.0
+
+        to_boundary = remaining % self._interval
+        if to_boundary == 0:
+            to_boundary = self._interval
+
+        self._tick = now + to_boundary
+        return to_boundary / NS_PER_SECOND
+
+    def check(self) -> bool:
+        """Check the timer once woken up for a display boundary.
+
+        If the timer is instrumented, record the lateness of the wake up
+        after the boundary given by the last call to next_tick.
+
+        Returns
+        -------
+        bool
+            True if timing reached 00:00:00, else False.
+        """
+        now = self._clock.now()
+        counter = self._timer.is_timing_reached(now)
+        if self._tick is not None:
+            self._timer.record_tick(now - self._tick)
+        self._tick = None
+
+        return counter
+
+    def wait(self) -> bool:
+        """Sleep until the next display boundary and check the timer.
+
+        Returns
+        -------
+        bool
+            True if timing reached 00:00:00, else False.
+        """
+        self._clock.sleep(self.next_tick())
+        return self.check()
+
+
+class TimerPool:
+    """
+    A pool of many concurrent timers
+
+    Hold timers in a min-heap keyed by deadline so that only the earliest
+    deadline has to be checked or waited for, whatever the number of timers.
+    Cancelled and paused timers are lazily removed from the heap, which is
+    compacted when it mostly contains removed entries. A TimerSequence is
+    keyed by the deadline of its last step, so that it only expires at the
+    end of its program.
+
+    Attributes
+    ----------
+    _heap: list
+        The [deadline, sequence number, timer] entries ordered by deadline,
+        the timer being None for a removed entry
+    _entries: dict
+        The heap entry of each running timer of the pool
+    _paused: set
+        The paused timers of the pool
+    _removed: int
+        The number of removed entries still in the heap
+    _sequence: itertools.count
+        The sequence numbers to order timers sharing the same deadline
+    _clock: MonotonicClock
+        The clock to read the current time from and sleep on, the one of
+        the timers of the pool
+
+    Public methods
+    --------------
+    add
+        Add a running timer to the pool.
+    cancel
+        Remove a running or paused timer from the pool.
+    pause
+        Pause a running timer of the pool.
+    resume
+        Continue a paused timer of the pool.
+    is_paused
+        Check whether a timer of the pool is paused.
+    next_deadline
+        Get the earliest deadline of the running timers.
+    pop_expired
+        Remove and return the timers which reached 00:00:00.
+    wait
+        Sleep until the earliest deadline and return the expired timers.
+    """
+
+    def __init__(self, clock: MonotonicClock = None):
+        """Initialize an empty pool of timers.
+
+        Parameters
+        ----------
+        clock: MonotonicClock, optional
+            The clock of the timers of the pool, default to the monotonic
+            clock of the system
+        """
+        self._heap = []
+        self._entries = {}
+        self._paused = set()
+        self._removed = 0
+        self._sequence = itertools.count()
+        self._clock = _monotonic_clock if clock is None else clock
+
+    def __len__(self) -> int:
+        """The number of running and paused timers of the pool."""
+        return len(self._entries) + len(self._paused)
+
+    def __contains__(self, timer: Timer) -> bool:
+        """Check whether a timer is running or paused in the pool."""
+        return timer in self._entries or timer in self._paused
+
+    def _push(self, timer: Timer) -> None:
+        """Push a running timer on the heap according to its deadline."""
+        if isinstance(timer, TimerSequence):
+            deadline = timer._deadlines[-1]
+        else:
+            deadline = timer._deadline
+        entry = [deadline, next(self._sequence), timer]
+        self._entries[timer] = entry
+        heapq.heappush(self._heap, entry)
+
+    def _remove(self, timer: Timer) -> None:
+        """Lazily remove a running timer from the heap.
+
+        Raises
+        ------
+        ValueError
+            If the timer is not running in the pool.
+        """
+        try:
+            entry = self._entries.pop(timer)
+        except KeyError:
+            raise ValueError("ValueError: timer not running in the pool")
+
+        entry[2] = None
+        self._removed += 1
+
+        # Rebuild the heap when it mostly contains removed entries
+        if self._removed > len(self._entries):
+            self._heap = [entry for entry in self._heap
+                          if entry[2] is not None]
+            heapq.heapify(self._heap)
+            self._removed = 0
+
+    def add(self, timer: Timer) -> None:
+        """Add a running timer to the pool.
+
+        Parameters
+        ----------
+        timer: Timer
+            The launched timer to follow.
+
+        Raises
+        ------
+        ValueError
+            If the timer is already in the pool.
+        """
+        if timer in self:
+            raise ValueError("ValueError: timer already in the pool")
+
+        self._push(timer)
+
+    def cancel(self, timer: Timer) -> None:
+        """Remove a running or paused timer from the pool.
+
+        Raises
+        ------
+        ValueError
+            If the timer is not in the pool.
+        """
+        if timer in self._paused:
+            self._paused.remove(timer)
+        else:
+            self._remove(timer)
+
+    def pause(self, timer: Timer) -> None:
+        """Pause a running timer of the pool.
+
+        The remaining time of the timer is actualized to be continued from
+        it when resumed.
+
+        Raises
+        ------
+        ValueError
+            If the timer is not running in the pool.
+        """
+        self._remove(timer)
+        timer.is_timing_reached()
+        self._paused.add(timer)
+
+    def resume(self, timer: Timer) -> None:
+        """Continue a paused timer of the pool.
+
+        Raises
+        ------
+        ValueError
+            If the timer is not paused in the pool.
+        """
+        try:
+            self._paused.remove(timer)
+        except KeyError:
+            raise ValueError("ValueError: timer not paused in the pool")
+
+        timer.continue_after_pause()
+        self._push(timer)
+
+    def is_paused(self, timer: Timer) -> bool:
+        """Check whether a timer of the pool is paused."""
+        return timer in self._paused
+
+    def next_deadline(self):
+        """Get the earliest deadline of the running timers.
+
+        Returns
+        -------
+        int or None
+            The earliest monotonic deadline in nanoseconds, None if there is
+            no running timer.
+        """
+        heap = self._heap
+        while heap and heap[0][2] is None:
+            heapq.heappop(heap)
+            self._removed -= 1
+
+        return heap[0][0] if heap else None
+
+    def pop_expired(self, now: int = None) -> list:
+        """Remove and return the timers which reached 00:00:00.
+
+        Only the expired timers are visited, the cost does not depend on the
+        number of timers still running.
+
+        Parameters
+        ----------
+        now: int, optional
+            The monotonic point of time in nanoseconds to check deadlines
+            against, default to the current time.
+
+        Returns
+        -------
+        expired: list[Timer]
+            The expired timers ordered by deadline.
+        """
+        if now is None:
+            now = self._clock.now()
+
+        expired = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            deadline, _, timer = heapq.heappop(heap)
+            if timer is None:
+                self._removed -= 1
+                continue
+            del self._entries[timer]
+            timer.is_timing_reached(now)
+            expired.append(timer)
+
+        return expired
+
+    def wait(self, timeout: float = None) -> list:
+        """Sleep until the earliest deadline and return the expired timers.
+
+        Parameters
+        ----------
+        timeout: float, optional
+            The maximum duration to sleep in seconds, default to sleep until
+            the earliest deadline. Without running timer nor timeout, return
+            immediately.
+
+        Returns
+        -------
+        expired: list[Timer]
+            The expired timers ordered by deadline, empty if the timeout was
+            reached first.
+        """
+        deadline = self.next_deadline()
+        if deadline is None:
+            delay = 0 if timeout is None else timeout
+        else:
+            delay = max(deadline - self._clock.now(), 0) / NS_PER_SECOND
+            if timeout is not None:
+                delay = min(delay, timeout)
+
+        if delay > 0:
+            self._clock.sleep(delay)
+
+        return self.pop_expired()
+
+
+class TimerArray:
+    """
+    Many timers held in columns, like the countdowns of a dashboard
+
+    A timer is an index in two arrays instead of an object: a signed 64 bits
+    integer being the deadline of a running timer or the remaining time of
+    a paused one, and a byte flagging the running timers. A timer thus takes
+    9 bytes, and the remaining times and expired flags of all the timers are
+    computed from a single point of time. Only the NumPy path is vectorized,
+    a single NumPy operation on views of the arrays: without NumPy, the
+    computation is a Python loop over the timers, no faster than calling
+    Timer.remaining on as many timers, the arrays only saving memory.
+
+    Attributes
+    ----------
+    _deadlines: array.array
+        The monotonic deadline in nanoseconds of each running timer, the
+        remaining time in nanoseconds of each paused timer
+    _running: array.array
+        1 for each running timer, 0 for each paused one
+    _numpy: module
+        The NumPy module computing the remaining times, None if not
+        available or not to be used
+    _clock: MonotonicClock
+        The clock giving the current time
+
+    Public methods
+    --------------
+    add
+        Add and launch a timer.
+    is_paused
+        Check whether a timer is paused.
+    pause
+        Pause a timer.
+    continue_after_pause
+        Continue a timer after a pause.
+    remaining
+        Compute the remaining time of all the timers at a point of time.
+    tick
+        Compute the remaining time and expired flag of all the timers.
+    """
+
+    def __init__(self, clock: MonotonicClock = None,
+                 use_numpy: bool = True):
+        """Initialize an empty array of timers.
+
+        Parameters
+        ----------
+        clock: MonotonicClock, optional
+            The clock giving the current time, default to the monotonic
+            clock of the system
+        use_numpy: bool
+            Whether to compute with NumPy if available, default to True
+        """
+        self._deadlines = array.array('q')
+        self._running = array.array('b')
+        self._numpy = _import_numpy() if use_numpy else None
+        self._clock = _monotonic_clock if clock is None else clock
+
+    def __len__(self) -> int:
+        """The number of timers of the array."""
+        return len(self._deadlines)
+
+    def add(self, hours: int = 0, minutes: int = 0,
+            seconds: float = 0) -> int:
+        """Add and launch a timer.
+
+        Parameters
+        ----------
+        hours: int
+            The hours quantity of the timer
+        minutes: int
+            The minutes quantity of the timer
+        seconds: float
+            The seconds quantity of the timer
+
+        Returns
+        -------
+        int
+            The index of the timer in the array.
+        """
+        delta = round(((hours * 60 + minutes) * 60 + seconds) * NS_PER_SECOND)
+        self._deadlines.append(self._clock.now() + delta)
+        self._running.append(1)
+        return len(self._deadlines) - 1
+
+    def is_paused(self, index: int) -> bool:
+        """Check whether a timer is paused."""
+        return not self._running[index]
+
+    def pause(self, index: int) -> None:
+        """Pause a timer, nothing is done if already paused."""
+        if self._running[index]:
+            self._deadlines[index] -= self._clock.now()
+            self._running[index] = 0
+
+    def continue_after_pause(self, index: int) -> None:
+        """Continue a timer after a pause, nothing is done if running."""
+        if not self._running[index]:
+            self._deadlines[index] += self._clock.now()
+            self._running[index] = 1
+
+    def remaining(self, now: int = None):
+        """Compute the remaining time of all the timers at a point of time.
+
+        A single NumPy operation if NumPy is used, a Python loop over the
+        timers else.
+
+        Parameters
+        ----------
+        now: int, optional
+            The monotonic point of time in nanoseconds to compute the
+            remaining times at, default to the current time
+
+        Returns
+        -------
+        numpy.ndarray or array.array
+            The remaining time of each timer in nanoseconds, negative once
+            exceeded, a NumPy array of int64 if computed with NumPy.
+        """
+        if now is None:
+            now = self._clock.now()
+
+        numpy = self._numpy
+        if numpy is not None and self._deadlines:
+            # Views of the arrays, released once computed
+            deadlines = numpy.frombuffer(self._deadlines, dtype=numpy.int64)
+            running = numpy.frombuffer(self._running, dtype=numpy.bool_)
+            return numpy.where(running, deadlines - now, deadlines)
+
+        return array.array('q', [deadline - now if running else deadline
+                                 for deadline, running
+                                 in zip(self._deadlines, self._running)])
+
+    def tick(self, now: int = None) -> tuple:
+        """Compute the remaining time and expired flag of all the timers.
+
+        Parameters
+        ----------
+        now: int, optional
+            The monotonic point of time in nanoseconds to compute the
+            remaining times at, default to the current time
+
+        Returns
+        -------
+        tuple
+            The remaining time of each timer in nanoseconds as returned by
+            remaining, and whether each timer reached 00:00:00, a NumPy array
+            of bool if computed with NumPy, else a list of bool.
+        """
+        remaining = self.remaining(now)
+        if isinstance(remaining, array.array):
+            return remaining, [value <= 0 for value in remaining]
+        return remaining, remaining <= 0
+
+
+def _import_numpy():
+    """Import NumPy if available.
+
+    Returns
+    -------
+    module
+        The numpy module, None if not installed.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class AsyncTimer:
+    """
+    An asyncio timer based on the Timer class
+
+    Allow to await the end of a given timer or to iterate over its display
+    ticks inside an event loop instead of polling it. Pausing and continuing
+    the timer wake up its waiters, which stay consistent if cancelled since
+    the state is kept by the underlying Timer.
+
+    Attributes
+    ----------
+    _timer: Timer
+        The underlying timer
+    _paused: bool
+        True if the timer is paused
+    _wakeup: asyncio.Future
+        The future shared by the waiters to be woken up on pause/continue
+    get_timing: str
+        The actual remaining time to reach 00:00:00.
+
+    Public methods
+    --------------
+    is_timing_reached
+        Check if timing reached 00:00:00.
+    pause
+        Pause the timer.
+    continue_after_pause
+        Continue the timer after a pause.
+    wait
+        Wait until the timing reached 00:00:00.
+    ticks
+        Iterate over the remaining time at each display boundary.
+    """
+
+    def __init__(self, hours: int = 0, minutes: int = 0, seconds: int = 0):
+        """Create and launch a given timer.
+
+        Parameters
+        ----------
+        hours: int
+            The hours quantity of the timer
+        minutes: int
+            The minutes quantity of the timer
+        seconds: int
+            The seconds quantity of the timer
+        """
+        self._timer = Timer(hours=hours, minutes=minutes, seconds=seconds)
+        self._paused = False
+        self._wakeup = None
+
+    @property
+    def paused(self) -> bool:
+        """True if the timer is paused, else False."""
+        return self._paused
+
+    @property
+    def get_timing(self) -> str:
+        """The actual remaining time to reach 00:00:00."""
+        return self._timer.get_timing
+
+    def is_timing_reached(self) -> bool:
+        """Check if timing reached 00:00:00, always False if paused."""
+        return not self._paused and self._timer.is_timing_reached()
+
+    def _notify(self) -> None:
+        """Wake up the waiters after a state change."""
+        if self._wakeup is not None and not self._wakeup.done():
+            self._wakeup.set_result(None)
+        self._wakeup = None
+
+    async def _sleep(self, delay) -> None:
+        """Sleep until a given delay or a state change.
+
+        Parameters
+        ----------
+        delay: float or None
+            The duration to sleep in seconds, None to sleep until the next
+            state change.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        if self._wakeup is None or self._wakeup.get_loop() is not loop:
+            self._wakeup = loop.create_future()
+
+        try:
+            # Shield the shared future from the cancellation of one waiter
+            await asyncio.wait_for(asyncio.shield(self._wakeup), delay)
+        except asyncio.TimeoutError:
+            pass
+
+    def pause(self) -> None:
+        """Pause the timer, keeping its actual remaining time."""
+        if not self._paused:
+            self._timer.is_timing_reached()
+            self._paused = True
+            self._notify()
+
+    def continue_after_pause(self) -> None:
+        """Continue the timer from the remaining time kept at pause."""
+        if self._paused:
+            self._timer.continue_after_pause()
+            self._paused = False
+            self._notify()
+
+    async def wait(self) -> None:
+        """Wait until the timing reached 00:00:00, paused time excluded."""
+        while True:
+            if self._paused:
+                await self._sleep(None)
+            elif self._timer.is_timing_reached():
+                return
+            else:
+                await self._sleep(self._timer._actualized_delta
+                                  / NS_PER_SECOND)
+
+    async def ticks(self, interval: float = 0.1):
+        """Iterate over the remaining time at each display boundary.
+
+        Nothing is yielded while the timer is paused and the iteration stops
+        when the timing reached 00:00:00.
+
+        Parameters
+        ----------
+        interval: float
+            The duration between two display boundaries, in seconds
+
+        Yields
+        ------
+        str
+            The actual remaining time to reach 00:00:00.
+        """
+        scheduler = TickScheduler(self._timer, interval)
+        while True:
+            if self._paused:
+                await self._sleep(None)
+            elif self._timer.is_timing_reached():
+                return
+            else:
+                yield self._timer.get_timing
+                await self._sleep(scheduler.next_tick())
+
+
+class TimerDaemon:
+    """
+    A server of many timers over a Unix domain socket
+
+    Host the timers of all the clients in a single process: the timers are
+    held by a TimerPool and a single asyncio task sleeps until the earliest
+    deadline, so that thousands of concurrent timers only cost their heap
+    entry. A client sends one JSON command per line and gets one JSON
+    response per line:
+
+    - {"command": "start", "hours": h, "minutes": m, "seconds": s,
+      "label": label} gives {"ok": true, "id": id}
+    - {"command": "pause" or "continue" or "cancel", "id": id} gives
+      {"ok": true}
+    - {"command": "list"} gives {"ok": true, "timers": [{"id": id,
+      "label": label, "remaining": "H:MM:SS.f", "paused": bool}, ...]}
+    - {"command": "wait", "id": id} gives {"ok": true} once the timer
+      reached 00:00:00
+
+    An invalid command gives {"ok": false, "error": message}.
+
+    Attributes
+    ----------
+    socket_path: str
+        The path of the Unix domain socket to listen on
+    _pool: TimerPool
+        The running and paused timers
+    _timers: dict
+        The timer of each timer id
+    _ids: dict
+        The id of each timer
+    _labels: dict
+        The label of each timer id
+    _waiters: dict
+        The futures of the clients waiting for the end of each timer id
+    _sequence: itertools.count
+        The ids of the started timers
+    _changed: asyncio.Event
+        Set when the earliest deadline may have changed, None if not serving
+    _logger: logging.Logger
+        The logger of the timers ending, None to not log them
+    _clock: MonotonicClock
+        The clock of the timers and of the pool
+
+    Public methods
+    --------------
+    handle_command
+        Execute a command, except wait, and get its response.
+    serve
+        Serve the clients of the socket until cancelled.
+    run
+        Serve the clients of the socket until interrupted.
+    """
+
+    def __init__(self, socket_path: str = None, logger=None,
+                 clock: MonotonicClock = None):
+        """Initialize a daemon without timer.
+
+        Parameters
+        ----------
+        socket_path: str, optional
+            The path of the Unix domain socket to listen on, default to a
+            socket private to the user in $XDG_RUNTIME_DIR or /tmp
+        logger: logging.Logger, optional
+            The logger of the timers ending
+        clock: MonotonicClock, optional
+            The clock of the timers, default to the monotonic clock of the
+            system
+        """
+        self.socket_path = socket_path or _default_socket_path()
+        self._clock = _monotonic_clock if clock is None else clock
+        self._pool = TimerPool(self._clock)
+        self._timers = {}
+        self._ids = {}
+        self._labels = {}
+        self._waiters = {}
+        self._sequence = itertools.count(1)
+        self._changed = None
+        self._logger = logger
+
+    def __len__(self) -> int:
+        """The number of running and paused timers of the daemon."""
+        return len(self._timers)
+
+    def _get_timer(self, command: dict) -> tuple:
+        """Get the id and the timer of a command."""
+        timer_id = command.get("id")
+        if timer_id not in self._timers:
+            raise ValueError(f"ValueError: no timer {timer_id}")
+        return timer_id, self._timers[timer_id]
+
+    def _remove(self, timer_id: int, response: dict) -> None:
+        """Forget a timer and give a response to its waiters."""
+        del self._ids[self._timers.pop(timer_id)]
+        del self._labels[timer_id]
+        for waiter in self._waiters.pop(timer_id, ()):
+            if not waiter.done():
+                waiter.set_result(response)
+
+    def handle_command(self, command: dict) -> dict:
+        """Execute a command, except wait, and get its response.
+
+        Parameters
+        ----------
+        command: dict
+            The command and its parameters
+
+        Returns
+        -------
+        dict
+            The response to the command, {"ok": false, "error": message} if
+            the command is invalid.
+        """
+        try:
+            name = command.get("command")
+            response = {"ok": True}
+            if name == "start":
+                timer = Timer(int(command.get("hours", 0)),
+                              int(command.get("minutes", 0)),
+                              float(command.get("seconds", 0)),
+                              clock=self._clock)
+                timer_id = next(self._sequence)
+                self._pool.add(timer)
+                self._timers[timer_id] = timer
+                self._ids[timer] = timer_id
+                self._labels[timer_id] = str(command.get("label", ""))
+                response["id"] = timer_id
+            elif name == "pause":
+                self._pool.pause(self._get_timer(command)[1])
+            elif name == "continue":
+                self._pool.resume(self._get_timer(command)[1])
+            elif name == "cancel":
+                timer_id, timer = self._get_timer(command)
+                self._pool.cancel(timer)
+                self._remove(timer_id, {"ok": False,
+                                        "error": "ValueError: timer "
+                                                 "cancelled"})
+            elif name == "list":
+                formatter = TimingFormatter()
+                response["timers"] = timers = []
+                # All the timers are listed at the same point of time
+                now = self._clock.now()
+                for timer_id, timer in self._timers.items():
+                    paused = self._pool.is_paused(timer)
+                    if paused:
+                        remaining = timer.get_timing_ns
+                    else:
+                        remaining = timer.remaining(now)
+                    timers.append({"id": timer_id,
+                                   "label": self._labels[timer_id],
+                                   "remaining": formatter.format(
+                                       max(remaining, 0)),
+                                   "paused": paused})
+            else:
+                raise ValueError(f"ValueError: unknown command {name}")
+        except (ValueError, TypeError, AttributeError,
+                OverflowError) as error:
+            return {"ok": False, "error": str(error)}
+
+        if self._changed is not None:
+            self._changed.set()
+        return response
+
+    async def _wait(self, command: dict) -> dict:
+        """Wait until the timer of a command reached 00:00:00."""
+        import asyncio
+
+        timer_id = command.get("id")
+        if timer_id not in self._timers:
+            return {"ok": False, "error": f"ValueError: no timer {timer_id}"}
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(timer_id, []).append(waiter)
+        return await waiter
+
+    async def _expire(self) -> None:
+        """Sleep until the earliest deadline or a change and end the expired
+        timers, forever."""
+        import asyncio
+
+        while True:
+            self._changed.clear()
+            deadline = self._pool.next_deadline()
+            if deadline is None:
+                delay = None
+            else:
+                delay = max(deadline - self._clock.now(), 0) / NS_PER_SECOND
+
+            try:
+                await asyncio.wait_for(self._changed.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+            for timer in self._pool.pop_expired():
+                timer_id = self._ids[timer]
+                if self._logger is not None:
+                    self._logger.info("Timer %s %s reached 00:00:00",
+                                      timer_id, self._labels[timer_id])
+                self._remove(timer_id, {"ok": True})
+
+    async def _handle_client(self, reader, writer) -> None:
+        """Answer the commands of a client until it disconnects."""
+        import json
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                try:
+                    command = json.loads(line)
+                    if not isinstance(command, dict):
+                        raise ValueError
+                except ValueError:
+                    response = {"ok": False,
+                                "error": "ValueError: invalid JSON command"}
+                else:
+                    if command.get("command") == "wait":
+                        response = await self._wait(command)
+                    else:
+                        response = self.handle_command(command)
+
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, ready=None) -> None:
+        """Serve the clients of the socket until cancelled.
+
+        Parameters
+        ----------
+        ready: callable, optional
+            Called without argument once the socket is listening
+
+        Raises
+        ------
+        ValueError
+            If an other daemon is already listening on the socket.
+        """
+        import asyncio
+
+        if os.path.exists(self.socket_path):
+            try:
+                send_daemon_command({"command": "list"}, self.socket_path)
+            except OSError:
+                # Socket left by a daemon which didn't stop properly
+                os.unlink(self.socket_path)
+            else:
+                raise ValueError(f"ValueError: a daemon is already listening "
+                                 f"on {self.socket_path}")
+
+        self._changed = asyncio.Event()
+        server = await asyncio.start_unix_server(self._handle_client,
+                                                 path=self.socket_path)
+        expire = asyncio.ensure_future(self._expire())
+        try:
+            if ready is not None:
+                ready()
+            await server.serve_forever()
+        finally:
+            expire.cancel()
+            server.close()
+            self._changed = None
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.socket_path)
+
+    def run(self, ready=None) -> None:
+        """Serve the clients of the socket until interrupted.
+
+        Parameters
+        ----------
+        ready: callable, optional
+            Called without argument once the socket is listening
+
+        Raises
+        ------
+        ValueError
+            If an other daemon is already listening on the socket.
+        """
+        import asyncio
+
+        try:
+            asyncio.run(self.serve(ready))
+        except KeyboardInterrupt:
+            pass
+
+
+class TimerCheckpoint:
+    """
+    A checkpoint file of a running or paused timer
+
+    Keep the state of a timer on disk so that a front end restarted after a
+    crash resumes it without asking for its duration again. As the monotonic
+    clock doesn't survive a reboot, the deadline of a running timer is stored
+    as a point of wall clock time thanks to the offset between both clocks,
+    a paused timer storing its remaining time. Writes are atomic and rate
+    limited: a state saved too soon after the last write is kept pending
+    until flushed. Each state is stamped with the owner of the checkpoint so
+    that clearing it never removes the file of an other process.
+
+    Attributes
+    ----------
+    checkpoint_file: str
+        The path of the checkpoint file
+    min_interval: float
+        The minimum duration between two writes, in seconds
+    _pending: dict
+        The state waiting to be written, None if none
+    _written: int
+        The monotonic point of time of the last write in nanoseconds, None if
+        none
+    _clock: MonotonicClock
+        The clock rate limiting the writes and giving the current time to
+        the resumed timers
+    _owner: str
+        The random token stamping the states written by this checkpoint,
+        the one of the loaded state once a timer is resumed
+
+    Public methods
+    --------------
+    save
+        Save the state of a timer, written now or kept pending.
+    next_write
+        Get the duration until the pending state can be written.
+    flush
+        Write the pending state if allowed by the rate limit.
+    load
+        Get the timer saved in the checkpoint file.
+    clear
+        Remove the checkpoint file if owned and forget the pending state.
+    """
+
+    min_interval = 1.0
+
+    def __init__(self, checkpoint_file: str = 'checkpoint.json',
+                 clock: MonotonicClock = None):
+        """Initialize a checkpoint of a given file.
+
+        Parameters
+        ----------
+        checkpoint_file: str
+            The path of the checkpoint file
+        clock: MonotonicClock, optional
+            The clock rate limiting the writes and giving the current time
+            to the resumed timers, default to the monotonic clock of the
+            system
+        """
+        self.checkpoint_file = checkpoint_file
+        self._pending = None
+        self._written = None
+        self._clock = _monotonic_clock if clock is None else clock
+        self._owner = os.urandom(8).hex()
+
+    def save(self, timer: Timer, label: str = '',
+             paused: bool = False) -> bool:
+        """Save the state of a timer, written now or kept pending.
+
+        Parameters
+        ----------
+        timer: Timer
+            The timer to save, actualized by is_timing_reached if paused
+        label: str
+            The label of the timer, like the name of its preset
+        paused: bool
+            Whether the timer is paused
+
+        Returns
+        -------
+        bool
+            True if written, False if kept pending by the rate limit.
+        """
+        if paused:
+            self._pending = {"label": label,
+                             "remaining": timer._actualized_delta}
+        else:
+            offset = time.time_ns() - timer._clock.now()
+            self._pending = {"label": label,
+                             "deadline": timer._deadline + offset}
+        self._pending["owner"] = self._owner
+        if isinstance(timer, TimerSequence):
+            # The deadline or remaining time is the one of the current step
+            self._pending["sequence"] = {"steps": timer.steps,
+                                         "repeat": timer.repeat,
+                                         "step": timer.step}
+
+        return self.flush()
+
+    def next_write(self):
+        """Get the duration until the pending state can be written.
+
+        Returns
+        -------
+        float or None
+            The duration in seconds, 0 if it can be written now, None if
+            there is no pending state.
+        """
+        if self._pending is None:
+            return None
+        if self._written is None:
+            return 0.0
+
+        next_write = self._written + round(self.min_interval * NS_PER_SECOND)
+        return max(next_write - self._clock.now(), 0) / NS_PER_SECOND
+
+    def flush(self, force: bool = False) -> bool:
+        """Write the pending state if allowed by the rate limit.
+
+        Parameters
+        ----------
+        force: bool
+            Whether to write the pending state whatever the rate limit
+
+        Returns
+        -------
+        bool
+            True if there is no more pending state, else False.
+        """
+        if self._pending is None:
+            return True
+        if not force and self.next_write() > 0:
+            return False
+
+        _write_json_atomically(self.checkpoint_file, self._pending)
+        self._written = self._clock.now()
+        self._pending = None
+        return True
+
+    def load(self, stats: TimerStats = None) -> dict:
+        """Get the timer saved in the checkpoint file.
+
+        The checkpoint takes the ownership of the file, so that it may clear
+        it once the resumed timer ended.
+
+        Parameters
+        ----------
+        stats: TimerStats, optional
+            The instrumentation of the resumed timer
+
+        Returns
+        -------
+        dict
+            The resumed "timer", a TimerSequence if a sequence was saved, its
+            "label" and whether it is "paused", None if there is no
+            checkpoint file. A running timer whose deadline passed in the
+            meantime is resumed as reached.
+
+        Raises
+        ------
+        ValueError
+            If the checkpoint file is invalid.
+        """
+        import json
+
+        try:
+            with open(self.checkpoint_file, 'r') as checkpoint:
+                state = json.load(checkpoint)
+        except FileNotFoundError:
+            return None
+
+        try:
+            paused = state.get("remaining") is not None
+            if paused:
+                remaining = int(state["remaining"])
+            else:
+                remaining = int(state["deadline"]) - time.time_ns()
+
+            sequence = state.get("sequence")
+            if sequence is not None:
+                timer = TimerSequence(sequence["steps"],
+                                      int(sequence["repeat"]), stats,
+                                      self._clock)
+                step = int(sequence["step"])
+                if not 0 <= step < timer.step_count:
+                    raise ValueError("ValueError: step out of the sequence")
+                timer._schedule(step, remaining)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            raise ValueError(f"ValueError: invalid checkpoint file "
+                             f"{self.checkpoint_file}")
+
+        if sequence is None:
+            timer = Timer(stats=stats, clock=self._clock)
+            timer._delta = remaining
+            timer._deadline = self._clock.now() + remaining
+            timer._actualized_delta = remaining
+        self._owner = state.get("owner")
+        return {"timer": timer,
+                "label": str(state.get("label", '')),
+                "paused": paused}
+
+    def _read_owner(self):
+        """Get the owner of the state of the checkpoint file.
+
+        Returns
+        -------
+        str or None
+            The owner token, None if the file doesn't exist, is invalid or
+            has no owner.
+        """
+        import json
+
+        try:
+            with open(self.checkpoint_file, 'r') as checkpoint:
+                return json.load(checkpoint).get("owner")
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def clear(self) -> None:
+        """Remove the checkpoint file if owned and forget the pending state.
+
+        The file is only removed if its state was written or loaded by this
+        checkpoint, an other process having saved its own timer in the
+        meantime keeping its state.
+        """
+        self._pending = None
+        if (os.path.exists(self.checkpoint_file)
+                and self._read_owner() == self._owner):
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.checkpoint_file)
+
+
+# Unique suffixes of the temporary files written by this process
+_temporary_files = itertools.count()
+
+
+def _write_json_atomically(path: str, json_data, replace: bool = True,
+                           json_lines: bool = False) -> None:
+    """Write a JSON file atomically.
+
+    Write the JSON data to a temporary file next to the destination, sync it
+    to the disk then rename it over the destination, so that the destination
+    is either the old or the new complete file, even after a crash.
+
+    Parameters
+    ----------
+    path: str
+        The path of the JSON file to write
+    json_data
+        The JSON serializable data to write
+    replace: bool
+        Replace the destination if it does exist, default True. If False,
+        the destination is left untouched if it does exist.
+    json_lines: bool
+        Write each item of the JSON data list on its own line instead of an
+        indented JSON document, default False.
+    """
+    import json
+
+    temporary_path = f"{path}.{os.getpid()}.{next(_temporary_files)}.tmp"
+    # Permissions of a new file follow the umask, as with open()
+    fd = os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, 'w') as temporary_file:
+            if json_lines:
+                temporary_file.writelines(json.dumps(item) + '\n'
+                                          for item in json_data)
+            else:
+                json.dump(json_data, temporary_file, indent=4)
+            temporary_file.flush()
+            os.fsync(temporary_file.fileno())
+
+        if replace:
+            # Keep the permissions of the replaced file
+            with contextlib.suppress(FileNotFoundError):
+                os.chmod(temporary_path, os.stat(path).st_mode)
+            os.replace(temporary_path, path)
+        else:
+            # Linking fails rather than replacing an existing file
+            with contextlib.suppress(FileExistsError):
+                os.link(temporary_path, path)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temporary_path)
+
+    # Sync the directory entry of the renamed file
+    if os.name == 'posix':
+        directory_fd = os.open(os.path.dirname(path) or '.', os.O_RDONLY)
+        try:
+            os.fsync(directory_fd)
+        finally:
+            os.close(directory_fd)
+
+
+PresetRecord = collections.namedtuple("PresetRecord",
+                                      "name hours minutes seconds")
+PresetRecord.__doc__ = """\
+The name and duration of a timer preset, as held in memory by a PresetStore
+
+Attributes
+----------
+name: str
+    The lowercased name of the preset, interned
+hours: int
+    The hours quantity of the preset
+minutes: int
+    The minutes quantity of the preset
+seconds: int
+    The seconds quantity of the preset
+"""
+
+
+def _preset_record(preset: dict):
+    """Get the in-memory form of a JSON preset object.
+
+    Returns
+    -------
+    PresetRecord or dict
+        The record of a timer preset, the JSON object itself for a sequence
+        preset.
+    """
+    duration = preset.get("duration")
+    if duration is None:
+        return preset
+    return PresetRecord(sys.intern(preset["name"]), duration["hours"],
+                        duration["min"], duration["secs"])
+
+
+def _preset_json(preset) -> dict:
+    """Get the JSON object of a preset held in memory."""
+    if not isinstance(preset, PresetRecord):
+        return preset
+    return {"name": preset.name,
+            "duration": {"hours": preset.hours,
+                         "min": preset.minutes,
+                         "secs": preset.seconds
+                         }
+            }
+
+
+def _sequence_preset(name: str, steps, repeat: int) -> dict:
+    """Get the JSON object of a sequence preset from its steps."""
+    return {"name": name,
+            "sequence": {"steps": [{"label": label,
+                                    "hours": hours,
+                                    "min": minutes,
+                                    "secs": seconds}
+                                   for label, hours, minutes, seconds
+                                   in steps],
+                         "repeat": repeat
+                         }
+            }
+
+
+def _rename_preset(presets: dict, name: str, new_name: str) -> dict:
+    """Rename a preset of a dict of presets keyed by name, keeping its place
+    in the dict order.
+
+    Returns
+    -------
+    dict
+        The presets keyed by name with the renamed preset.
+    """
+    new_name = sys.intern(new_name)
+    renamed = {}
+    for key, preset in presets.items():
+        if key != name:
+            renamed[key] = preset
+        elif isinstance(preset, PresetRecord):
+            renamed[new_name] = preset._replace(name=new_name)
+        else:
+            preset["name"] = new_name
+            renamed[new_name] = preset
+    return renamed
+
+
+class PresetStore:
+    """
+    An in-memory indexed store of the presets of a JSON file
+
+    Load a JSON preset file once into a dict keyed by the lowercased preset
+    name, serve lookups from memory and write each change back to the file.
+    The file is reloaded before an operation only if another process modified
+    it, which is detected by its inode, modification time and size.
+
+    The file is never written in place: a temporary file is written, synced
+    and renamed over it so that a crash can't leave a truncated file. Each
+    change is done under an advisory lock of the file (on Posix systems) so
+    that concurrent processes don't lose each other's changes.
+
+    Next to the timer presets, a preset may be a sequence of timers stored
+    with its steps and number of repetitions instead of a duration, see
+    add_sequence.
+
+    A single store is shared by all the presets using the same file, get it
+    with the open class method. It also chooses the backend according to the
+    file extension among the backends class attribute, the JSON preset file
+    being the default. A backend is a subclass of PresetStore implementing
+    its public methods and the _create class method.
+
+    Attributes
+    ----------
+    backends: dict
+        The preset store classes by preset file extension
+    _preset_file: str
+        The path of the JSON preset file
+    _presets: dict
+        The PresetRecord of each timer preset and the JSON object of each
+        sequence preset keyed by preset name, in the file order
+    _signature: tuple
+        The inode, modification time and size of the file when last loaded
+        or written
+
+    Class methods
+    -------------
+    open
+        Get the shared store of a preset file.
+
+    Public methods
+    --------------
+    add
+        Add a new preset.
+    add_many
+        Add new presets with a single write of the file.
+    get
+        Get the duration of an existing preset.
+    add_sequence
+        Add a new sequence preset.
+    get_sequence
+        Get the steps and repetitions of an existing sequence preset.
+    names
+        Get all existing preset names.
+    items
+        Get all existing timer presets with their duration.
+    delete
+        Delete an existing preset.
+    delete_many
+        Delete existing presets with a single write of the file.
+    rename
+        Rename an existing preset.
+    set_duration
+        Set a new duration to an existing preset.
+    set_durations
+        Set new durations to existing presets with a single write of the file.
+    reload
+        Reload the presets if the file was modified by another process.
+    flush
+        Atomically write the presets to the file.
+    """
+
+    backends = {}
+    _stores = {}
+
+    def __init__(self, preset_file: str):
+        """Initialize a store and load the presets from a JSON file.
+
+        Parameters
+        ----------
+        preset_file: str
+            The path of the JSON preset file
+
+        Raises
+        ------
+        FileNotFoundError
+            If the preset file does not exist.
+        """
+        self._preset_file = preset_file
+        self._presets = {}
+        self._signature = None
+        self.reload()
+
+    @classmethod
+    def open(cls, preset_file: str = 'preset.json',
+             create: bool = True) -> 'PresetStore':
+        """Get the shared store of a preset file.
+
+        Parameters
+        ----------
+        preset_file: str
+            The path of the JSON preset file
+        create: bool
+            Create an empty preset file if it does not exist, default True.
+
+        Returns
+        -------
+        PresetStore
+            The store of the preset file, up to date with the file content.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the preset file does not exist and create is False.
+        """
+        path = os.path.abspath(preset_file)
+        extension = os.path.splitext(path)[1].lower()
+        backend = cls.backends.get(extension, PresetStore)
+
+        # If the preset file doesn't exist, create it
+        if create and not os.path.exists(path):
+            backend._create(path)
+
+        store = cls._stores.get(path)
+        if store is None:
+            store = cls._stores[path] = backend(path)
+        else:
+            store.reload()
+
+        return store
+
+    @classmethod
+    def _create(cls, path: str) -> None:
+        """Create an empty preset file if it does not exist."""
+        _write_json_atomically(path, [], replace=False)
+
+    def __len__(self) -> int:
+        """The number of existing presets."""
+        return len(self._presets)
+
+    def __contains__(self, name: str) -> bool:
+        """Check whether a preset name does exist."""
+        return name.lower() in self._presets
+
+    def _stat(self) -> tuple:
+        """Get the inode, modification time and size of the preset file."""
+        stat = os.stat(self._preset_file)
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """Hold an exclusive advisory lock of the preset file.
+
+        The lock is taken on the file itself. Since the file is replaced on
+        each write, the lock is taken again if the file got replaced while
+        waiting for it.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the preset file does not exist.
+        """
+        if fcntl is None:
+            yield
+            return
+
+        while True:
+            fd = os.open(self._preset_file, os.O_RDONLY)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                if os.fstat(fd).st_ino == os.stat(self._preset_file).st_ino:
+                    break
+            except BaseException:
+                os.close(fd)
+                raise
+            os.close(fd)
+
+        try:
+            yield
+        finally:
+            # Closing the file descriptor releases the lock
+            os.close(fd)
+
+    def reload(self) -> None:
+        """Reload the presets if the file was modified by another process.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the preset file does not exist.
+        """
+        signature = self._stat()
+        if signature == self._signature:
+            return
+
+        self._load(signature)
+        self._signature = signature
+
+    def _load(self, signature: tuple) -> None:
+        """Load the presets from the file.
+
+        Parameters
+        ----------
+        signature: tuple
+            The inode, modification time and size of the file to load.
+        """
+        import json
+
+        with open(self._preset_file, 'r') as preset_file_read:
+            json_data = json.load(preset_file_read)
+
+        # The names of the keys and of the records are the same interned
+        # strings
+        self._presets = {sys.intern(preset["name"]): _preset_record(preset)
+                         for preset in json_data}
+
+    def _commit(self, records: list) -> None:
+        """Save changes already applied to the presets in memory.
+
+        Called with the lock of the file held.
+
+        Parameters
+        ----------
+        records: list[dict]
+            The changes as journal records, see PresetJournal.
+        """
+        self.flush()
+
+    def flush(self) -> None:
+        """Atomically write the presets to the file."""
+        try:
+            _write_json_atomically(self._preset_file,
+                                   [_preset_json(preset) for preset
+                                    in self._presets.values()])
+        except BaseException:
+            # Force a reload, the memory may not match the file anymore
+            self._signature = None
+            raise
+
+        self._signature = self._stat()
+
+    def add(self, name: str, hours: int, minutes: int, seconds: int) -> dict:
+        """Add a new preset.
+
+        Returns
+        -------
+        preset: dict
+            The name and duration of the new added preset.
+
+        Raises
+        ------
+        ValueError
+            If the preset does already exist.
+        """
+        return self.add_many([(name, hours, minutes, seconds)])[0]
+
+    def add_many(self, presets, sequences=()) -> list:
+        """Add new presets with a single write of the file.
+
+        Either all the presets are added or none of them.
+
+        Parameters
+        ----------
+        presets: iterable of tuple
+            The name, hours, minutes and seconds of each preset to add.
+        sequences: iterable of tuple
+            The name and the program of each sequence preset to add, as
+            returned by sequences, default to none.
+
+        Returns
+        -------
+        added: list[dict]
+            The name and duration, or sequence, of each new added preset.
+
+        Raises
+        ------
+        ValueError
+            If a preset does already exist or is given twice.
+        """
+        added = {}
+        for name, hours, minutes, seconds in presets:
+            name = sys.intern(name.lower())
+            if name in added:
+                raise ValueError(f"ValueError: duplicated preset {name}")
+            added[name] = PresetRecord(name, hours, minutes, seconds)
+        for name, program in sequences:
+            name = name.lower()
+            if name in added:
+                raise ValueError(f"ValueError: duplicated preset {name}")
+            added[name] = _sequence_preset(name, program["steps"],
+                                           program["repeat"])
+
+        with self._locked():
+            self.reload()
+            for name in added:
+                if name in self._presets:
+                    raise ValueError("ValueError: already existing preset")
+
+            self._presets.update(added)
+            added = [_preset_json(preset) for preset in added.values()]
+            self._commit([dict(preset, op="add") for preset in added])
+
+        return added
+
+    def get(self, name: str) -> dict:
+        """Get the duration of an existing preset.
+
+        Returns
+        -------
+        timer_values: dict
+            The duration (hours, minutes and seconds) of the existing preset.
+
+        Raises
+        ------
+        ValueError
+            If the preset does not exist.
+        """
+        self.reload()
+        preset = self._presets.get(name.lower())
+        if not isinstance(preset, PresetRecord):
+            raise ValueError("ValueError: Preset not found")
+
+        return {"hours": preset.hours,
+                "minutes": preset.minutes,
+                "seconds": preset.seconds}
+
+    def add_sequence(self, name: str, steps, repeat: int = 1) -> dict:
+        """Add a new sequence preset.
+
+        Parameters
+        ----------
+        name: str
+            The name of the sequence preset
+        steps: iterable of tuple
+            The label, hours, minutes and seconds of each step
+        repeat: int
+            The number of times to run the steps
+
+        Returns
+        -------
+        preset: dict
+            The name, steps and repetitions of the new added preset.
+
+        Raises
+        ------
+        ValueError
+            If the preset does already exist.
+        """
+        name = name.lower()
+        preset = _sequence_preset(name, steps, repeat)
+
+        with self._locked():
+            self.reload()
+            if name in self._presets:
+                raise ValueError("ValueError: already existing preset")
+
+            self._presets[name] = preset
+            self._commit([dict(preset, op="add")])
+
+        return preset
+
+    def get_sequence(self, name: str) -> dict:
+        """Get the steps and repetitions of an existing sequence preset.
+
+        Returns
+        -------
+        program: dict
+            The "steps", a list of label, hours, minutes and seconds tuples,
+            and the "repeat" number of the sequence, as taken by
+            TimerSequence.
+
+        Raises
+        ------
+        ValueError
+            If the sequence preset does not exist.
+        """
+        self.reload()
+        preset = self._presets.get(name.lower())
+        if preset is None or isinstance(preset, PresetRecord):
+            raise ValueError("ValueError: Sequence not found")
+
+        sequence = preset["sequence"]
+        return {"steps": [(step["label"], step["hours"], step["min"],
+                           step["secs"])
+                          for step in sequence["steps"]],
+                "repeat": sequence["repeat"]}
+
+    def names(self, prefix: str = '') -> list:
+        """Get existing preset names, lowercased, in the file order.
+
+        Parameters
+        ----------
+        prefix: str
+            Only get the names starting with this prefix, default all.
+        """
+        self.reload()
+        if not prefix:
+            return list(self._presets)
+
+        prefix = prefix.lower()
+        return [name for name in self._presets if name.startswith(prefix)]
+
+    def items(self) -> list:
+        """Get all existing timer presets in the file order.
+
+        Returns
+        -------
+        presets: list[PresetRecord]
+            The name, hours, minutes and seconds of each existing timer
+            preset, the sequence presets being left out.
+        """
+        self.reload()
+        return [preset for preset in self._presets.values()
+                if isinstance(preset, PresetRecord)]
+
+    def sequences(self) -> list:
+        """Get all existing sequence presets in the file order.
+
+        Returns
+        -------
+        sequences: list[tuple]
+            The name and the program of each existing sequence preset, as
+            returned by get_sequence.
+        """
+        return [(name, self.get_sequence(name)) for name in self.names()
+                if not isinstance(self._presets[name], PresetRecord)]
+
+    def delete(self, name: str) -> bool:
+        """Delete an existing preset.
 
+        Raises
+        ------
+        ValueError
+            If the preset does not exist.
+        """
+        return self.delete_many([name])
 
-class Timer:
+    def delete_many(self, names) -> bool:
+        """Delete existing presets with a single write of the file.
+
+        Either all the presets are deleted or none of them.
+
+        Parameters
+        ----------
+        names: iterable of str
+            The names of the presets to delete.
+
+        Returns
+        -------
+        bool
+            True if the presets got deleted.
+
+        Raises
+        ------
+        ValueError
+            If a preset does not exist.
+        """
+        names = {name.lower() for name in names}
+        with self._locked():
+            self.reload()
+            if not names <= self._presets.keys():
+                raise ValueError("ValueError: Preset not found")
+
+            for name in names:
+                del self._presets[name]
+            self._commit([{"op": "delete", "name": name} for name in names])
+
+        return True
+
+    def rename(self, name: str, new_name: str) -> bool:
+        """Rename an existing preset, keeping its place in the file.
+
+        Raises
+        ------
+        ValueError
+            If the preset to rename does not exist.
+        ValueError
+            If the new name corresponds to an existing preset.
+        """
+        name = name.lower()
+        new_name = new_name.lower()
+        with self._locked():
+            self.reload()
+            if name not in self._presets:
+                raise ValueError("ValueError: Preset not found")
+            if new_name in self._presets:
+                raise ValueError("ValueError: already existing preset")
+
+            self._presets = _rename_preset(self._presets, name, new_name)
+            self._commit([{"op": "rename",
+                           "name": name,
+                           "new_name": new_name}])
+
+        return True
+
+    def set_duration(self, name: str,
+                     hours: int, minutes: int, seconds: int) -> bool:
+        """Set a new duration to an existing preset.
+
+        Raises
+        ------
+        ValueError
+            If the preset does not exist.
+        """
+        return self.set_durations([(name, hours, minutes, seconds)])
+
+    def set_durations(self, durations) -> bool:
+        """Set new durations to existing presets with a single write of the
+        file.
+
+        Either all the durations are changed or none of them.
+
+        Parameters
+        ----------
+        durations: iterable of tuple
+            The name, new hours, minutes and seconds of each preset.
+
+        Returns
+        -------
+        bool
+            True if the durations got changed.
+
+        Raises
+        ------
+        ValueError
+            If a preset does not exist.
+        """
+        durations = [(name.lower(), hours, minutes, seconds)
+                     for name, hours, minutes, seconds in durations]
+        with self._locked():
+            self.reload()
+            for name, *_ in durations:
+                if not isinstance(self._presets.get(name), PresetRecord):
+                    raise ValueError("ValueError: Preset not found")
+
+            records = []
+            for name, hours, minutes, seconds in durations:
+                self._presets[name] = self._presets[name]._replace(
+                    hours=hours, minutes=minutes, seconds=seconds)
+                records.append({"op": "set_duration",
+                                "name": name,
+                                "duration": {"hours": hours,
+                                             "min": minutes,
+                                             "secs": seconds}})
+            self._commit(records)
+
+        return True
+
+
+class PresetJournal(PresetStore):
     """
-    Simple timer printing as HH:MM:SS.n
+    An append-only journal of presets
 
-    Allow to launch a given timer, check remaining time before 00:00:00, check
-    wether timing is reached and get the current timing along the process.
+    A preset store backend which appends each change (add, delete, rename,
+    set_duration) as a JSON line record to the file instead of rewriting all
+    the presets, so that a change costs the same whatever the number of
+    presets. The presets are rebuilt by replaying the records, only the new
+    records being replayed when another process appended some.
+
+    Once the journal has grown past a threshold and holds more than twice as
+    many records as presets, it is compacted by atomically replacing it with
+    a single add record per preset. A record torn by a crash at the end of
+    the file is ignored and overwritten by the next change.
 
     Attributes
     ----------
-    _base: datetime
-        The time at timer launch to be kept as a comparison base to
-        calculate the time passed
-    _actualization: datetime
-        The current time to be updated along the timer
-    _delta: timedelta
-        The timer duration
-    _actualized_delta: timedelta
-        The actualized duration according to time passed to be updated along
-        the timer
-    get_timing: str
-        The actual remaining time to reach 00:00:00 for a launched timer.
+    compact_threshold: int
+        The number of records from which the journal may be compacted
+    _offset: int
+        The end of the last complete record read or written, in bytes
+    _records: int
+        The number of records in the journal
 
     Public methods
     --------------
-    is_timing_reached
-        Check if timing reached 00:00:00.
-    continue_after_pause
-        Actualize timer parameters to continue timing after a pause.
+    flush
+        Compact the journal to a single record per preset.
     """
 
-    def __init__(self, hours: int = 0, minutes: int = 0, seconds: int = 0):
-        """Create and launch a given timer.
+    compact_threshold = 1000
+
+    @classmethod
+    def _create(cls, path: str) -> None:
+        """Create an empty journal if it does not exist."""
+        _write_json_atomically(path, [], replace=False, json_lines=True)
+
+    def __init__(self, preset_file: str):
+        """Initialize a journal and replay the records of its file.
 
         Parameters
         ----------
-        hours: int
-            The hours quantity of the timer
-        minutes: int
-            The minutes quantity of the timer
-        seconds: int
-            The seconds quantity of the timer
+        preset_file: str
+            The path of the JSON lines journal
+
+        Raises
+        ------
+        FileNotFoundError
+            If the journal does not exist.
         """
-        self._base = datetime.now()
-        self._actualization = datetime(self._base.year,
-                                       self._base.month,
-                                       self._base.day,
-                                       self._base.hour,
-                                       self._base.minute,
-                                       self._base.second,
-                                       self._base.microsecond)
-        self._delta = timedelta(hours=+hours,
-                                minutes=+minutes,
-                                seconds=+seconds)
-        self._actualized_delta = timedelta(hours=+hours,
-                                           minutes=+minutes,
-                                           seconds=+seconds)
+        self._offset = 0
+        self._records = 0
+        PresetStore.__init__(self, preset_file)
 
-    def _convert_delta_to_datetime(self) -> datetime:
-        """Convert the base timedelta object to a datetime object allowing
-        arithmetic on it.
+    def _apply(self, record: dict) -> None:
+        """Apply a journal record to the presets in memory."""
+        operation = record["op"]
+        if operation == "add":
+            # A timer preset with its duration or a sequence preset
+            preset = dict(record)
+            del preset["op"]
+            self._presets[sys.intern(record["name"])] = _preset_record(preset)
+        elif operation == "delete":
+            self._presets.pop(record["name"], None)
+        elif operation == "rename":
+            self._presets = _rename_preset(self._presets,
+                                           record["name"],
+                                           record["new_name"])
+        elif operation == "set_duration":
+            duration = record["duration"]
+            self._presets[record["name"]] = self._presets[
+                record["name"]]._replace(hours=duration["hours"],
+                                         minutes=duration["min"],
+                                         seconds=duration["secs"])
 
-        Returns
-        -------
-        datetime
-            Exact point of time to reach 00:00:00.
+    def _load(self, signature: tuple) -> None:
+        """Replay the records of the journal.
+
+        Only replay the records appended since the last load if the journal
+        was neither replaced nor truncated, else replay all of them.
         """
-        return self._base + self._delta
+        import json
 
-    def _rebase_current_time(self) -> None:
-        """Actualize timing according to current time.
+        if (self._signature is None
+                or signature[0] != self._signature[0]
+                or signature[2] < self._offset):
+            self._presets = {}
+            self._offset = 0
+            self._records = 0
 
-        Set the actual exact point of time since timer launch.
-        Set the actual delta since timer launch.
+        with open(self._preset_file, 'rb') as journal_read:
+            journal_read.seek(self._offset)
+            for line in journal_read:
+                if not line.endswith(b'\n'):
+                    # Torn record
+                    break
+                self._apply(json.loads(line))
+                self._offset += len(line)
+                self._records += 1
+
+    def _commit(self, records: list) -> None:
+        """Append records to the journal and compact it if needed.
+
+        Called with the lock of the file held and the journal reloaded.
         """
-        self._actualization = datetime.now()
-        self._actualized_delta = (self._convert_delta_to_datetime()
-                                  - self._actualization)
+        import json
 
-    def is_timing_reached(self) -> bool:
-        """Check if timing reached 00:00:00.
+        try:
+            with open(self._preset_file, 'r+b') as journal_write:
+                # Overwrite a torn record if any
+                journal_write.truncate(self._offset)
+                journal_write.seek(self._offset)
+                journal_write.write(b''.join(
+                    json.dumps(record).encode() + b'\n'
+                    for record in records))
+                journal_write.flush()
+                os.fsync(journal_write.fileno())
+                self._offset = journal_write.tell()
+        except BaseException:
+            # Force a full replay, the memory may not match the file anymore
+            self._signature = None
+            raise
 
-        Returns
-        -------
-        bool
-            True if timing reached 00:00:00, else False.
+        self._records += len(records)
+        self._signature = self._stat()
+
+        if (self._records > self.compact_threshold
+                and self._records > 2 * len(self._presets)):
+            self.flush()
+
+    def flush(self) -> None:
+        """Compact the journal to a single add record per preset."""
+        records = [dict(_preset_json(preset), op="add")
+                   for preset in self._presets.values()]
+        try:
+            _write_json_atomically(self._preset_file, records,
+                                   json_lines=True)
+        except BaseException:
+            self._signature = None
+            raise
+
+        self._signature = self._stat()
+        self._offset = self._signature[2]
+        self._records = len(records)
+
+
+class SQLitePresetStore(PresetStore):
+    """
+    A SQLite database of presets
+
+    A preset store backend for large shared preset catalogs: presets are
+    rows of a SQLite database with a unique index on the lowercased name, so
+    that a lookup or a change never loads all the presets. The database is in
+    WAL mode so that readers of other processes are not blocked by a writer,
+    and each change is a transaction.
+
+    Attributes
+    ----------
+    _connection: sqlite3.Connection
+        The connection to the database
+    """
+
+    @classmethod
+    def _create(cls, path: str) -> None:
+        """Create an empty database if it does not exist."""
+        import sqlite3
+
+        sqlite3.connect(path).close()
+
+    def __init__(self, preset_file: str):
+        """Initialize a store and its connection to a SQLite database.
+
+        Parameters
+        ----------
+        preset_file: str
+            The path of the SQLite database
+
+        Raises
+        ------
+        FileNotFoundError
+            If the database does not exist.
         """
-        self._rebase_current_time()
-        timing_to_reach = self._convert_delta_to_datetime()
-        return self._actualization >= timing_to_reach
+        import sqlite3
 
-    @property
-    def get_timing(self) -> str:
-        """The actual remaining time to reach 00:00:00.
+        if not os.path.exists(preset_file):
+            raise FileNotFoundError(f"No such preset file: '{preset_file}'")
 
-        Returns
-        -------
-        str
-            The actual remaining time to reach 00:00:00.
+        self._preset_file = preset_file
+        # Transactions are explicitly opened by the changes
+        self._connection = sqlite3.connect(preset_file, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS preset ("
+                                 "id INTEGER PRIMARY KEY, "
+                                 "name TEXT NOT NULL, "
+                                 "hours INTEGER NOT NULL, "
+                                 "minutes INTEGER NOT NULL, "
+                                 "seconds INTEGER NOT NULL)")
+        # Names are stored lowercased
+        self._connection.execute("CREATE UNIQUE INDEX IF NOT EXISTS "
+                                 "preset_name ON preset (name)")
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        """Run changes in a write transaction, rolled back on error."""
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._connection
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+
+    def __len__(self) -> int:
+        """The number of existing presets."""
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM preset").fetchone()[0]
+
+    def __contains__(self, name: str) -> bool:
+        """Check whether a preset name does exist."""
+        return self._connection.execute(
+            "SELECT 1 FROM preset WHERE name = ?",
+            (name.lower(),)).fetchone() is not None
+
+    def reload(self) -> None:
+        """Nothing to reload, the database is always queried."""
+
+    def flush(self) -> None:
+        """Nothing to write, each change is committed to the database."""
+
+    def add_many(self, presets, sequences=()) -> list:
+        """Add new presets in a single transaction.
+
+        Raises
+        ------
+        ValueError
+            If a preset does already exist or is given twice.
+        ValueError
+            If sequence presets are given, as the database has no sequence.
         """
-        return str(self._actualized_delta)
+        import sqlite3
 
-    def continue_after_pause(self) -> None:
-        """Actualize timer parameters to continue timing after a pause.
+        if list(sequences):
+            raise ValueError("ValueError: sequence presets are not supported "
+                             "by SQLite preset files")
+
+        rows = [(name.lower(), hours, minutes, seconds)
+                for name, hours, minutes, seconds in presets]
+        try:
+            with self._transaction() as connection:
+                connection.executemany("INSERT INTO preset (name, hours, "
+                                       "minutes, seconds) VALUES (?, ?, ?, ?)",
+                                       rows)
+        except sqlite3.IntegrityError:
+            raise ValueError("ValueError: already existing preset")
+
+        return [{"name": name,
+                 "duration": {"hours": hours,
+                              "min": minutes,
+                              "secs": seconds
+                              }
+                 }
+                for name, hours, minutes, seconds in rows]
+
+    def get(self, name: str) -> dict:
+        """Get the duration of an existing preset.
+
+        Raises
+        ------
+        ValueError
+            If the preset does not exist.
+        """
+        row = self._connection.execute("SELECT hours, minutes, seconds "
+                                       "FROM preset WHERE name = ?",
+                                       (name.lower(),)).fetchone()
+        if row is None:
+            raise ValueError("ValueError: Preset not found")
 
-        Set the actual exact point of time since timer launch.
-        Set the actual delta since timer launch.
+        return {"hours": row[0], "minutes": row[1], "seconds": row[2]}
+
+    def names(self, prefix: str = '') -> list:
+        """Get existing preset names, lowercased, in the insertion order.
+
+        The prefix is looked up as a range of the name index.
         """
-        self._base = datetime.now()
-        self._delta = self._actualized_delta
+        if not prefix:
+            rows = self._connection.execute("SELECT name FROM preset "
+                                            "ORDER BY id")
+        else:
+            prefix = prefix.lower()
+            upper_bound = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+            rows = self._connection.execute("SELECT name FROM preset "
+                                            "WHERE name >= ? AND name < ? "
+                                            "ORDER BY id",
+                                            (prefix, upper_bound))
+        return [row[0] for row in rows]
+
+    def items(self) -> list:
+        """Get all existing presets in the insertion order."""
+        rows = self._connection.execute("SELECT name, hours, minutes, "
+                                        "seconds FROM preset ORDER BY id")
+        return [PresetRecord(*row) for row in rows]
+
+    def sequences(self) -> list:
+        """Get no sequence preset, as the database has none."""
+        return []
+
+    def delete_many(self, names) -> bool:
+        """Delete existing presets in a single transaction.
+
+        Raises
+        ------
+        ValueError
+            If a preset does not exist.
+        """
+        names = {name.lower() for name in names}
+        with self._transaction() as connection:
+            deleted = connection.executemany("DELETE FROM preset "
+                                             "WHERE name = ?",
+                                             [(name,) for name in names])
+            if deleted.rowcount != len(names):
+                raise ValueError("ValueError: Preset not found")
+
+        return True
+
+    def rename(self, name: str, new_name: str) -> bool:
+        """Rename an existing preset, keeping its place in the order.
+
+        Raises
+        ------
+        ValueError
+            If the preset to rename does not exist.
+        ValueError
+            If the new name corresponds to an existing preset.
+        """
+        import sqlite3
+
+        try:
+            with self._transaction() as connection:
+                renamed = connection.execute("UPDATE preset SET name = ? "
+                                             "WHERE name = ?",
+                                             (new_name.lower(), name.lower()))
+                if renamed.rowcount != 1:
+                    raise ValueError("ValueError: Preset not found")
+        except sqlite3.IntegrityError:
+            raise ValueError("ValueError: already existing preset")
+
+        return True
+
+    def add_sequence(self, name: str, steps, repeat: int = 1) -> dict:
+        """Sequence presets are only stored in JSON preset files.
+
+        Raises
+        ------
+        ValueError
+            Always, as the database has no sequence.
+        """
+        raise ValueError("ValueError: sequence presets are not supported by "
+                         "SQLite preset files")
+
+    def get_sequence(self, name: str) -> dict:
+        """Sequence presets are only stored in JSON preset files.
+
+        Raises
+        ------
+        ValueError
+            Always, as the database has no sequence.
+        """
+        raise ValueError("ValueError: Sequence not found")
+
+    def set_durations(self, durations) -> bool:
+        """Set new durations to existing presets in a single transaction.
+
+        Raises
+        ------
+        ValueError
+            If a preset does not exist.
+        """
+        rows = [(hours, minutes, seconds, name.lower())
+                for name, hours, minutes, seconds in durations]
+        with self._transaction() as connection:
+            updated = connection.executemany("UPDATE preset SET hours = ?, "
+                                             "minutes = ?, seconds = ? "
+                                             "WHERE name = ?", rows)
+            if updated.rowcount != len(rows):
+                raise ValueError("ValueError: Preset not found")
+
+        return True
+
+
+PresetStore.backends.update({'.jsonl': PresetJournal,
+                             '.sqlite': SQLitePresetStore,
+                             '.db': SQLitePresetStore})
 
 
 class Preset:
@@ -167,6 +3428,11 @@ class Preset:
     does exist in this same file (name or duration), delete from the file or
     get to be use as a timer by a Timer object.
 
+    The JSON file is accessed through its shared PresetStore so that it is
+    only parsed again when modified by another process. It is only opened,
+    and created if it doesn't exist, at the first operation on the preset.
+    Its attributes are fixed by __slots__.
+
     Attributes
     ----------
     _name: str
@@ -177,11 +3443,25 @@ class Preset:
         The minutes quantity of the timer preset
     _seconds: int
         The seconds quantity of the timer preset
+    _preset_file: str
+        The path of the JSON preset file
+    _store: PresetStore
+        The store of the JSON preset file, None until the first operation
 
     Class methods
     -------------
     get_all
         Get all existing preset names in preset.json.
+    add_many
+        Add new presets to preset.json with a single write of the file.
+    delete_many
+        Delete existing presets from preset.json with a single write.
+    set_durations
+        Set new durations to existing presets with a single write.
+    add_sequence
+        Add a new sequence preset to preset.json.
+    get_sequence
+        Get the steps and repetitions of an existing sequence preset.
 
     Public methods
     --------------
@@ -197,6 +3477,9 @@ class Preset:
         set a new duration to the preset if exist in the JSON file preset.json.
     """
 
+    __slots__ = ("_name", "_hours", "_minutes", "_seconds", "_preset_file",
+                 "_store")
+
     def __init__(self, name: str,
                  hours: int = 0,
                  minutes: int = 0,
@@ -214,141 +3497,222 @@ class Preset:
             The minutes quantity of the timer preset
         seconds: int
             The seconds quantity of the timer preset
+        preset_file: str
+            The path of the JSON preset file, created if it doesn't exist.
+            A .jsonl file is handled as an append-only journal of presets, a
+            .sqlite or .db file as a SQLite database.
         """
 
         self._name = name.lower()
         self._hours = hours
         self._minutes = minutes
         self._seconds = seconds
-        self._preset_file = preset_file     # Shall be a .json
-        # If the preset file doesn't exist, create it
+        self._preset_file = preset_file     # .json, .jsonl, .sqlite or .db
+        self._store = None
+
+    def _get_store(self) -> PresetStore:
+        """Get the store of the preset file, opened at the first call."""
+        if self._store is None:
+            self._store = PresetStore.open(self._preset_file)
+        return self._store
+
+    def add(self) -> dict:
+        """Add a new preset.
+
+        Check whether the choosen name does exist, if not create the preset,
+        write it in the preset.json file and return the json object added as a
+        dict, if yes raise an exception.
+
+        Returns
+        -------
+        preset_dict_to_append: dict
+            The name and duration of the new added preset.
+
+        Raises
+        ------
+        ValueError
+            If the preset does already exist.
+        """
+
+        return self._get_store().add(self._name,
+                                     self._hours,
+                                     self._minutes,
+                                     self._seconds)
+
+    def get(self) -> dict:
+        """Get an existing preset's duration.
+
+        Check whether the preset name does exist, if not raise an exception, if
+        yes return a dict containing timer values.
+
+        Returns
+        -------
+        timer_values: dict
+            The duration (hours, minutes and seconds) of
+            the existing preset.
+
+        Raises
+        ------
+        ValueError
+            If the preset does not exist.
+        """
+
+        return self._get_store().get(self._name)
+
+    @classmethod
+    def get_all(cls, preset_file='preset.json') -> list:
+        """Get all existing preset names.
+
+        Check whether preset names do exist, if not raise an exception, if
+        yes return a list containing all names.
+
+        Returns
+        -------
+        preset_names: list[str]
+            Preset names capitalized.
+
+        Raises
+        ------
+        ValueError
+            If there is no existing preset.
+        """
+
         try:
-            with open(self._preset_file, 'r'):
-                pass
+            store = PresetStore.open(preset_file, create=False)
         except FileNotFoundError:
-            with open(self._preset_file, 'w') as preset_file_write:
-                json.dump([], preset_file_write, indent=4)
+            return []
+
+        preset_names = [name.capitalize() for name in store.names()]
+        if preset_names == []:
+            raise ValueError("ValueError: No existing preset.")
 
-    def add(self) -> dict:
-        """Add a new preset.
+        return preset_names
 
-        Check whether the choosen name does exist, if not create the preset,
-        write it in the preset.json file and return the json object added as a
-        dict, if yes raise an exception.
+    @classmethod
+    def add_many(cls, presets, preset_file='preset.json') -> list:
+        """Add new presets with a single write of the JSON file.
+
+        Check whether one of the choosen names does exist, if not add all the
+        presets, if yes raise an exception without adding any.
+
+        Parameters
+        ----------
+        presets: iterable of tuple
+            The name, hours, minutes and seconds of each preset to add.
 
         Returns
         -------
-        preset_dict_to_append: dict
-            The name and duration of the new added preset.
+        list[dict]
+            The name and duration of each new added preset.
 
         Raises
         ------
         ValueError
-            If the preset does already exist.
+            If a preset does already exist or is given twice.
         """
 
-        # Create a data set to be inclued, preset name is lowercased
-        # Check wether the name already exist
-        try:
-            self.get()
-        except ValueError:
-            # Prepare the set in a dict to be added as a json object
-            preset_dict_to_append = {"name": self._name,
-                                     "duration": {"hours": self._hours,
-                                                  "min": self._minutes,
-                                                  "secs": self._seconds
-                                                  }
-                                     }
-            # Open the json preset file to add the new preset
-            with open(self._preset_file, 'r') as preset_file_read:
-                # Load json presets to be modified
-                json_data = json.load(preset_file_read)
-                with open(self._preset_file, 'w') as preset_file_write:
-                    # Append the new json object
-                    json_data.append(preset_dict_to_append)
-                    json.dump(json_data, preset_file_write, indent=4)
-
-            return preset_dict_to_append
-        else:
-            raise ValueError("ValueError: already existing preset")
+        return PresetStore.open(preset_file).add_many(presets)
 
-    def get(self) -> dict:
-        """Get an existing preset's duration.
+    @classmethod
+    def delete_many(cls, names, preset_file='preset.json') -> bool:
+        """Delete existing presets with a single write of the JSON file.
 
-        Check whether the preset name does exist, if not raise an exception, if
-        yes return a dict containing timer values.
+        Check whether all the preset names do exist, if not raise an
+        exception without deleting any, if yes delete all of them.
+
+        Parameters
+        ----------
+        names: iterable of str
+            The names of the presets to delete.
 
         Returns
         -------
-        timer_values: dict
-            The duration (hours, minutes and seconds) of
-            the existing preset.
+        bool
+            True if the presets got deleted.
 
         Raises
         ------
         ValueError
-            If the preset does not exist.
+            If a preset does not exist.
         """
 
-        timer_values = {"hours": None,
-                             "minutes": None,
-                             "seconds": None}
+        return PresetStore.open(preset_file).delete_many(names)
 
-        # Open the json preset file to search for the existing preset
-        with open(self._preset_file, 'r') as preset_file_read:
-            # Load json presets to be modified
-            json_data = json.load(preset_file_read)
-            for preset in json_data:
-                # Search if the preset does exist
-                if preset["name"] == self._name:
-                    # Get the preset's timing
-                    timer_values["hours"] = preset["duration"]["hours"]
-                    timer_values["minutes"] = preset["duration"]["min"]
-                    timer_values["seconds"] = preset["duration"]["secs"]
-
-        if (timer_values["hours"] or
-                timer_values["minutes"] or
-                timer_values["seconds"]) is None:
-            raise ValueError("ValueError: Preset not found")
+    @classmethod
+    def set_durations(cls, durations, preset_file='preset.json') -> bool:
+        """Set new durations with a single write of the JSON file.
+
+        Check whether all the preset names do exist, if not raise an
+        exception without changing any, if yes update all the durations.
+
+        Parameters
+        ----------
+        durations: iterable of tuple
+            The name, new hours, minutes and seconds of each preset.
+
+        Returns
+        -------
+        bool
+            True if the durations got changed.
+
+        Raises
+        ------
+        ValueError
+            If a preset does not exist.
+        """
 
-        return timer_values
+        return PresetStore.open(preset_file).set_durations(durations)
 
     @classmethod
-    def get_all(cls, preset_file='preset.json') -> list:
-        """Get all existing preset names.
+    def add_sequence(cls, name: str, steps, repeat: int = 1,
+                     preset_file='preset.json') -> dict:
+        """Add a new sequence preset.
 
-        Check whether preset names do exist, if not raise an exception, if
-        yes return a list containing all names.
+        Check whether the choosen name does exist, if not add a preset
+        running the given steps one after the other, repeat times, if yes
+        raise an exception. A sequence preset is renamed or deleted like any
+        other preset.
+
+        Parameters
+        ----------
+        name: str
+            The name of the sequence preset
+        steps: iterable of tuple
+            The label, hours, minutes and seconds of each step
+        repeat: int
+            The number of times to run the steps
 
         Returns
         -------
-        preset_names: list[str]
-            Preset names capitalized.
+        dict
+            The name, steps and repetitions of the new added preset.
 
         Raises
         ------
         ValueError
-            If there is no existing preset.
+            If the preset does already exist or the preset file is a SQLite
+            database.
         """
 
-        preset_names = []
+        return PresetStore.open(preset_file).add_sequence(name, steps, repeat)
 
-        try:
-            # Open the json preset file to search for the existing preset
-            with open(preset_file, 'r') as preset_file_read:
-                # Load json presets to be modified
-                json_data = json.load(preset_file_read)
-                for preset in json_data:
-                    # Add each existing preset name to the list
-                    preset_names.append(preset["name"].capitalize())
+    @classmethod
+    def get_sequence(cls, name: str, preset_file='preset.json') -> dict:
+        """Get the steps and repetitions of an existing sequence preset.
 
-            if preset_names == []:
-                raise ValueError("ValueError: No existing preset.")
+        Returns
+        -------
+        dict
+            The "steps" and "repeat" number of the sequence, to be run by a
+            TimerSequence.
 
-        except FileNotFoundError:
-            pass
+        Raises
+        ------
+        ValueError
+            If the sequence preset does not exist.
+        """
 
-        return preset_names
+        return PresetStore.open(preset_file).get_sequence(name)
 
     def delete(self) -> bool:
         """Delete an existing preset.
@@ -367,26 +3731,7 @@ class Preset:
             If the preset does not exist.
         """
 
-        # Check wether the preset exist
-        # If not raise the corresponding exception
-        try:
-            self.get()
-        except ValueError as exception:
-            raise exception
-
-        # Open the json preset file to search for the existing preset to delete
-        with open(self._preset_file, 'r') as preset_file_read:
-            # Load json presets to be modified
-            json_data = json.load(preset_file_read)
-            for preset in json_data:
-                # Search for the preset to delete
-                if preset["name"] == self._name:
-                    # Delete the preset
-                    json_data.remove(preset)
-                    with open(self._preset_file, 'w') as preset_file_write:
-                        # Append the modified json object
-                        json.dump(json_data, preset_file_write, indent=4)
-                    return True
+        return self._get_store().delete(self._name)
 
     def rename(self, new_name: str) -> bool:
         """Rename an existing preset.
@@ -413,30 +3758,7 @@ class Preset:
             If the given new name corresponds to an existing preset.
         """
 
-        # Check wether the preset exist and if the new name is available
-        try:
-            self.get()
-        except ValueError as exception:
-            raise exception
-        try:
-            self.new_name = Preset(name=new_name, preset_file=self._preset_file)
-            self.new_name.get()
-        except ValueError:
-            # Open the json preset file to search for the preset to rename
-            with open(self._preset_file, 'r') as preset_file_read:
-                # Load json presets to be modified
-                json_data = json.load(preset_file_read)
-                for preset in json_data:
-                    # Search for the preset name
-                    if preset["name"] == self._name:
-                        # Rename it if found
-                        preset["name"] = new_name.lower()
-                        with open(self._preset_file, 'w') as preset_file_write:
-                            # Append the modified json object
-                            json.dump(json_data, preset_file_write, indent=4)
-                        return True
-        else:
-            raise ValueError("ValueError: already existing preset")
+        return self._get_store().rename(self._name, new_name)
 
     def set_duration(self, hours: int, minutes: int, seconds: int) -> bool:
         """
@@ -464,31 +3786,322 @@ class Preset:
             If the preset does not exist.
         """
 
-        # Check wether the preset exist
-        try:
-            self.get()
-        except ValueError as exception:
-            raise exception
-
+        modified = self._get_store().set_duration(self._name,
+                                                  hours,
+                                                  minutes,
+                                                  seconds)
         self._hours = hours
         self._minutes = minutes
         self._seconds = seconds
 
-        # Open the json preset file to search for the preset to modify
-        with open(self._preset_file, 'r') as preset_file_read:
-            # Load json presets to be modified
-            json_data = json.load(preset_file_read)
-            for preset in json_data:
-                # Search for the preset name
-                if preset["name"] == self._name:
-                    # Get the preset's timing
-                    preset["duration"]["hours"] = self._hours
-                    preset["duration"]["min"] = self._minutes
-                    preset["duration"]["secs"] = self._seconds
-                    with open(self._preset_file, 'w') as preset_file_write:
-                        # Append the modified json object
-                        json.dump(json_data, preset_file_write, indent=4)
-                    return True
+        return modified
+
+
+def import_presets(stream, preset_format: str = 'json',
+                   preset_file: str = 'preset.json') -> int:
+    """Import presets from a JSON or CSV stream.
+
+    The JSON format is the one of the preset file: a list of objects with a
+    "name" and a "duration" object with "hours", "min" and "secs" values.
+    The CSV format has a header line and name, hours, minutes and seconds
+    columns. All the presets are added with a single write of the preset
+    file, or none if one of them does already exist.
+
+    Parameters
+    ----------
+    stream: file object
+        The text stream to read the presets from
+    preset_format: str
+        "json" or "csv"
+    preset_file: str
+        The path of the JSON preset file to import into
+
+    Returns
+    -------
+    int
+        The number of imported presets.
+
+    Raises
+    ------
+    ValueError
+        If the stream is malformed or a preset does already exist.
+    """
+    import csv
+    import json
+
+    presets = []
+    try:
+        if preset_format == 'csv':
+            for row in csv.DictReader(stream):
+                presets.append((row["name"],
+                                int(row.get("hours") or 0),
+                                int(row.get("minutes") or 0),
+                                _round_seconds(row.get("seconds") or 0)))
+        else:
+            for preset in json.load(stream):
+                duration = preset["duration"]
+                presets.append((preset["name"],
+                                int(duration.get("hours", 0)),
+                                int(duration.get("min", 0)),
+                                _round_seconds(duration.get("secs", 0))))
+    except (KeyError, TypeError, AttributeError, csv.Error) as error:
+        raise ValueError(f"ValueError: malformed presets ({error!r})")
+
+    Preset.add_many(presets, preset_file)
+    return len(presets)
+
+
+def export_presets(stream, preset_format: str = 'json',
+                   preset_file: str = 'preset.json') -> int:
+    """Export all existing presets to a JSON or CSV stream.
+
+    The formats are the ones read by import_presets.
+
+    Parameters
+    ----------
+    stream: file object
+        The text stream to write the presets to
+    preset_format: str
+        "json" or "csv"
+    preset_file: str
+        The path of the JSON preset file to export from
+
+    Returns
+    -------
+    int
+        The number of exported presets.
+    """
+    import csv
+    import json
+
+    try:
+        presets = PresetStore.open(preset_file, create=False).items()
+    except FileNotFoundError:
+        presets = []
+
+    if preset_format == 'csv':
+        writer = csv.writer(stream, lineterminator="\n")
+        writer.writerow(("name", "hours", "minutes", "seconds"))
+        writer.writerows(presets)
+    else:
+        json.dump([{"name": name,
+                    "duration": {"hours": hours,
+                                 "min": minutes,
+                                 "secs": seconds
+                                 }
+                    }
+                   for name, hours, minutes, seconds in presets],
+                  stream, indent=4)
+        stream.write('\n')
+
+    return len(presets)
+
+
+def migrate_presets(source_file: str, destination_file: str) -> int:
+    """Copy all the presets of a preset file to an other one.
+
+    Each file is handled by the backend corresponding to its extension, so
+    that presets can be migrated for instance from the JSON preset file to a
+    SQLite database. The timer and sequence presets are all added with a
+    single write of the destination, or none of them if one does already
+    exist in it or if it can't store the sequence presets.
+
+    Parameters
+    ----------
+    source_file: str
+        The path of the preset file to copy the presets from
+    destination_file: str
+        The path of the preset file to copy the presets to, created if it
+        doesn't exist
+
+    Returns
+    -------
+    int
+        The number of migrated presets.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the source preset file does not exist.
+    ValueError
+        If a preset does already exist in the destination.
+    ValueError
+        If the source has sequence presets and the destination is a SQLite
+        database, which has no sequence.
+    """
+    source = PresetStore.open(source_file, create=False)
+    presets = source.items()
+    sequences = source.sequences()
+    PresetStore.open(destination_file).add_many(presets, sequences)
+    return len(presets) + len(sequences)
+
+
+# Nanoseconds of the units of the compact and ISO 8601 duration grammars,
+# in decreasing order
+_DURATION_UNITS = {"w": 7 * 86400 * NS_PER_SECOND,
+                   "d": 86400 * NS_PER_SECOND,
+                   "h": 3600 * NS_PER_SECOND,
+                   "m": 60 * NS_PER_SECOND,
+                   "s": NS_PER_SECOND,
+                   "ms": NS_PER_SECOND // 1000}
+_DURATION_RANKS = {unit: rank for rank, unit in enumerate(_DURATION_UNITS)}
+
+# Units of the date and time parts of the ISO 8601 grammar
+_ISO_DATE_UNITS = ("w", "d")
+_ISO_TIME_UNITS = ("h", "m", "s")
+
+
+@functools.lru_cache(maxsize=128)
+def parse_duration(duration: str) -> int:
+    """Parse a duration like 1h30m, 250ms, 2d, 00:01:30.5 or PT1M30S.
+
+    The duration is read in a single pass, in one of the following forms,
+    the results of repeated inputs being memoized:
+
+    - compact: numbers followed by w, d, h, m, s or ms in decreasing order,
+      e.g. 1h30m, 90s, 1d12h or 250ms
+    - clock: [[hours:]minutes:]seconds, e.g. 00:01:30.5, 1:30, 90 or
+      36:00:00
+    - ISO 8601: P followed by numbers with W or D, then T followed by
+      numbers with H, M or S, e.g. PT1M30S, P2D or P1DT12H
+
+    Only the last number may have a decimal fraction, the minutes and
+    seconds of the clock form being lower than 60 when preceded by an other
+    number.
+
+    Parameters
+    ----------
+    duration: str
+        The duration to parse, case insensitive
+
+    Returns
+    -------
+    int
+        The duration in nanoseconds.
+
+    Raises
+    ------
+    ValueError
+        If the duration doesn't match the grammar.
+    """
+    text = duration.strip().lower()
+    iso = text.startswith("p")
+    index = 1 if iso else 0
+    length = len(text)
+    if index == length or text.endswith("t"):
+        raise ValueError(f"ValueError: invalid duration {duration!r}")
+
+    total = 0
+    unit_rank = None    # Rank of the last unit read in _DURATION_UNITS
+    clock = []          # Numbers of the clock form
+    fractional = False  # Whether a fraction was read, only allowed last
+    iso_units = _ISO_DATE_UNITS
+    while index < length:
+        # Switch to the time part of the ISO 8601 form
+        if iso and text[index] == "t" and iso_units is _ISO_DATE_UNITS:
+            iso_units = _ISO_TIME_UNITS
+            index += 1
+
+        # Read a number with an optional decimal fraction
+        start = index
+        while index < length and "0" <= text[index] <= "9":
+            index += 1
+        integer = text[start:index]
+        fraction = ""
+        if index < length and text[index] in ".,":
+            index += 1
+            start = index
+            while index < length and "0" <= text[index] <= "9":
+                index += 1
+            fraction = text[start:index]
+        if fractional or not (integer or fraction):
+            raise ValueError(f"ValueError: invalid duration {duration!r}")
+        fractional = bool(fraction)
+
+        # Read its unit or separator
+        separator = text[index] if index < length else ""
+        index += 1
+        if separator == "m" and not iso and text.startswith("s", index):
+            separator = "ms"
+            index += 1
+        if (separator in _DURATION_UNITS and not clock
+                and (not iso or separator in iso_units)):
+            rank = _DURATION_RANKS[separator]
+            if unit_rank is not None and rank <= unit_rank:
+                raise ValueError(f"ValueError: invalid duration {duration!r}")
+            unit_rank = rank
+            unit = _DURATION_UNITS[separator]
+        elif separator in (":", "") and not iso and unit_rank is None:
+            clock.append((integer, fraction))
+            continue
+        else:
+            raise ValueError(f"ValueError: invalid duration {duration!r}")
+
+        # Nanoseconds beyond the ninth decimal are truncated
+        fraction = fraction[:9]
+        total += int(integer or 0) * unit
+        if fraction:
+            total += int(fraction) * unit // 10 ** len(fraction)
+
+    if clock:
+        if len(clock) > 3 or text.endswith(":"):
+            raise ValueError(f"ValueError: invalid duration {duration!r}")
+        # Seconds first, the units of the clock form in increasing order
+        for position, (integer, fraction) in enumerate(reversed(clock)):
+            unit = 60 ** position * NS_PER_SECOND
+            value = int(integer or 0)
+            if position < len(clock) - 1 and value >= 60:
+                raise ValueError(f"ValueError: invalid duration {duration!r}")
+            fraction = fraction[:9]
+            total += value * unit
+            if fraction:
+                total += int(fraction) * unit // 10 ** len(fraction)
+
+    return total
+
+
+def _default_socket_path() -> str:
+    """Get the default path of the timer daemon socket, private to the
+    user."""
+    directory = os.environ.get("XDG_RUNTIME_DIR") or "/tmp"
+    return os.path.join(directory, f"minutaria-{os.getuid()}.sock")
+
+
+def send_daemon_command(command: dict, socket_path: str = None) -> dict:
+    """Send a command to a timer daemon and get its response.
+
+    See TimerDaemon for the commands and their responses.
+
+    Parameters
+    ----------
+    command: dict
+        The command and its parameters
+    socket_path: str, optional
+        The path of the Unix domain socket of the daemon, default to the
+        default socket of TimerDaemon
+
+    Returns
+    -------
+    dict
+        The response of the daemon.
+
+    Raises
+    ------
+    OSError
+        If no daemon is listening on the socket.
+    """
+    import json
+    import socket
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path or _default_socket_path())
+        client.sendall(json.dumps(command).encode() + b"\n")
+        with client.makefile("rb") as stream:
+            line = stream.readline()
+
+    if not line:
+        raise ConnectionResetError("The daemon closed the connection")
+    return json.loads(line)
 
 
 def logger(option: bool) -> logging.Logger:
@@ -497,6 +4110,8 @@ def logger(option: bool) -> logging.Logger:
     Create and return a console logger with level set to WARNING or DEBUG
     if option provided is evaluate to True.
     """
+    import logging
+
     # Create logger
     logger = logging.getLogger(__name__)
     logger.setLevel(logging.DEBUG)
@@ -525,20 +4140,25 @@ def get_cli_args(default_timer: str) -> argparse.Namespace:
 
     CLI for minutaria supporting choosing timer duration by hours, minutes
     and seconds separately and managing preset : add, delete, rename, change
-    duration of an existing preset and use an existing preset.
+    duration of an existing preset, use an existing preset and import or
+    export presets in bulk. A sequence of timers may also be given, stored
+    as a preset and used, see handle_sequence_args.
 
     Returns
     -------
     argparse.Namespace
         The command line arguments input by the user.
     """
+    import argparse
+
     parser = argparse.ArgumentParser(prog="minutaria",
                                      description="Execute a given timer from "
-                                                 "min 00:00:01 to "
-                                                 "max 23:59:59."
+                                                 "min 0:00:00.001 to "
+                                                 "max 168:00:00 (a week)."
                                                  " Options -ap and -mpd shall "
                                                  "be used with duration "
-                                                 "parameters.",
+                                                 "parameters, -as with "
+                                                 "--sequence.",
                                      epilog=f"If no timer is provided, "
                                             f"execute the default: "
                                             f"{default_timer}.")
@@ -552,6 +4172,11 @@ def get_cli_args(default_timer: str) -> argparse.Namespace:
                         action="store_true",
                         default=False,
                         help="enable debugging")
+    parser.add_argument("--stats",
+                        action="store_true",
+                        default=False,
+                        help="print the tick lateness, expiry overshoot and "
+                             "poll count of the timer at exit")
     parser.add_argument("-H",
                         "--hours",
                         type=int,
@@ -564,9 +4189,28 @@ def get_cli_args(default_timer: str) -> argparse.Namespace:
                         help="minute(s) to time")
     parser.add_argument("-S",
                         "--seconds",
+                        type=float,
+                        action="store",
+                        help="second(s) to time, to the millisecond")
+    parser.add_argument("-D",
+                        "--duration",
+                        action="store",
+                        metavar="DURATION",
+                        help="duration to time in a single argument, e.g. "
+                             "1h30m, 250ms, 2d, 00:01:30 or PT1M30S")
+    parser.add_argument("--sequence",
+                        action="store",
+                        nargs="+",
+                        metavar="[LABEL=]DURATION",
+                        help="durations to time one after the other, e.g. "
+                             "work=25m rest=5m")
+    parser.add_argument("--repeat",
                         type=int,
                         action="store",
-                        help="second(s) to time")
+                        default=1,
+                        metavar="N",
+                        help="number of times to run the sequence "
+                             "(default: 1)")
     group.add_argument("-ap",
                        "--add_preset",
                        action="store",
@@ -593,15 +4237,176 @@ def get_cli_args(default_timer: str) -> argparse.Namespace:
                        action="store",
                        metavar="PRESET_NAME",
                        help="name of the timer preset to delete")
+    group.add_argument("-as",
+                       "--add_sequence",
+                       action="store",
+                       metavar="PRESET_NAME",
+                       help="name of the sequence preset to create from "
+                            "--sequence and --repeat")
+    group.add_argument("-us",
+                       "--use_sequence",
+                       action="store",
+                       metavar="PRESET_NAME",
+                       help="name of the sequence preset to use")
+    group.add_argument("-ip",
+                       "--import_presets",
+                       type=argparse.FileType('r'),
+                       metavar="FILE",
+                       help="JSON or CSV file of the timer presets to add "
+                            "(- for stdin)")
+    group.add_argument("-ep",
+                       "--export_presets",
+                       type=argparse.FileType('w'),
+                       metavar="FILE",
+                       help="JSON or CSV file to export all the timer presets "
+                            "to (- for stdout)")
+    group.add_argument("-mp",
+                       "--migrate_presets",
+                       action="store",
+                       nargs=2,
+                       metavar=("SOURCE", "DESTINATION"),
+                       help="preset files to copy all the timer presets from "
+                            "and to, the backend being chosen by extension: "
+                            ".json, .jsonl (journal), .sqlite or .db")
+    group.add_argument("--daemon",
+                       action="store_true",
+                       default=False,
+                       help="serve timers to the clients of the socket until "
+                            "interrupted")
+    group.add_argument("--list_timers",
+                       action="store_true",
+                       default=False,
+                       help="list the timers of the daemon")
+    group.add_argument("--pause_timer",
+                       type=int,
+                       metavar="ID",
+                       help="pause a timer of the daemon")
+    group.add_argument("--continue_timer",
+                       type=int,
+                       metavar="ID",
+                       help="continue a paused timer of the daemon")
+    group.add_argument("--cancel_timer",
+                       type=int,
+                       metavar="ID",
+                       help="cancel a timer of the daemon")
+    group.add_argument("--wait_timer",
+                       type=int,
+                       metavar="ID",
+                       help="wait until a timer of the daemon reaches "
+                            "00:00:00")
+    parser.add_argument("--start_timer",
+                        action="store_true",
+                        default=False,
+                        help="start the timer on the daemon instead of "
+                             "locally")
+    parser.add_argument("--socket",
+                        action="store",
+                        metavar="PATH",
+                        help="Unix socket of the timer daemon (default: "
+                             "minutaria-UID.sock in $XDG_RUNTIME_DIR or /tmp)")
+    parser.add_argument("--resume",
+                        action="store_true",
+                        default=False,
+                        help="resume the timer saved in the checkpoint file "
+                             "given by --checkpoint instead of starting a new "
+                             "one")
+    parser.add_argument("--checkpoint",
+                        action="store",
+                        metavar="FILE",
+                        help="save the running timer in FILE to resume it "
+                             "after a restart (default: no checkpoint)")
+    parser.add_argument("--preset_file",
+                        action="store",
+                        default="preset.json",
+                        metavar="FILE",
+                        help="preset file to use, the backend being chosen by "
+                             "extension (default: preset.json)")
+    parser.add_argument("-pf",
+                        "--preset_format",
+                        choices=("json", "csv"),
+                        help="format of the imported or exported timer "
+                             "presets, default according to the file "
+                             "extension or json")
 
     return parser.parse_args()
 
+def _get_preset_format(stream, preset_format: str = None) -> str:
+    """Get the format of a preset stream, guessed from its extension if not
+    given."""
+    if preset_format:
+        return preset_format
+    if getattr(stream, "name", "").lower().endswith(".csv"):
+        return "csv"
+    return "json"
+
+
+def _round_seconds(seconds) -> float:
+    """Round a number of seconds to the millisecond, returned as an integer
+    if whole."""
+    milliseconds = round(float(seconds) * 1000)
+    if milliseconds % 1000:
+        return milliseconds / 1000
+    return milliseconds // 1000
+
+
+def _split_milliseconds(milliseconds: int) -> tuple:
+    """Split a duration in milliseconds into hours, minutes and seconds, the
+    seconds being an integer if whole else a float."""
+    seconds, millis = divmod(milliseconds, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    if millis:
+        return hours, minutes, seconds + millis / 1000
+    return hours, minutes, seconds
+
+
+def _format_timer_values(timer_values: dict) -> str:
+    """Format the timer values of the CLI as H:MM:SS[.fff]."""
+    seconds = timer_values['timer_secs']
+    if isinstance(seconds, float):
+        seconds = f"{seconds:06.3f}"
+    else:
+        seconds = f"{seconds:02}"
+    return (f"{timer_values['timer_hours']}:{timer_values['timer_min']:02}:"
+            f"{seconds}")
+
+
+def _format_sequence(program: dict) -> str:
+    """Format the steps and repetitions of a sequence as
+    [LABEL ]H:MM:SS[.fff], ... x N."""
+    steps = []
+    for label, hours, minutes, seconds in program["steps"]:
+        duration = _format_timer_values({"timer_hours": hours,
+                                         "timer_min": minutes,
+                                         "timer_secs": seconds})
+        steps.append(f"{label} {duration}" if label else duration)
+    return f"{', '.join(steps)} x {program['repeat']}"
+
+
+def _send_cli_command(args: argparse.Namespace, command: dict) -> dict:
+    """Send a command of the CLI to the timer daemon, exit the program if
+    the daemon isn't reachable or the command failed."""
+    try:
+        response = send_daemon_command(command, args.socket)
+    except OSError:
+        print(f"minutaria: Error: no timer daemon listening on "
+              f"{args.socket or _default_socket_path()} (launch one with "
+              f"--daemon)")
+        exit()
+
+    if not response["ok"]:
+        print(f"minutaria: Error: {response['error']}")
+        exit()
+    return response
+
+
 def handle_cli_args(args: argparse.Namespace):
     """Command line arguments'handler for minutaria.
 
     If a timing duration only is choosen, return the following dictionary
     {"timer_hours": hours, "timer_min": minutes, "timer_secs": seconds}
-    where "hours", "minutes" and "seconds" are integers.
+    where "hours" and "minutes" are integers and "seconds" an integer, or a
+    float with milliseconds for a sub-second precision.
 
     Else, exit the program after having done the expecting actions.
 
@@ -615,19 +4420,93 @@ def handle_cli_args(args: argparse.Namespace):
     args.debug : bool
         True if set, else False.
     """
+    # Split a duration given in a single argument into hours, minutes and
+    # seconds, handled as if given separately
+    if args.duration is not None:
+        if (args.hours is not None
+                or args.minutes is not None
+                or args.seconds is not None):
+            print("minutaria: Error: argument -D/--duration: not allowed with "
+                  "arguments -H/--hours, -M/--minutes and -S/--seconds")
+            exit()
+
+        try:
+            duration = parse_duration(args.duration)
+        except ValueError:
+            print(f"minutaria: Error: argument -D/--duration: invalid "
+                  f"duration: {args.duration} (e.g. 1h30m, 250ms, 2d, "
+                  f"00:01:30 or PT1M30S)")
+            exit()
+
+        # Round to the millisecond, the resolution of the CLI
+        milliseconds = round(duration / NS_PER_MILLISECOND)
+        if not 1 <= milliseconds <= MAX_TIMER_MILLISECONDS:
+            print(f"minutaria: Error: argument -D/--duration: invalid choice:"
+                  f" {args.duration} (choose from 0:00:00.001 to 168:00:00)")
+            exit()
+
+        hours, minutes, seconds = _split_milliseconds(milliseconds)
+        args.hours = hours or None
+        args.minutes = minutes or None
+        args.seconds = seconds or None
+
     # Accepted ranges error management
-    if args.hours and args.hours not in range(0, 24):
+    if args.hours is not None and not 0 <= args.hours <= 168:
         print("minutaria: Error: argument -H/--hours: invalid choice:"
-              f" {args.hours} (choose from 0 to 23)")
+              f" {args.hours} (choose from 0 to 168)")
         exit()
-    if args.minutes and args.minutes not in range(0, 60):
+    if args.minutes is not None and not 0 <= args.minutes <= 59:
         print(f"minutaria: Error: argument -M/--minutes: invalid choice:"
               f" {args.minutes} (choose from 0 to 59)")
         exit()
-    if (args.seconds or args.seconds == 0) and args.seconds not in range(1, 60):
+    if args.seconds is not None and not 0 <= args.seconds < 60:
         print(f"minutaria: Error: argument -S/--seconds: invalid choice:"
-              f" {args.seconds} (choose from 1 to 59)")
+              f" {args.seconds} (choose from 0 to 59.999)")
         exit()
+    if (args.hours is not None
+            or args.minutes is not None
+            or args.seconds is not None):
+        # Round the seconds to the millisecond, the resolution of the CLI
+        milliseconds = ((args.hours or 0) * 3600 + (args.minutes or 0) * 60) \
+            * 1000 + round((args.seconds or 0) * 1000)
+        if not 1 <= milliseconds <= MAX_TIMER_MILLISECONDS:
+            print("minutaria: Error: arguments -H/--hours, -M/--minutes and "
+                  "-S/--seconds: invalid duration (choose from 0:00:00.001 "
+                  "to 168:00:00)")
+            exit()
+        if args.seconds is not None:
+            args.seconds = _round_seconds(args.seconds)
+
+    # Serve timers until interrupted and quit
+    if args.daemon:
+        daemon = TimerDaemon(args.socket, logger(args.debug))
+        try:
+            daemon.run(lambda: print(f"minutaria: daemon listening on "
+                                     f"{daemon.socket_path}", flush=True))
+        except ValueError:
+            print(f"minutaria: Error: argument --daemon: a daemon is already "
+                  f"listening on {daemon.socket_path}")
+        exit()
+
+    # Send a command to the timers of the daemon and quit
+    if args.list_timers:
+        timers = _send_cli_command(args, {"command": "list"})["timers"]
+        for timer in timers:
+            print(f"{timer['id']}: {timer['label']} - {timer['remaining']}"
+                  f"{' (paused)' if timer['paused'] else ''}")
+        if not timers:
+            print("No timer.")
+        exit()
+    for command, timer_id, done in (("pause", args.pause_timer, "paused"),
+                                    ("continue", args.continue_timer,
+                                     "continued"),
+                                    ("cancel", args.cancel_timer,
+                                     "cancelled"),
+                                    ("wait", args.wait_timer, "GONG !")):
+        if timer_id is not None:
+            _send_cli_command(args, {"command": command, "id": timer_id})
+            print(f"Timer {timer_id}: {done}")
+            exit()
 
     # Container for timer values
     timer_values = {
@@ -666,16 +4545,14 @@ def handle_cli_args(args: argparse.Namespace):
         new_preset = Preset(args.add_preset,
                             timer_values["timer_hours"],
                             timer_values["timer_min"],
-                            timer_values["timer_secs"])
+                            timer_values["timer_secs"],
+                            args.preset_file)
 
         try:
             new_preset.add()
-            new_preset_duration = timedelta(hours=+timer_values["timer_hours"],
-                                            minutes=+timer_values["timer_min"],
-                                            seconds=+timer_values["timer_secs"])
             print("New preset added: "
                   f"{args.add_preset.capitalize()} - "
-                  f"{str(new_preset_duration)}")
+                  f"{_format_timer_values(timer_values)}")
             exit()
         except ValueError:
             print(f"The preset name {args.add_preset.capitalize()} "
@@ -695,18 +4572,16 @@ def handle_cli_args(args: argparse.Namespace):
     elif args.modify_preset_duration:
         # Modify the corresponding preset and quit
         try:
-            preset_to_modify = Preset(args.modify_preset_duration)
+            preset_to_modify = Preset(args.modify_preset_duration,
+                                      preset_file=args.preset_file)
             modified = preset_to_modify.set_duration(timer_values["timer_hours"],
                                                      timer_values["timer_min"],
                                                      timer_values["timer_secs"])
-            modified_duration = timedelta(hours=+timer_values["timer_hours"],
-                                          minutes=+timer_values["timer_min"],
-                                          seconds=+timer_values["timer_secs"])
 
             if modified:
                 print("New preset duration: "
                       f"{args.modify_preset_duration.capitalize()}"
-                      f" - {str(modified_duration)}")
+                      f" - {_format_timer_values(timer_values)}")
                 exit()
         except ValueError:
             print(f"The preset {args.modify_preset_duration.capitalize()} "
@@ -721,7 +4596,8 @@ def handle_cli_args(args: argparse.Namespace):
     elif args.rename_preset:
         # Rename the corresponding preset and quit
         try:
-            preset_to_rename = Preset(args.rename_preset[0])
+            preset_to_rename = Preset(args.rename_preset[0],
+                                      preset_file=args.preset_file)
             renamed = preset_to_rename.rename(args.rename_preset[1])
 
             if renamed:
@@ -742,7 +4618,8 @@ def handle_cli_args(args: argparse.Namespace):
     elif args.del_preset:
         # Delete the corresponding preset and quit
         try:
-            preset_to_delete = Preset(args.del_preset)
+            preset_to_delete = Preset(args.del_preset,
+                                      preset_file=args.preset_file)
             deleted = preset_to_delete.delete()
 
             if deleted:
@@ -752,6 +4629,60 @@ def handle_cli_args(args: argparse.Namespace):
             print(f"The preset {args.del_preset.capitalize()} does not exist.")
             exit()
 
+    # Check whether the presets to import are the only user input
+    if args.import_presets and (args.hours or args.minutes or args.seconds):
+        print("minutaria: Error: argument -ip/--import_presets: "
+              "invalid input: only indicate the file of the presets to import")
+        exit()
+    elif args.import_presets:
+        # Add all the presets of the file at once and quit
+        preset_format = _get_preset_format(args.import_presets,
+                                           args.preset_format)
+        try:
+            imported = import_presets(args.import_presets, preset_format,
+                                      args.preset_file)
+            print(f"Presets imported: {imported}")
+            exit()
+        except ValueError:
+            print(f"The presets of {args.import_presets.name} were not "
+                  f"imported. Please check the file format and that none "
+                  f"of the presets does already exist.")
+            exit()
+
+    # Check whether the presets export is the only user input
+    if args.export_presets and (args.hours or args.minutes or args.seconds):
+        print("minutaria: Error: argument -ep/--export_presets: "
+              "invalid input: only indicate the file to export presets to")
+        exit()
+    elif args.export_presets:
+        # Write all the existing presets and quit
+        preset_format = _get_preset_format(args.export_presets,
+                                           args.preset_format)
+        export_presets(args.export_presets, preset_format, args.preset_file)
+        args.export_presets.flush()
+        exit()
+
+    # Check whether the presets migration is the only user input
+    if args.migrate_presets and (args.hours or args.minutes or args.seconds):
+        print("minutaria: Error: argument -mp/--migrate_presets: "
+              "invalid input: only indicate the source and destination files")
+        exit()
+    elif args.migrate_presets:
+        # Copy all the presets to the destination backend and quit
+        try:
+            migrated = migrate_presets(args.migrate_presets[0],
+                                       args.migrate_presets[1])
+            print(f"Presets migrated: {migrated}")
+            exit()
+        except FileNotFoundError:
+            print(f"The preset file {args.migrate_presets[0]} does not exist.")
+            exit()
+        except ValueError:
+            print(f"The presets were not migrated. Please check that none of "
+                  f"them does already exist in {args.migrate_presets[1]} "
+                  f"and that it can store the sequence presets.")
+            exit()
+
     # Check whether the preset to get and use is the only user input
     if args.use_preset and (args.hours or args.minutes or args.seconds):
         print("minutaria: Error: argument -p/--use_preset: "
@@ -760,7 +4691,8 @@ def handle_cli_args(args: argparse.Namespace):
     elif args.use_preset:
         try:
             # Use the corresponding preset
-            preset_to_get = Preset(args.use_preset)
+            preset_to_get = Preset(args.use_preset,
+                                   preset_file=args.preset_file)
             preset_to_use = preset_to_get.get()
 
             # Check wether the preset does exist
@@ -773,25 +4705,130 @@ def handle_cli_args(args: argparse.Namespace):
                   "does not exist. Please choose an existing preset.")
             exit()
 
+    # Start the timer on the daemon and quit
+    if args.start_timer and timer_values["timer_secs"] is None:
+        print("minutaria: Error: argument --start_timer: incomplete input "
+              "(indicate a timer with dedicated parameters or a preset)")
+        exit()
+    elif args.start_timer:
+        label = (args.use_preset.capitalize() if args.use_preset
+                 else _format_timer_values(timer_values))
+        response = _send_cli_command(args,
+                                     {"command": "start",
+                                      "hours": timer_values["timer_hours"],
+                                      "minutes": timer_values["timer_min"],
+                                      "seconds": timer_values["timer_secs"],
+                                      "label": label})
+        print(f"Timer {response['id']} started: {label}")
+        exit()
+
     return timer_values, args.debug
 
 
+def handle_sequence_args(args: argparse.Namespace):
+    """Timer sequence command line arguments'handler for minutaria.
+
+    To be called after handle_cli_args. If a sequence is given with
+    --sequence and --repeat, or a sequence preset with -us/--use_sequence,
+    return its program as the following dictionary
+    {"steps": steps, "repeat": repeat} where "steps" is a list of label,
+    hours, minutes and seconds tuples, to be run by a TimerSequence.
+
+    If a sequence preset is added with -as/--add_sequence, exit the program
+    once done. Else, return None.
+
+    Also, manage incorrect user inputs.
+
+    Returns
+    -------
+    program: dict
+        The steps and repetitions of the requested sequence, None if no
+        sequence is requested.
+    """
+    if not (args.sequence or args.add_sequence or args.use_sequence):
+        return None
+
+    if args.hours or args.minutes or args.seconds or args.use_preset:
+        print("minutaria: Error: argument --sequence: not allowed with "
+              "arguments -H/--hours, -M/--minutes, -S/--seconds, "
+              "-D/--duration and -p/--use_preset")
+        exit()
+    if args.repeat < 1:
+        print(f"minutaria: Error: argument --repeat: invalid choice: "
+              f"{args.repeat} (choose from 1)")
+        exit()
+
+    # Split each step into its label and its duration, to the millisecond
+    program = {"steps": [], "repeat": args.repeat}
+    for step in args.sequence or ():
+        label, _, duration = step.rpartition("=")
+        try:
+            duration = parse_duration(duration)
+        except ValueError:
+            duration = 0
+        milliseconds = round(duration / NS_PER_MILLISECOND)
+        if not 1 <= milliseconds <= MAX_TIMER_MILLISECONDS:
+            print(f"minutaria: Error: argument --sequence: invalid step: "
+                  f"{step} (e.g. work=25m or 90s, from 0:00:00.001 to "
+                  f"168:00:00)")
+            exit()
+        program["steps"].append((label, *_split_milliseconds(milliseconds)))
+
+    # Check whether the user input the steps of the sequence to add
+    if args.add_sequence and not args.sequence:
+        print(f"minutaria: Error: argument -as/--add_sequence: incomplete "
+              f"input: {args.add_sequence} (indicate sequence name and "
+              f"corresponding steps with --sequence)")
+        exit()
+    elif args.add_sequence:
+        # Create the corresponding sequence preset and quit
+        try:
+            Preset.add_sequence(args.add_sequence, program["steps"],
+                                program["repeat"], args.preset_file)
+            print(f"New sequence added: {args.add_sequence.capitalize()} - "
+                  f"{_format_sequence(program)}")
+        except ValueError:
+            print(f"The preset name {args.add_sequence.capitalize()} "
+                  f"already exist or the preset file doesn't support "
+                  f"sequences. Please choose an other name or file.")
+        exit()
+
+    # Check whether the sequence preset to use is the only user input
+    if args.use_sequence and args.sequence:
+        print("minutaria: Error: argument -us/--use_sequence: invalid input: "
+              "only indicate the name of the sequence preset to use")
+        exit()
+    elif args.use_sequence:
+        try:
+            program = Preset.get_sequence(args.use_sequence,
+                                          args.preset_file)
+        except ValueError:
+            print(f"The sequence {args.use_sequence.capitalize()} "
+                  f"does not exist. Please choose an existing name.")
+            exit()
+
+    return program
+
+
 if __name__ == '__main__':
     # Default parameters to be use if this file is launched as a test script
     # or modified by user input
-    TIMER_HOURS = 0  # min 0, max 23
+    TIMER_HOURS = 0  # min 0, max 168
     TIMER_MIN = 0    # min 0, max 59
-    TIMER_SEC = 5    # min 0, max 59
+    TIMER_SEC = 5    # min 0, max 59.999
 
     # Initialize and launch a timer according to parameters
     timer = Timer(hours=TIMER_HOURS, minutes=TIMER_MIN, seconds=TIMER_SEC)
+    scheduler = TickScheduler(timer)
+    formatter = TimingFormatter.for_timing(timer.get_timing_ns)
 
-    # Check remaining time along the timer and print it
+    # Check remaining time along the timer and print it at each tick
     counter = timer.is_timing_reached()
     while counter is False:
-        print("minutaria -", "Remaining :", timer.get_timing[:9], end='\r',
+        print("minutaria -", "Remaining :",
+              formatter.format(timer.get_timing_ns), end='\r',
               flush=True)
-        counter = timer.is_timing_reached()
+        counter = scheduler.wait()
 
     # Timer reached 00:00:00
     # Print 3 "GONG !" and some spaces to clear the line
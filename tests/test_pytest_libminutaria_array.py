@@ -0,0 +1,62 @@
+import pytest
+from libminutaria import TimerArray, FakeClock
+
+@pytest.fixture
+def clock_fixture():
+    return FakeClock(start=1_000_000_000)
+
+@pytest.fixture(params=[False, True], ids=["array", "numpy"])
+def array_fixture(request, clock_fixture):
+    if request.param:
+        pytest.importorskip("numpy")
+    return TimerArray(clock_fixture, use_numpy=request.param)
+
+def test_add(array_fixture):
+    assert(len(array_fixture) == 0)
+    assert(list(array_fixture.remaining()) == [])
+    assert(array_fixture.add(seconds=5) == 0)
+    assert(array_fixture.add(hours=1, minutes=30) == 1)
+    assert(len(array_fixture) == 2)
+    assert(list(array_fixture.remaining())
+           == [5_000_000_000, 5_400_000_000_000])
+
+def test_tick(clock_fixture, array_fixture):
+    for seconds in (1, 2, 3):
+        array_fixture.add(seconds=seconds)
+    clock_fixture.advance(2)
+    remaining, expired = array_fixture.tick()
+    assert(list(remaining) == [-1_000_000_000, 0, 1_000_000_000])
+    assert(list(expired) == [True, True, False])
+    # At an other point of time, nothing being modified
+    remaining, expired = array_fixture.tick(now=clock_fixture.now() - 1)
+    assert(list(remaining) == [-999_999_999, 1, 1_000_000_001])
+    assert(list(expired) == [True, False, False])
+
+def test_pause_and_continue(clock_fixture, array_fixture):
+    array_fixture.add(seconds=5)
+    array_fixture.add(seconds=5)
+    clock_fixture.advance(1)
+    array_fixture.pause(0)
+    array_fixture.pause(0)
+    assert(array_fixture.is_paused(0) and not array_fixture.is_paused(1))
+    # A paused timer keeps its remaining time for an hour
+    clock_fixture.advance(3600)
+    remaining, expired = array_fixture.tick()
+    assert(remaining[0] == 4_000_000_000)
+    assert(list(expired) == [False, True])
+    array_fixture.continue_after_pause(0)
+    array_fixture.continue_after_pause(0)
+    assert(not array_fixture.is_paused(0))
+    clock_fixture.advance(3)
+    assert(array_fixture.remaining()[0] == 1_000_000_000)
+
+def test_many_timers(clock_fixture, array_fixture):
+    for index in range(10000):
+        array_fixture.add(seconds=index)
+    clock_fixture.advance(5000.5)
+    remaining, expired = array_fixture.tick()
+    assert(sum(expired) == 5001)
+    assert(remaining[9999] == 4998_500_000_000)
+    # A few bytes per timer
+    assert(array_fixture._deadlines.itemsize
+           + array_fixture._running.itemsize <= 16)
@@ -0,0 +1,82 @@
+import asyncio
+import time
+import pytest
+from libminutaria import AsyncTimer
+
+def timer_ending_in(milliseconds):
+    timer = AsyncTimer(hours=0, minutes=0, seconds=0)
+    timer._timer._deadline = time.monotonic_ns() + milliseconds * 1_000_000
+    return timer
+
+def test_wait():
+    timer = timer_ending_in(100)
+
+    async def main():
+        start = time.monotonic()
+        await timer.wait()
+        return time.monotonic() - start
+
+    assert(0.09 < asyncio.run(main()) < 1)
+    assert(timer.is_timing_reached())
+
+def test_wait_does_not_block_the_loop():
+    timer = timer_ending_in(100)
+    beats = []
+
+    async def heartbeat():
+        while True:
+            beats.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def main():
+        task = asyncio.ensure_future(heartbeat())
+        await timer.wait()
+        task.cancel()
+
+    asyncio.run(main())
+    assert(len(beats) >= 5)
+
+def test_ticks():
+    timer = timer_ending_in(300)
+
+    async def main():
+        return [timing async for timing in timer.ticks(0.1)]
+
+    timings = asyncio.run(main())
+    assert(3 <= len(timings) <= 5)
+    assert(timings[0][:9] in ("0:00:00.3", "0:00:00.2"))
+
+def test_pause_and_continue():
+    timer = timer_ending_in(100)
+
+    async def main():
+        waiter = asyncio.ensure_future(timer.wait())
+        timer.pause()
+        await asyncio.sleep(0.2)
+        # Still waiting since paused
+        assert(not waiter.done())
+        assert(not timer.is_timing_reached())
+        timer.continue_after_pause()
+        start = time.monotonic()
+        await waiter
+        return time.monotonic() - start
+
+    assert(asyncio.run(main()) < 0.2)
+    assert(not timer.paused)
+
+def test_cancelled_waiter():
+    timer = timer_ending_in(100)
+
+    async def main():
+        waiter = asyncio.ensure_future(timer.wait())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        timer.pause()
+        timer.continue_after_pause()
+        # A new waiter is not affected by the cancelled one
+        await asyncio.wait_for(timer.wait(), 1)
+
+    asyncio.run(main())
+    assert(timer.is_timing_reached())
@@ -0,0 +1,117 @@
+import os
+import json
+import time
+import pytest
+from libminutaria import Timer, TimerCheckpoint, FakeClock
+
+CHECKPOINT_FILE = 'checkpoint_test.json'
+
+@pytest.fixture
+def checkpoint_fixture():
+    checkpoint = TimerCheckpoint(CHECKPOINT_FILE)
+    yield checkpoint
+    if os.path.exists(CHECKPOINT_FILE):
+        os.remove(CHECKPOINT_FILE)
+
+def test_load_missing(checkpoint_fixture):
+    assert(checkpoint_fixture.load() is None)
+
+def test_save_running(checkpoint_fixture):
+    timer = Timer(hours=0, minutes=5, seconds=0)
+    assert(checkpoint_fixture.save(timer, 'tea'))
+    # The deadline is stored as wall clock time
+    with open(CHECKPOINT_FILE) as checkpoint:
+        state = json.load(checkpoint)
+    assert(abs(state["deadline"] - time.time_ns() - 300_000_000_000)
+           < 1_000_000_000)
+
+    resumed = TimerCheckpoint(CHECKPOINT_FILE).load()
+    assert(resumed["label"] == 'tea')
+    assert(not resumed["paused"])
+    # Resumed on the same deadline
+    assert(abs(resumed["timer"]._deadline - timer._deadline) < 1_000_000)
+    assert(not resumed["timer"].is_timing_reached())
+
+def test_save_paused(checkpoint_fixture):
+    timer = Timer(hours=0, minutes=0, seconds=30)
+    timer._actualized_delta = 12_000_000_000
+    checkpoint_fixture.save(timer, paused=True)
+    time.sleep(0.01)
+
+    resumed = checkpoint_fixture.load()
+    assert(resumed["paused"])
+    assert(resumed["timer"].get_timing_ns == 12_000_000_000)
+    resumed["timer"].continue_after_pause()
+    assert(resumed["timer"]._deadline - time.monotonic_ns()
+           <= 12_000_000_000)
+
+def test_load_expired(checkpoint_fixture):
+    timer = Timer(hours=0, minutes=0, seconds=1)
+    timer._deadline -= 2_000_000_000
+    checkpoint_fixture.save(timer)
+    assert(checkpoint_fixture.load()["timer"].is_timing_reached())
+
+def test_save_on_fake_clock(checkpoint_fixture):
+    clock = FakeClock()
+    timer = Timer(hours=2, clock=clock)
+    clock.advance(1800)
+    checkpoint_fixture.save(timer)
+    resumed = TimerCheckpoint(CHECKPOINT_FILE, clock).load()["timer"]
+    assert(resumed._clock is clock)
+    assert(abs(resumed.remaining() - 5400 * 1_000_000_000) < 1_000_000_000)
+
+def test_rate_limit(checkpoint_fixture):
+    clock = FakeClock()
+    checkpoint = TimerCheckpoint(CHECKPOINT_FILE, clock)
+    checkpoint.min_interval = 0.2
+    timer = Timer(hours=0, minutes=1, seconds=0, clock=clock)
+    assert(checkpoint.next_write() is None)
+    assert(checkpoint.save(timer))
+    # Kept pending until the end of the interval
+    assert(not checkpoint.save(timer, paused=True))
+    clock.advance(0.05)
+    assert(checkpoint.next_write() == pytest.approx(0.15))
+    assert(not checkpoint.load()["paused"])
+    assert(not checkpoint.flush())
+    clock.sleep(checkpoint.next_write())
+    assert(checkpoint.flush())
+    assert(checkpoint.load()["paused"])
+    assert(checkpoint.next_write() is None)
+    # Unless forced
+    assert(not checkpoint.save(timer))
+    assert(checkpoint.flush(force=True))
+    assert(not checkpoint.load()["paused"])
+
+def test_clear(checkpoint_fixture):
+    checkpoint_fixture.save(Timer(hours=0, minutes=1, seconds=0))
+    checkpoint_fixture.clear()
+    assert(not os.path.exists(CHECKPOINT_FILE))
+    assert(checkpoint_fixture.next_write() is None)
+    checkpoint_fixture.clear()
+
+def test_clear_only_owned(checkpoint_fixture):
+    checkpoint_fixture.save(Timer(hours=0, minutes=1, seconds=0))
+    # An other process saved its own timer in the same file meanwhile
+    other = TimerCheckpoint(CHECKPOINT_FILE)
+    other.save(Timer(hours=0, minutes=2, seconds=0))
+    checkpoint_fixture.clear()
+    assert(os.path.exists(CHECKPOINT_FILE))
+    # Never written by this checkpoint
+    TimerCheckpoint(CHECKPOINT_FILE).clear()
+    assert(os.path.exists(CHECKPOINT_FILE))
+    other.clear()
+    assert(not os.path.exists(CHECKPOINT_FILE))
+
+def test_clear_once_resumed(checkpoint_fixture):
+    checkpoint_fixture.save(Timer(hours=0, minutes=1, seconds=0))
+    # Resumed after a restart, by an other checkpoint of the file
+    resuming = TimerCheckpoint(CHECKPOINT_FILE)
+    assert(resuming.load() is not None)
+    resuming.clear()
+    assert(not os.path.exists(CHECKPOINT_FILE))
+
+def test_load_invalid(checkpoint_fixture):
+    with open(CHECKPOINT_FILE, 'w') as checkpoint:
+        checkpoint.write('["not", "a", "checkpoint"]')
+    with pytest.raises(ValueError):
+        checkpoint_fixture.load()
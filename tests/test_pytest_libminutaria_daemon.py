@@ -0,0 +1,134 @@
+import json
+import time
+import asyncio
+import threading
+import pytest
+from libminutaria import TimerDaemon, FakeClock, send_daemon_command
+
+# Timers started by the load test, spread over concurrent clients
+LOAD_TIMERS = 5000
+LOAD_CLIENTS = 50
+
+@pytest.fixture
+def daemon_fixture(tmp_path):
+    # Serve the daemon from a thread with its own event loop
+    daemon = TimerDaemon(str(tmp_path / "minutaria.sock"))
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    task = loop.create_task(daemon.serve(ready.set))
+
+    def serve():
+        try:
+            loop.run_until_complete(task)
+        except asyncio.CancelledError:
+            pass
+
+    thread = threading.Thread(target=serve)
+    thread.start()
+    assert(ready.wait(5))
+    yield daemon
+    loop.call_soon_threadsafe(task.cancel)
+    thread.join(5)
+    loop.close()
+
+def test_handle_command():
+    daemon = TimerDaemon("unused.sock")
+    response = daemon.handle_command({"command": "start", "minutes": 5,
+                                      "label": "tea"})
+    assert(response == {"ok": True, "id": 1})
+    assert(daemon.handle_command({"command": "pause", "id": 1})["ok"])
+    assert(not daemon.handle_command({"command": "pause", "id": 1})["ok"])
+    timers = daemon.handle_command({"command": "list"})["timers"]
+    assert(timers[0]["label"] == "tea")
+    assert(timers[0]["paused"])
+    assert(timers[0]["remaining"].startswith("0:04:59"))
+    assert(daemon.handle_command({"command": "continue", "id": 1})["ok"])
+    assert(daemon.handle_command({"command": "cancel", "id": 1})["ok"])
+    assert(len(daemon) == 0)
+    assert(not daemon.handle_command({"command": "cancel", "id": 1})["ok"])
+    assert(not daemon.handle_command({"command": "explode"})["ok"])
+    assert(not daemon.handle_command({"command": "start",
+                                      "seconds": "x"})["ok"])
+
+def test_handle_command_clock():
+    clock = FakeClock()
+    daemon = TimerDaemon("unused.sock", clock=clock)
+    daemon.handle_command({"command": "start", "seconds": 10})
+    daemon.handle_command({"command": "start", "seconds": 10})
+    clock.advance(2)
+    daemon.handle_command({"command": "pause", "id": 2})
+    clock.advance(3)
+    timers = daemon.handle_command({"command": "list"})["timers"]
+    assert([(timer["remaining"], timer["paused"]) for timer in timers]
+           == [("0:00:05.0", False), ("0:00:08.0", True)])
+
+def test_handle_command_overflow():
+    daemon = TimerDaemon("unused.sock")
+    for seconds in (1e400, float("inf"), float("nan")):
+        response = daemon.handle_command({"command": "start",
+                                          "seconds": seconds})
+        assert(not response["ok"] and response["error"])
+    assert(len(daemon) == 0)
+
+def test_send_daemon_command(daemon_fixture):
+    path = daemon_fixture.socket_path
+    timer_id = send_daemon_command({"command": "start", "seconds": 1},
+                                   path)["id"]
+    timers = send_daemon_command({"command": "list"}, path)["timers"]
+    assert([timer["id"] for timer in timers] == [timer_id])
+    start = time.monotonic()
+    assert(send_daemon_command({"command": "wait", "id": timer_id}, path)
+           == {"ok": True})
+    assert(time.monotonic() - start <= 1.1)
+    assert(send_daemon_command({"command": "list"}, path)["timers"] == [])
+
+def test_daemon_already_running(daemon_fixture):
+    with pytest.raises(ValueError):
+        TimerDaemon(daemon_fixture.socket_path).run()
+
+def test_invalid_json(daemon_fixture):
+    async def send_garbage():
+        reader, writer = await asyncio.open_unix_connection(
+            daemon_fixture.socket_path)
+        writer.write(b"not json\n[]\n")
+        responses = [json.loads(await reader.readline()) for _ in range(2)]
+        writer.close()
+        return responses
+
+    for response in asyncio.run(send_garbage()):
+        assert(not response["ok"])
+
+def test_load(daemon_fixture):
+    # Many clients starting many timers at once over one event loop
+    async def client(index):
+        reader, writer = await asyncio.open_unix_connection(
+            daemon_fixture.socket_path)
+        count = LOAD_TIMERS // LOAD_CLIENTS
+        for number in range(count):
+            command = {"command": "start", "seconds": 1,
+                       "label": f"load {index}.{number}"}
+            writer.write(json.dumps(command).encode() + b"\n")
+        ids = [json.loads(await reader.readline())["id"]
+               for _ in range(count)]
+        writer.close()
+        return ids
+
+    async def load():
+        return await asyncio.gather(*(client(index)
+                                      for index in range(LOAD_CLIENTS)))
+
+    start = time.monotonic()
+    ids = [timer_id for client_ids in asyncio.run(load())
+           for timer_id in client_ids]
+    started = time.monotonic() - start
+    assert(len(set(ids)) == LOAD_TIMERS)
+
+    timers = send_daemon_command({"command": "list"},
+                                 daemon_fixture.socket_path)["timers"]
+    assert(len(timers) <= LOAD_TIMERS)
+
+    # All the timers end on time
+    while len(daemon_fixture) and time.monotonic() - start < 3:
+        time.sleep(0.05)
+    assert(len(daemon_fixture) == 0)
+    assert(time.monotonic() - start < 1 + started + 0.5)
@@ -0,0 +1,92 @@
+import sys
+import pytest
+from libminutaria import parse_duration, get_cli_args, handle_cli_args
+
+@pytest.mark.parametrize("duration, expected", [
+    ("1h30m", 5_400_000_000_000),
+    ("90s", 90_000_000_000),
+    ("1h0m5s", 3_605_000_000_000),
+    ("1.5h", 5_400_000_000_000),
+    ("00:01:30.5", 90_500_000_000),
+    ("1:30", 90_000_000_000),
+    ("90", 90_000_000_000),
+    ("PT1M30S", 90_000_000_000),
+    ("pt1h30m5,25s", 5_405_250_000_000),
+    (" 2M ", 120_000_000_000),
+    ("0.0000000019s", 1),
+    ("250ms", 250_000_000),
+    ("1m30s250ms", 90_250_000_000),
+    ("1.5ms", 1_500_000),
+    ("2d", 172_800_000_000_000),
+    ("1w1d12h", 734_400_000_000_000),
+    ("36:00:00", 129_600_000_000_000),
+    ("P2D", 172_800_000_000_000),
+    ("P1W", 604_800_000_000_000),
+    ("P1DT12H30M", 131_400_000_000_000),
+    ("PT0.25S", 250_000_000),
+])
+def test_parse_duration(duration, expected):
+    assert(parse_duration(duration) == expected)
+
+@pytest.mark.parametrize("duration", [
+    "", "pt", "h", "1x", "-5s", "1h1h", "1m1h", "1:30m", "1h:30", "PT90",
+    "1.5h30m", "1:2:3:4", "1:60", "1:", ":30", "1..5s", "1h 30m", "²s",
+    "p", "P1DT", "P1H", "PT1D", "P1D1W", "PT250MS", "1ms1s", "1d1w", "1msm",
+])
+def test_parse_invalid_duration(duration):
+    with pytest.raises(ValueError):
+        parse_duration(duration)
+
+def test_parse_duration_memoized():
+    parse_duration("3h25m")
+    hits = parse_duration.cache_info().hits
+    assert(parse_duration("3h25m") == 12_300_000_000_000)
+    assert(parse_duration.cache_info().hits == hits + 1)
+
+def test_handle_cli_args_duration(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["minutaria", "-D", "1h30m"])
+    timer_values, _ = handle_cli_args(get_cli_args("0:00:05"))
+    assert(timer_values == {"timer_hours": 1,
+                            "timer_min": 30,
+                            "timer_secs": 0})
+
+@pytest.mark.parametrize("arguments, expected", [
+    (["-D", "250ms"], {"timer_hours": 0, "timer_min": 0, "timer_secs": 0.25}),
+    (["-D", "1w"], {"timer_hours": 168, "timer_min": 0, "timer_secs": 0}),
+    (["-D", "P1DT1.5S"], {"timer_hours": 24, "timer_min": 0,
+                          "timer_secs": 1.5}),
+    (["-H", "36", "-S", "0.5"], {"timer_hours": 36, "timer_min": 0,
+                                 "timer_secs": 0.5}),
+    (["-M", "1", "-S", "0"], {"timer_hours": 0, "timer_min": 1,
+                              "timer_secs": 0}),
+    (["-S", "1.0004"], {"timer_hours": 0, "timer_min": 0, "timer_secs": 1}),
+])
+def test_handle_cli_args_sub_second_and_multi_day(monkeypatch, arguments,
+                                                  expected):
+    monkeypatch.setattr(sys, "argv", ["minutaria", *arguments])
+    timer_values, _ = handle_cli_args(get_cli_args("0:00:05"))
+    assert(timer_values == expected)
+
+@pytest.mark.parametrize("arguments, error", [
+    (["-H", "169"], "argument -H/--hours"),
+    (["-M", "60"], "argument -M/--minutes"),
+    (["-S", "60"], "argument -S/--seconds"),
+    (["-S", "0"], "invalid duration"),
+    (["-S", "0.0004"], "invalid duration"),
+    (["-H", "168", "-S", "1"], "invalid duration"),
+])
+def test_handle_cli_args_out_of_range(monkeypatch, capsys, arguments, error):
+    monkeypatch.setattr(sys, "argv", ["minutaria", *arguments])
+    with pytest.raises(SystemExit):
+        handle_cli_args(get_cli_args("0:00:05"))
+    assert(error in capsys.readouterr().out)
+
+@pytest.mark.parametrize("arguments", [
+    ["-D", "nope"], ["-D", "0s"], ["-D", "0.0004s"], ["-D", "1w1ms"],
+    ["-D", "90s", "-S", "5"],
+])
+def test_handle_cli_args_invalid_duration(monkeypatch, capsys, arguments):
+    monkeypatch.setattr(sys, "argv", ["minutaria", *arguments])
+    with pytest.raises(SystemExit):
+        handle_cli_args(get_cli_args("0:00:05"))
+    assert("argument -D/--duration" in capsys.readouterr().out)
@@ -0,0 +1,65 @@
+import pytest
+from libminutaria import Timer, TimingFormatter
+
+@pytest.fixture
+def formatter_fixture():
+    return TimingFormatter()
+
+def test_format_tenths(formatter_fixture):
+    assert(formatter_fixture.format(0) == "0:00:00.0")
+    assert(formatter_fixture.format(4_250_000_000) == "0:00:04.2")
+    assert(formatter_fixture.format(3_599_999_999_999) == "0:59:59.9")
+
+def test_format_precisions():
+    assert(TimingFormatter("seconds").format(4_250_000_000) == "0:00:04")
+    assert(TimingFormatter("millis").format(4_250_000_000) == "0:00:04.250")
+
+def test_format_unknown_precision():
+    with pytest.raises(ValueError):
+        TimingFormatter("hundredths")
+
+def test_format_ten_hours_and_more(formatter_fixture):
+    assert(formatter_fixture.format(36_000_000_000_000) == "10:00:00.0")
+    # No day is displayed, unlike timedelta
+    assert(formatter_fixture.format(90_061_000_000_000) == "25:01:01.0")
+
+def test_format_hours_digits():
+    formatter = TimingFormatter("seconds", hours_digits=3)
+    assert(formatter.format(604_800_000_000_000) == "168:00:00")
+    assert(formatter.format(5_000_000_000) == "000:00:05")
+    with pytest.raises(ValueError):
+        TimingFormatter(hours_digits=0)
+
+@pytest.mark.parametrize("timing, first, last", [
+    (5_000_000_000, "0:00:05.0", "0:00:00.0"),
+    (250_000_000, "0:00:00.250", "0:00:00.000"),
+    (36_000_000_000_000, "10:00:00.0", "00:00:00.0"),
+    (604_800_000_000_000, "168:00:00.0", "000:00:00.0"),
+])
+def test_format_for_timing_fixed_width(timing, first, last):
+    formatter = TimingFormatter.for_timing(timing)
+    assert(formatter.format(timing) == first)
+    assert(formatter.format(0) == last)
+
+def test_format_negative(formatter_fixture):
+    assert(formatter_fixture.format(-1_500_000_000) == "-0:00:01.5")
+    # Truncated toward zero, so no "-0:00:00.0"
+    assert(formatter_fixture.format(-50_000_000) == "0:00:00.0")
+
+def test_format_reuses_string(formatter_fixture):
+    first = formatter_fixture.format(4_250_000_000)
+    assert(formatter_fixture.format(4_201_000_000) is first)
+    assert(formatter_fixture.format(4_199_000_000) == "0:00:04.1")
+
+def test_format_timer(formatter_fixture):
+    timer = Timer(hours=0, minutes=0, seconds=5)
+    assert(timer.get_timing_ns == 5_000_000_000)
+    assert(formatter_fixture.format(timer.get_timing_ns) == "0:00:05.0")
+
+def test_format_polled_display(formatter_fixture):
+    # A display polled 100 times per displayed tenth of second, its cost
+    # against the former str(timedelta) is in benchmarks/timer.py
+    for timing in range(10_000_000_000, 0, -1_000_000):
+        seconds, nanoseconds = divmod(timing, 1_000_000_000)
+        assert(formatter_fixture.format(timing)
+               == f"0:00:{seconds:02}.{nanoseconds // 100_000_000}")
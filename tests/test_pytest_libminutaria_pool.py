@@ -0,0 +1,124 @@
+import time
+import pytest
+from libminutaria import Timer, TimerSequence, TimerPool, FakeClock
+
+def timer_ending_in(clock, milliseconds):
+    timer = Timer(hours=0, minutes=0, seconds=0, clock=clock)
+    timer._deadline = clock.now() + milliseconds * 1_000_000
+    return timer
+
+@pytest.fixture
+def clock_fixture():
+    return FakeClock(start=3600 * 1_000_000_000)
+
+@pytest.fixture
+def pool_fixture(clock_fixture):
+    return TimerPool(clock_fixture)
+
+def test_add(pool_fixture):
+    timer = Timer(hours=0, minutes=0, seconds=5)
+    pool_fixture.add(timer)
+    assert(timer in pool_fixture)
+    assert(len(pool_fixture) == 1)
+    assert(pool_fixture.next_deadline() == timer._deadline)
+
+def test_add_if_already_exist(pool_fixture):
+    timer = Timer(hours=0, minutes=0, seconds=5)
+    pool_fixture.add(timer)
+    with pytest.raises(ValueError):
+        pool_fixture.add(timer)
+
+def test_sequence_expires_after_last_step(clock_fixture, pool_fixture):
+    sequence = TimerSequence([("work", 0, 0, 1), ("rest", 0, 0, 2)],
+                             repeat=2, clock=clock_fixture)
+    pool_fixture.add(sequence)
+    assert(pool_fixture.next_deadline() - clock_fixture.now() == 6_000_000_000)
+    clock_fixture.advance(1.5)
+    assert(pool_fixture.pop_expired() == [])
+    # Paused during the first rest, then resumed
+    pool_fixture.pause(sequence)
+    clock_fixture.advance(10)
+    pool_fixture.resume(sequence)
+    assert(pool_fixture.next_deadline() - clock_fixture.now() == 4_500_000_000)
+    clock_fixture.advance(4.5)
+    assert(pool_fixture.pop_expired() == [sequence])
+    assert(sequence.get_timing_ns == 0)
+
+def test_pop_expired_ordered_by_deadline(clock_fixture, pool_fixture):
+    late = timer_ending_in(clock_fixture, -10)
+    early = timer_ending_in(clock_fixture, -20)
+    running = timer_ending_in(clock_fixture, 5000)
+    for timer in (late, running, early):
+        pool_fixture.add(timer)
+    assert(pool_fixture.pop_expired() == [early, late])
+    assert(early.is_timing_reached() and late.is_timing_reached())
+    assert(len(pool_fixture) == 1)
+    assert(pool_fixture.next_deadline() == running._deadline)
+
+def test_cancel(clock_fixture, pool_fixture):
+    timer = timer_ending_in(clock_fixture, -10)
+    pool_fixture.add(timer)
+    pool_fixture.cancel(timer)
+    assert(timer not in pool_fixture)
+    assert(pool_fixture.next_deadline() is None)
+    assert(pool_fixture.pop_expired() == [])
+    with pytest.raises(ValueError):
+        pool_fixture.cancel(timer)
+
+def test_pause_and_resume(clock_fixture, pool_fixture):
+    timer = timer_ending_in(clock_fixture, 50)
+    pool_fixture.add(timer)
+    assert(not pool_fixture.is_paused(timer))
+    pool_fixture.pause(timer)
+    assert(timer in pool_fixture and pool_fixture.is_paused(timer))
+    assert(pool_fixture.next_deadline() is None)
+    clock_fixture.advance(0.1)
+    # A paused timer does not expire
+    assert(pool_fixture.pop_expired() == [])
+    pool_fixture.resume(timer)
+    assert(not pool_fixture.is_paused(timer))
+    assert(pool_fixture.next_deadline() == timer._deadline)
+    assert(timer._deadline - clock_fixture.now() == 50_000_000)
+    with pytest.raises(ValueError):
+        pool_fixture.resume(timer)
+
+def test_pause_if_not_running(pool_fixture):
+    with pytest.raises(ValueError):
+        pool_fixture.pause(Timer(hours=0, minutes=0, seconds=5))
+
+def test_wait(clock_fixture, pool_fixture):
+    timer = timer_ending_in(clock_fixture, 50)
+    pool_fixture.add(timer)
+    pool_fixture.add(timer_ending_in(clock_fixture, 5000))
+    # Slept until the earliest deadline only
+    assert(pool_fixture.wait() == [timer])
+    assert(clock_fixture.now() == timer._deadline)
+
+def test_wait_timeout(clock_fixture, pool_fixture):
+    timer = timer_ending_in(clock_fixture, 5000)
+    pool_fixture.add(timer)
+    assert(pool_fixture.wait(timeout=0.01) == [])
+    assert(pool_fixture.wait(timeout=0) == [])
+    assert(timer._deadline - clock_fixture.now() == 4_990_000_000)
+
+def test_wait_on_the_monotonic_clock():
+    pool = TimerPool()
+    timer = Timer(hours=0, minutes=0, seconds=0.05)
+    pool.add(timer)
+    start = time.monotonic_ns()
+    assert(pool.wait() == [timer])
+    assert(time.monotonic_ns() >= timer._deadline)
+    assert(time.monotonic_ns() - start < 1_000_000_000)
+
+def test_many_timers(clock_fixture, pool_fixture):
+    timers = [timer_ending_in(clock_fixture, 1000 + i) for i in range(10000)]
+    for timer in timers:
+        pool_fixture.add(timer)
+    # Cancel most of them, the heap is compacted along the way
+    for timer in timers[:9000]:
+        pool_fixture.cancel(timer)
+    assert(len(pool_fixture) == 1000)
+    assert(len(pool_fixture._heap) <= 2000)
+    assert(pool_fixture.next_deadline() == timers[9000]._deadline)
+    assert(pool_fixture.pop_expired(now=timers[9009]._deadline)
+           == timers[9000:9010])
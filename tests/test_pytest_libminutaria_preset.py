@@ -89,3 +89,9 @@ def test_set_duration_if_not_exist(preset_fixture):
     # Shall raise an error
     with pytest.raises(ValueError):
         preset_fixture.set_duration(2, 3, 4)
+
+def test_slots():
+    preset = Preset('preset_test', 1, 2, 3, 'preset_test.json')
+    assert(not hasattr(preset, '__dict__'))
+    with pytest.raises(AttributeError):
+        preset.new_name = 'renamed_preset_test'
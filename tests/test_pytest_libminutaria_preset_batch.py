@@ -0,0 +1,107 @@
+import pytest
+import os
+import io
+import sys
+import json
+from libminutaria import (Preset, PresetStore, import_presets, export_presets,
+                          get_cli_args, handle_cli_args)
+import libminutaria.libminutaria
+
+PRESET_FILE = 'preset_batch_test.json'
+
+@pytest.fixture
+def writes_fixture(monkeypatch):
+    # Count the writes of the preset file
+    writes = []
+    original_write = libminutaria.libminutaria._write_json_atomically
+    def counting_write(*args, **kwargs):
+        writes.append(args[0])
+        return original_write(*args, **kwargs)
+    monkeypatch.setattr(libminutaria.libminutaria, '_write_json_atomically',
+                        counting_write)
+    PresetStore.open(PRESET_FILE)
+    writes.clear()
+    yield writes
+    # Remove the JSON preset test file after the test
+    os.remove(PRESET_FILE)
+
+def test_add_many(writes_fixture):
+    presets = [(f'preset_{number}', 0, 1, number % 60)
+               for number in range(1000)]
+    added = Preset.add_many(presets, PRESET_FILE)
+    assert(len(added) == 1000)
+    assert(len(writes_fixture) == 1)
+    assert(Preset('preset_999', preset_file=PRESET_FILE).get()
+           == {"hours": 0, "minutes": 1, "seconds": 39})
+
+def test_add_many_if_already_exist(writes_fixture):
+    Preset('preset_1', 0, 0, 1, PRESET_FILE).add()
+    with pytest.raises(ValueError):
+        Preset.add_many([('preset_0', 0, 0, 1), ('PRESET_1', 0, 0, 1)],
+                        PRESET_FILE)
+    # Nothing was added
+    assert(Preset.get_all(PRESET_FILE) == ['Preset_1'])
+    with pytest.raises(ValueError):
+        Preset.add_many([('preset_2', 0, 0, 1), ('preset_2', 0, 0, 2)],
+                        PRESET_FILE)
+
+def test_delete_many(writes_fixture):
+    Preset.add_many([(f'preset_{number}', 0, 0, 1) for number in range(5)],
+                    PRESET_FILE)
+    assert(Preset.delete_many(['preset_1', 'Preset_3'], PRESET_FILE))
+    assert(Preset.get_all(PRESET_FILE) == ['Preset_0', 'Preset_2',
+                                           'Preset_4'])
+    with pytest.raises(ValueError):
+        Preset.delete_many(['preset_0', 'preset_1'], PRESET_FILE)
+    assert(len(Preset.get_all(PRESET_FILE)) == 3)
+    assert(len(writes_fixture) == 2)
+
+def test_set_durations(writes_fixture):
+    Preset.add_many([(f'preset_{number}', 0, 0, 1) for number in range(5)],
+                    PRESET_FILE)
+    assert(Preset.set_durations([('preset_0', 1, 2, 3),
+                                 ('preset_4', 4, 5, 6)], PRESET_FILE))
+    assert(Preset('preset_4', preset_file=PRESET_FILE).get()
+           == {"hours": 4, "minutes": 5, "seconds": 6})
+    with pytest.raises(ValueError):
+        Preset.set_durations([('preset_0', 0, 0, 1),
+                              ('not_existing', 0, 0, 1)], PRESET_FILE)
+    assert(Preset('preset_0', preset_file=PRESET_FILE).get()
+           == {"hours": 1, "minutes": 2, "seconds": 3})
+    assert(len(writes_fixture) == 2)
+
+@pytest.mark.parametrize("preset_format", ["json", "csv"])
+def test_export_then_import(writes_fixture, preset_format):
+    presets = [(f'preset_{number}', 1, 2, number) for number in range(10)]
+    Preset.add_many(presets, PRESET_FILE)
+    stream = io.StringIO()
+    assert(export_presets(stream, preset_format, PRESET_FILE) == 10)
+    Preset.delete_many([name for name, *_ in presets], PRESET_FILE)
+    stream.seek(0)
+    assert(import_presets(stream, preset_format, PRESET_FILE) == 10)
+    assert(PresetStore.open(PRESET_FILE).items() == presets)
+
+def test_import_csv_defaults(writes_fixture):
+    stream = io.StringIO("name,seconds\nTea,30\n")
+    assert(import_presets(stream, "csv", PRESET_FILE) == 1)
+    assert(Preset('tea', preset_file=PRESET_FILE).get()
+           == {"hours": 0, "minutes": 0, "seconds": 30})
+
+def test_import_malformed(writes_fixture):
+    with pytest.raises(ValueError):
+        import_presets(io.StringIO('[{"name": "tea"}]'), "json", PRESET_FILE)
+    with pytest.raises(ValueError):
+        import_presets(io.StringIO("name,seconds\ntea,x\n"), "csv",
+                       PRESET_FILE)
+    assert(writes_fixture == [])
+
+def test_handle_cli_args_import_presets(writes_fixture, monkeypatch, capsys):
+    stream = io.StringIO("name,hours,minutes,seconds\ntea,0,3,0\n")
+    stream.name = "presets.csv"
+    monkeypatch.setattr(sys, "stdin", stream)
+    monkeypatch.setattr(sys, "argv", ["minutaria", "-ip", "-",
+                                      "--preset_file", PRESET_FILE])
+    with pytest.raises(SystemExit):
+        handle_cli_args(get_cli_args("0:00:05"))
+    assert(capsys.readouterr().out == "Presets imported: 1\n")
+    assert(Preset.get_all(PRESET_FILE) == ['Tea'])
@@ -0,0 +1,54 @@
+import pytest
+import os
+import json
+import multiprocessing
+from libminutaria import Preset, PresetStore
+
+WRITERS = 4
+PRESETS_PER_WRITER = 25
+PRESET_FILE = 'preset_concurrency_test.json'
+
+def writer(index):
+    # Add, modify, rename and delete presets concurrently with other writers
+    for number in range(PRESETS_PER_WRITER):
+        preset = Preset(f'writer_{index}_{number}', 0, 0, 1, PRESET_FILE)
+        preset.add()
+        preset.set_duration(0, index, number)
+    temporary = Preset(f'temporary_{index}', 0, 0, 1, PRESET_FILE)
+    temporary.add()
+    temporary.rename(f'renamed_{index}')
+    Preset(f'renamed_{index}', preset_file=PRESET_FILE).delete()
+
+@pytest.fixture
+def preset_file_fixture():
+    PresetStore.open(PRESET_FILE)
+    yield PRESET_FILE
+    os.remove(PRESET_FILE)
+
+def test_parallel_writers(preset_file_fixture):
+    processes = [multiprocessing.Process(target=writer, args=(index,))
+                 for index in range(WRITERS)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert(process.exitcode == 0)
+
+    # No lost nor corrupted preset
+    with open(preset_file_fixture, 'r') as preset_file_read:
+        json_data = json.load(preset_file_read)
+    assert(len(json_data) == WRITERS * PRESETS_PER_WRITER)
+    for index in range(WRITERS):
+        for number in range(PRESETS_PER_WRITER):
+            preset = Preset(f'writer_{index}_{number}',
+                            preset_file=preset_file_fixture)
+            assert(preset.get() == {"hours": 0,
+                                    "minutes": index,
+                                    "seconds": number})
+    # No temporary file left
+    assert([name for name in os.listdir('.') if name.endswith('.tmp')] == [])
+
+def test_write_keeps_permissions(preset_file_fixture):
+    os.chmod(preset_file_fixture, 0o640)
+    Preset('preset_test', 0, 0, 1, preset_file_fixture).add()
+    assert(os.stat(preset_file_fixture).st_mode & 0o777 == 0o640)
@@ -0,0 +1,84 @@
+import pytest
+import os
+import json
+from libminutaria import Preset, PresetStore, PresetJournal
+import libminutaria.libminutaria
+
+JOURNAL_FILE = 'preset_journal_test.jsonl'
+
+def read_records():
+    with open(JOURNAL_FILE, 'r') as journal_read:
+        return [json.loads(line) for line in journal_read]
+
+@pytest.fixture
+def journal_fixture():
+    journal = PresetStore.open(JOURNAL_FILE)
+    yield journal
+    # Remove the journal test file after the test
+    os.remove(JOURNAL_FILE)
+
+def test_open_selects_journal(journal_fixture):
+    assert(isinstance(journal_fixture, PresetJournal))
+    assert(read_records() == [])
+
+def test_changes_are_appended(journal_fixture, monkeypatch):
+    # Whole file rewrites are only done by compaction
+    monkeypatch.setattr(libminutaria.libminutaria, '_write_json_atomically',
+                        None)
+    preset = Preset('preset_test', 1, 2, 3, JOURNAL_FILE)
+    preset.add()
+    preset.set_duration(2, 3, 4)
+    preset.rename('renamed_preset_test')
+    Preset('renamed_preset_test', preset_file=JOURNAL_FILE).delete()
+    assert([record["op"] for record in read_records()]
+           == ["add", "set_duration", "rename", "delete"])
+
+def test_replay(journal_fixture):
+    Preset.add_many([(f'preset_{number}', 0, 0, number)
+                     for number in range(5)], JOURNAL_FILE)
+    Preset('preset_1', preset_file=JOURNAL_FILE).rename('renamed')
+    Preset('preset_2', preset_file=JOURNAL_FILE).delete()
+    Preset('preset_3', preset_file=JOURNAL_FILE).set_duration(1, 1, 1)
+    replayed = PresetJournal(os.path.abspath(JOURNAL_FILE))
+    assert(replayed.items() == journal_fixture.items()
+           == [('preset_0', 0, 0, 0), ('renamed', 0, 0, 1),
+               ('preset_3', 1, 1, 1), ('preset_4', 0, 0, 4)])
+
+def test_reload_appended_records(journal_fixture):
+    Preset('preset_test', 0, 0, 1, JOURNAL_FILE).add()
+    # Simulate another process appending a record
+    with open(JOURNAL_FILE, 'a') as journal_write:
+        journal_write.write(json.dumps({"op": "add",
+                                        "name": "other_preset_test",
+                                        "duration": {"hours": 0,
+                                                     "min": 0,
+                                                     "secs": 42}}) + '\n')
+    assert(journal_fixture.names() == ['preset_test', 'other_preset_test'])
+    assert(journal_fixture._records == 2)
+
+def test_torn_record(journal_fixture):
+    Preset('preset_test', 0, 0, 1, JOURNAL_FILE).add()
+    # Simulate a crash while appending a record
+    with open(JOURNAL_FILE, 'a') as journal_write:
+        journal_write.write('{"op": "delete", "na')
+    assert(journal_fixture.names() == ['preset_test'])
+    Preset('other_preset_test', 0, 0, 2, JOURNAL_FILE).add()
+    assert([record["name"] for record in read_records()]
+           == ['preset_test', 'other_preset_test'])
+
+def test_compaction(journal_fixture):
+    journal_fixture.compact_threshold = 10
+    preset = Preset('preset_test', 0, 0, 1, JOURNAL_FILE)
+    preset.add()
+    for seconds in range(2, 12):
+        preset.set_duration(0, 0, seconds)
+    # Compacted to one record per preset
+    assert(read_records() == [{"name": "preset_test",
+                               "duration": {"hours": 0,
+                                            "min": 0,
+                                            "secs": 11},
+                               "op": "add"}])
+    preset.set_duration(0, 0, 12)
+    assert(len(read_records()) == 2)
+    assert(PresetJournal(os.path.abspath(JOURNAL_FILE)).get('preset_test')
+           == {"hours": 0, "minutes": 0, "seconds": 12})
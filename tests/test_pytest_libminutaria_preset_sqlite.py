@@ -0,0 +1,125 @@
+import pytest
+import os
+import sys
+import sqlite3
+from libminutaria import (Preset, PresetStore, PresetJournal,
+                          SQLitePresetStore, migrate_presets, get_cli_args,
+                          handle_cli_args)
+
+DATABASE_FILE = 'preset_sqlite_test.sqlite'
+JSON_FILE = 'preset_sqlite_test.json'
+
+@pytest.fixture
+def database_fixture():
+    database = PresetStore.open(DATABASE_FILE)
+    yield database
+    database._connection.close()
+    # Remove the database test files after the test
+    for path in (DATABASE_FILE, DATABASE_FILE + '-wal',
+                 DATABASE_FILE + '-shm', JSON_FILE):
+        if os.path.exists(path):
+            os.remove(path)
+    PresetStore._stores.pop(os.path.abspath(DATABASE_FILE), None)
+
+def test_open_selects_sqlite(database_fixture):
+    assert(isinstance(database_fixture, SQLitePresetStore))
+    connection = sqlite3.connect(DATABASE_FILE)
+    assert(connection.execute("PRAGMA journal_mode").fetchone()[0] == 'wal')
+    query_plan = connection.execute("EXPLAIN QUERY PLAN SELECT hours FROM "
+                                    "preset WHERE name = 'x'").fetchall()
+    assert('preset_name' in str(query_plan))
+    connection.close()
+
+def test_open_if_not_exist():
+    with pytest.raises(FileNotFoundError):
+        PresetStore.open('not_existing_preset_test.sqlite', create=False)
+
+def test_preset_operations(database_fixture):
+    preset = Preset('Preset_Test', 1, 2, 3, DATABASE_FILE)
+    assert(preset.add() == {"name": "preset_test",
+                            "duration": {"hours": 1, "min": 2, "secs": 3}})
+    with pytest.raises(ValueError):
+        preset.add()
+    assert(preset.get() == {"hours": 1, "minutes": 2, "seconds": 3})
+    assert(preset.set_duration(2, 3, 4))
+    assert(preset.get() == {"hours": 2, "minutes": 3, "seconds": 4})
+    Preset('existing_preset_test', 0, 0, 1, DATABASE_FILE).add()
+    with pytest.raises(ValueError):
+        preset.rename('existing_preset_test')
+    assert(preset.rename('renamed_preset_test'))
+    with pytest.raises(ValueError):
+        preset.get()
+    assert(Preset.get_all(DATABASE_FILE) == ['Renamed_preset_test',
+                                             'Existing_preset_test'])
+    assert(Preset('renamed_preset_test', preset_file=DATABASE_FILE).delete())
+    with pytest.raises(ValueError):
+        Preset('renamed_preset_test', preset_file=DATABASE_FILE).delete()
+    assert(len(database_fixture) == 1)
+
+def test_batch_is_all_or_nothing(database_fixture):
+    Preset.add_many([('tea', 0, 3, 0), ('egg', 0, 9, 0)], DATABASE_FILE)
+    with pytest.raises(ValueError):
+        Preset.add_many([('rice', 0, 12, 0), ('tea', 0, 4, 0)],
+                        DATABASE_FILE)
+    with pytest.raises(ValueError):
+        Preset.delete_many(['egg', 'rice'], DATABASE_FILE)
+    with pytest.raises(ValueError):
+        Preset.set_durations([('egg', 0, 8, 0), ('rice', 0, 10, 0)],
+                             DATABASE_FILE)
+    assert(database_fixture.items() == [('tea', 0, 3, 0), ('egg', 0, 9, 0)])
+
+def test_names_prefix(database_fixture):
+    Preset.add_many([(name, 0, 0, 1) for name in
+                     ('tea_green', 'egg', 'tea_black', 'teapot', 'tez')],
+                    DATABASE_FILE)
+    assert(database_fixture.names('Tea_') == ['tea_green', 'tea_black'])
+    assert(database_fixture.names('tea') == ['tea_green', 'tea_black',
+                                             'teapot'])
+
+def test_migrate_presets(database_fixture):
+    Preset.add_many([(f'preset_{number}', 0, 0, number)
+                     for number in range(10)], JSON_FILE)
+    assert(migrate_presets(JSON_FILE, DATABASE_FILE) == 10)
+    assert(database_fixture.items() == PresetStore.open(JSON_FILE).items())
+    with pytest.raises(ValueError):
+        migrate_presets(JSON_FILE, DATABASE_FILE)
+
+def test_migrate_sequence_presets(database_fixture, monkeypatch):
+    Preset('tea', 0, 3, 0, JSON_FILE).add()
+    PresetStore.open(JSON_FILE).add_sequence('pomodoro',
+                                             [('work', 0, 25, 0),
+                                              ('break', 0, 5, 0)], 4)
+    # The database has no sequence: nothing is migrated
+    with pytest.raises(ValueError):
+        migrate_presets(JSON_FILE, DATABASE_FILE)
+    assert(database_fixture.items() == [])
+    # A preset journal keeps them, appended with a single write
+    journal_file = 'preset_sqlite_test.jsonl'
+    commits = []
+    commit = PresetJournal._commit
+    monkeypatch.setattr(PresetJournal, '_commit',
+                        lambda self, records: commits.append(len(records))
+                        or commit(self, records))
+    try:
+        assert(migrate_presets(JSON_FILE, journal_file) == 2)
+        assert(commits == [2])
+        journal = PresetStore.open(journal_file)
+        assert(journal.items() == PresetStore.open(JSON_FILE).items())
+        assert(journal.sequences() == PresetStore.open(JSON_FILE).sequences()
+               == [('pomodoro', {"steps": [('work', 0, 25, 0),
+                                           ('break', 0, 5, 0)],
+                                 "repeat": 4})])
+    finally:
+        os.remove(journal_file)
+        PresetStore._stores.pop(os.path.abspath(journal_file), None)
+
+def test_handle_cli_args_migrate_presets(database_fixture, monkeypatch,
+                                         capsys):
+    Preset('tea', 0, 3, 0, JSON_FILE).add()
+    monkeypatch.setattr(sys, "argv", ["minutaria", "-mp", JSON_FILE,
+                                      DATABASE_FILE])
+    with pytest.raises(SystemExit):
+        handle_cli_args(get_cli_args("0:00:05"))
+    assert(capsys.readouterr().out == "Presets migrated: 1\n")
+    assert(Preset('tea', preset_file=DATABASE_FILE).get()
+           == {"hours": 0, "minutes": 3, "seconds": 0})
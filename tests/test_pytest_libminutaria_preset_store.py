@@ -0,0 +1,118 @@
+import pytest
+import os
+import json
+import tracemalloc
+from libminutaria import Preset, PresetStore, PresetRecord
+
+@pytest.fixture
+def store_fixture():
+    store = PresetStore.open('preset_store_test.json')
+    yield store
+    # Remove the JSON preset test file after the test
+    os.remove('preset_store_test.json')
+
+def test_open_creates_file(store_fixture):
+    with open('preset_store_test.json', 'r') as preset_file_read:
+        assert(json.load(preset_file_read) == [])
+
+def test_open_if_not_exist():
+    with pytest.raises(FileNotFoundError):
+        PresetStore.open('not_existing_preset_test.json', create=False)
+
+def test_open_is_shared(store_fixture):
+    assert(PresetStore.open('preset_store_test.json') is store_fixture)
+    preset = Preset('preset_test', 1, 2, 3, 'preset_store_test.json')
+    preset.add()
+    assert(preset._store is store_fixture)
+
+def test_add_and_get(store_fixture):
+    store_fixture.add('Preset_Test', 1, 2, 3)
+    assert('preset_test' in store_fixture)
+    assert(store_fixture.get('PRESET_TEST') == {"hours": 1,
+                                                "minutes": 2,
+                                                "seconds": 3})
+
+def test_get_does_not_reparse(store_fixture, monkeypatch):
+    store_fixture.add('preset_test', 1, 2, 3)
+    calls = []
+    original_load = json.load
+    monkeypatch.setattr(json, 'load',
+                        lambda *args: calls.append(args) or
+                        original_load(*args))
+    for _ in range(100):
+        store_fixture.get('preset_test')
+    assert(calls == [])
+
+def test_reload_if_modified_by_another_process(store_fixture):
+    store_fixture.add('preset_test', 1, 2, 3)
+    # Simulate another process writing the file
+    with open('preset_store_test.json', 'w') as preset_file_write:
+        json.dump([{"name": "other_preset_test",
+                    "duration": {"hours": 0, "min": 0, "secs": 42}}],
+                  preset_file_write, indent=4)
+    assert(store_fixture.names() == ['other_preset_test'])
+    with pytest.raises(ValueError):
+        store_fixture.get('preset_test')
+
+def test_rename_keeps_order(store_fixture):
+    for name in ('first', 'second', 'third'):
+        store_fixture.add(name, 0, 0, 1)
+    store_fixture.rename('second', 'Renamed')
+    assert(store_fixture.names() == ['first', 'renamed', 'third'])
+    with open('preset_store_test.json', 'r') as preset_file_read:
+        assert([preset["name"] for preset in json.load(preset_file_read)]
+               == ['first', 'renamed', 'third'])
+
+def test_delete_and_set_duration(store_fixture):
+    store_fixture.add('first', 0, 0, 1)
+    store_fixture.add('second', 0, 0, 2)
+    assert(store_fixture.set_duration('first', 1, 1, 1))
+    assert(store_fixture.delete('second'))
+    assert(len(store_fixture) == 1)
+    with pytest.raises(ValueError):
+        store_fixture.delete('second')
+    with open('preset_store_test.json', 'r') as preset_file_read:
+        assert(json.load(preset_file_read) ==
+               [{"name": "first",
+                 "duration": {"hours": 1, "min": 1, "secs": 1}}])
+
+def test_get_all(store_fixture):
+    with pytest.raises(ValueError):
+        Preset.get_all('preset_store_test.json')
+    store_fixture.add('preset_test', 0, 0, 1)
+    assert(Preset.get_all('preset_store_test.json') == ['Preset_test'])
+    assert(Preset.get_all('not_existing_preset_test.json') == [])
+
+def test_presets_held_as_records(store_fixture):
+    store_fixture.add('first', 0, 0, 1)
+    store_fixture.add_many([('second', 0, 0, 2)])
+    store_fixture.rename('second', 'renamed')
+    store_fixture.set_duration('first', 1, 1, 1)
+    assert(store_fixture.items() == [('first', 1, 1, 1),
+                                     ('renamed', 0, 0, 2)])
+    # Reloaded from the file
+    PresetStore._stores.clear()
+    store = PresetStore.open('preset_store_test.json')
+    assert(store.items() == [PresetRecord('first', 1, 1, 1),
+                             PresetRecord('renamed', 0, 0, 2)])
+    for name, record in store._presets.items():
+        assert(isinstance(record, PresetRecord))
+        # The key and the record share the same interned name
+        assert(record.name is name)
+    with pytest.raises(AttributeError):
+        store.items()[0].hours = 2
+
+def test_loaded_presets_memory(store_fixture):
+    store_fixture.add_many(((f"preset{index}", 0, index // 60 % 60,
+                             index % 60) for index in range(10000)))
+    PresetStore._stores.clear()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        store = PresetStore.open('preset_store_test.json')
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert(len(store) == 10000)
+    # A record, its name and its entry in the index, instead of two dicts
+    assert((after - before) / len(store) < 300)
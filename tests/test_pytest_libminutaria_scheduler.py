@@ -0,0 +1,66 @@
+import pytest
+from libminutaria import Timer, TickScheduler, FakeClock
+
+@pytest.fixture
+def clock_fixture():
+    return FakeClock()
+
+@pytest.fixture
+def timer_fixture(clock_fixture):
+    return Timer(hours=0, minutes=0, seconds=5, clock=clock_fixture)
+
+def test_invalid_interval(timer_fixture):
+    with pytest.raises(ValueError):
+        TickScheduler(timer_fixture, interval=0)
+
+def test_clock_of_the_timer(clock_fixture, timer_fixture):
+    assert(TickScheduler(timer_fixture)._clock is clock_fixture)
+
+def test_next_tick_is_bounded_by_interval(clock_fixture, timer_fixture):
+    scheduler = TickScheduler(timer_fixture, interval=0.1)
+    assert(scheduler.next_tick() == 0.1)
+    clock_fixture.advance(0.03)
+    assert(scheduler.next_tick() == pytest.approx(0.07))
+
+def test_next_tick_aligned_on_display_boundary(clock_fixture, timer_fixture):
+    # 4.25 sec remaining: next boundary is at 4.2 sec
+    clock_fixture.advance(0.75)
+    scheduler = TickScheduler(timer_fixture, interval=0.1)
+    assert(scheduler.next_tick() == pytest.approx(0.05))
+
+def test_next_tick_when_timing_reached(clock_fixture, timer_fixture):
+    clock_fixture.advance(3600)
+    scheduler = TickScheduler(timer_fixture)
+    assert(scheduler.next_tick() == 0)
+    assert(scheduler.wait())
+
+def test_wait_sleeps_until_boundaries(clock_fixture):
+    timer = Timer(hours=1, clock=clock_fixture)
+    scheduler = TickScheduler(timer, interval=1)
+    counter = timer.is_timing_reached()
+    ticks = 0
+    while counter is False:
+        counter = scheduler.wait()
+        ticks += 1
+        # Woken up exactly on a display boundary
+        assert(timer.get_timing_ns % 1_000_000_000 == 0)
+    # One wake up per second of an hour long timer, without overshoot
+    assert(ticks == 3600)
+    assert(timer.get_timing_ns == 0)
+
+def test_wait_sleeps_instead_of_spinning(clock_fixture, monkeypatch):
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock_fixture.advance(seconds)
+
+    monkeypatch.setattr(clock_fixture, 'sleep', sleep)
+    timer = Timer(hours=0, minutes=0, seconds=0.5, clock=clock_fixture)
+    scheduler = TickScheduler(timer, interval=0.1)
+    counter = timer.is_timing_reached()
+    while counter is False:
+        counter = scheduler.wait()
+    # One sleep per tenth of second, never a busy loop of null sleeps, the
+    # CPU time of a real countdown being in benchmarks/timer.py
+    assert(sleeps == [0.1] * 5)
@@ -0,0 +1,178 @@
+import os
+import sys
+import pytest
+from libminutaria import (TimerSequence, TimerCheckpoint, TickScheduler,
+                          FakeClock, Preset, PresetStore, get_cli_args,
+                          handle_cli_args, handle_sequence_args)
+
+PRESET_FILE = 'sequence_test.json'
+CHECKPOINT_FILE = 'sequence_checkpoint_test.json'
+
+STEPS = [("work", 0, 0, 2), ("rest", 0, 0, 1)]
+
+@pytest.fixture
+def clock_fixture():
+    return FakeClock()
+
+@pytest.fixture
+def sequence_fixture(clock_fixture):
+    return TimerSequence(STEPS, repeat=2, clock=clock_fixture)
+
+@pytest.fixture
+def files_fixture():
+    yield
+    for path in (PRESET_FILE, PRESET_FILE + 'l', CHECKPOINT_FILE):
+        if os.path.exists(path):
+            os.remove(path)
+        PresetStore._stores.pop(os.path.abspath(path), None)
+
+def test_deadlines_upfront(sequence_fixture):
+    deadlines = sequence_fixture._deadlines
+    assert(sequence_fixture.step_count == 4)
+    # Each step ends exactly its duration after the previous one
+    assert([end - start for start, end in zip(deadlines, deadlines[1:])]
+           == [1_000_000_000, 2_000_000_000, 1_000_000_000])
+    assert(sequence_fixture.get_timing_ns == 2_000_000_000)
+
+def test_steps(clock_fixture, sequence_fixture):
+    assert(not sequence_fixture.is_timing_reached())
+    assert(sequence_fixture.step_label == "work")
+    clock_fixture.advance(2.5)
+    assert(not sequence_fixture.is_timing_reached())
+    assert((sequence_fixture.step, sequence_fixture.step_label) == (1, "rest"))
+    assert(sequence_fixture.get_timing_ns == 500_000_000)
+    assert(sequence_fixture.get_step_ns == 1_000_000_000)
+    # Several steps elapsed between two checks
+    clock_fixture.advance(3)
+    assert(not sequence_fixture.is_timing_reached())
+    assert((sequence_fixture.step, sequence_fixture.step_label) == (3, "rest"))
+    clock_fixture.advance(1)
+    assert(sequence_fixture.is_timing_reached())
+    assert(sequence_fixture.step == 3)
+
+def test_remaining(sequence_fixture):
+    deadlines = sequence_fixture._deadlines
+    assert(sequence_fixture.remaining(deadlines[0] - 10) == 10)
+    # The step is looked up without moving to it
+    assert(sequence_fixture.remaining(deadlines[1] - 10) == 10)
+    assert(sequence_fixture.remaining(deadlines[3] + 10) == -10)
+    assert(sequence_fixture.step == 0)
+    assert(sequence_fixture._deadline == deadlines[0])
+
+def test_continue_after_pause(clock_fixture, sequence_fixture):
+    clock_fixture.advance(2.5)
+    sequence_fixture.is_timing_reached()
+    # Paused long enough for the following deadlines to pass
+    clock_fixture.advance(10)
+    sequence_fixture._actualized_delta = 400_000_000
+    sequence_fixture.continue_after_pause()
+    deadlines = sequence_fixture._deadlines
+    assert([end - start for start, end in zip(deadlines[1:], deadlines[2:])]
+           == [2_000_000_000, 1_000_000_000])
+    assert(not sequence_fixture.is_timing_reached())
+    assert(sequence_fixture.step == 1)
+
+def test_scheduler_ticks_to_step_end(clock_fixture, sequence_fixture):
+    clock_fixture.advance(1.95)
+    scheduler = TickScheduler(sequence_fixture)
+    assert(scheduler.next_tick() == pytest.approx(0.05))
+
+@pytest.mark.parametrize("steps, repeat", [
+    ([], 1), ([("work", 0, 0, 0)], 1), (STEPS, 0),
+])
+def test_invalid_sequence(steps, repeat):
+    with pytest.raises(ValueError):
+        TimerSequence(steps, repeat)
+
+def test_checkpoint(files_fixture):
+    # Saved as a point of wall clock time, on the monotonic clock
+    sequence = TimerSequence(STEPS, repeat=2)
+    sequence._schedule(1, 500_000_000)
+    TimerCheckpoint(CHECKPOINT_FILE).save(sequence, 'pomodoro')
+    resumed = TimerCheckpoint(CHECKPOINT_FILE).load()
+    timer = resumed["timer"]
+    assert(isinstance(timer, TimerSequence))
+    assert((timer.step, timer.repeat, resumed["label"]) == (1, 2, 'pomodoro'))
+    assert(abs(timer._deadline - sequence._deadline) < 1_000_000)
+    assert(abs(timer._deadlines[3] - sequence._deadlines[3]) < 1_000_000)
+
+@pytest.mark.parametrize("preset_file", [PRESET_FILE, PRESET_FILE + 'l'])
+def test_sequence_preset(files_fixture, preset_file):
+    Preset('tea', 0, 3, 0, preset_file).add()
+    Preset.add_sequence('Pomodoro', STEPS, 4, preset_file)
+    with pytest.raises(ValueError):
+        Preset.add_sequence('tea', STEPS, 4, preset_file)
+    # Reloaded from the file
+    PresetStore._stores.clear()
+    assert(Preset.get_sequence('pomodoro', preset_file)
+           == {"steps": STEPS, "repeat": 4})
+    assert(Preset.get_all(preset_file) == ['Tea', 'Pomodoro'])
+    # The sequences aren't timer presets
+    assert(PresetStore.open(preset_file).items() == [('tea', 0, 3, 0)])
+    with pytest.raises(ValueError):
+        Preset('pomodoro', preset_file=preset_file).get()
+    with pytest.raises(ValueError):
+        Preset('pomodoro', preset_file=preset_file).set_duration(0, 1, 0)
+    with pytest.raises(ValueError):
+        Preset.get_sequence('tea', preset_file)
+    assert(Preset('pomodoro', preset_file=preset_file).rename('focus'))
+    assert(Preset.get_sequence('focus', preset_file)["repeat"] == 4)
+
+def test_sequence_preset_sqlite(files_fixture):
+    database_file = 'sequence_test.sqlite'
+    try:
+        with pytest.raises(ValueError):
+            Preset.add_sequence('pomodoro', STEPS, 4, database_file)
+        with pytest.raises(ValueError):
+            Preset.get_sequence('pomodoro', database_file)
+    finally:
+        PresetStore._stores.pop(os.path.abspath(database_file),
+                                None)._connection.close()
+        os.remove(database_file)
+
+def test_handle_sequence_args(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["minutaria", "--sequence", "work=25m",
+                                      "250ms", "--repeat", "3"])
+    args = get_cli_args("0:00:05")
+    handle_cli_args(args)
+    assert(handle_sequence_args(args)
+           == {"steps": [("work", 0, 25, 0), ("", 0, 0, 0.25)],
+               "repeat": 3})
+
+def test_handle_sequence_args_none(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["minutaria", "-S", "5"])
+    args = get_cli_args("0:00:05")
+    handle_cli_args(args)
+    assert(handle_sequence_args(args) is None)
+
+def test_handle_sequence_args_add_then_use(files_fixture, monkeypatch,
+                                           capsys):
+    monkeypatch.setattr(sys, "argv", ["minutaria", "-as", "pomodoro",
+                                      "--sequence", "work=25m", "rest=5m",
+                                      "--repeat", "4",
+                                      "--preset_file", PRESET_FILE])
+    with pytest.raises(SystemExit):
+        handle_sequence_args(get_cli_args("0:00:05"))
+    assert(capsys.readouterr().out == "New sequence added: Pomodoro - "
+                                      "work 0:25:00, rest 0:05:00 x 4\n")
+
+    monkeypatch.setattr(sys, "argv", ["minutaria", "-us", "Pomodoro",
+                                      "--preset_file", PRESET_FILE])
+    assert(handle_sequence_args(get_cli_args("0:00:05"))
+           == {"steps": [("work", 0, 25, 0), ("rest", 0, 5, 0)],
+               "repeat": 4})
+
+@pytest.mark.parametrize("arguments, error", [
+    (["--sequence", "work=nope"], "argument --sequence: invalid step"),
+    (["--sequence", "work=0s"], "argument --sequence: invalid step"),
+    (["--sequence", "5m", "--repeat", "0"], "argument --repeat"),
+    (["--sequence", "5m", "-S", "5"], "argument --sequence: not allowed"),
+    (["-as", "pomodoro"], "argument -as/--add_sequence: incomplete input"),
+    (["-us", "nothing", "--preset_file", PRESET_FILE], "does not exist"),
+])
+def test_handle_sequence_args_invalid(files_fixture, monkeypatch, capsys,
+                                      arguments, error):
+    monkeypatch.setattr(sys, "argv", ["minutaria", *arguments])
+    with pytest.raises(SystemExit):
+        handle_sequence_args(get_cli_args("0:00:05"))
+    assert(error in capsys.readouterr().out)
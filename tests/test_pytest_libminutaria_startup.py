@@ -0,0 +1,48 @@
+import os
+import sys
+import subprocess
+from libminutaria import Preset
+
+# Modules only needed by presets, asyncio timers, messages or timer arrays
+LAZY_MODULES = {"json", "csv", "sqlite3", "asyncio", "datetime", "logging",
+                "argparse", "numpy"}
+# Cumulative import time budget of the library, in microseconds
+IMPORT_BUDGET = 100000
+CLI_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                          "minutaria-cli.py")
+
+def importtime(*args):
+    # Run python -X importtime and get the cumulative time of each module
+    completed = subprocess.run([sys.executable, "-X", "importtime", *args],
+                               stdout=subprocess.DEVNULL,
+                               stderr=subprocess.PIPE,
+                               universal_newlines=True,
+                               env=dict(os.environ,
+                                        PYTHONPATH=os.pathsep.join(sys.path)))
+    imports = {}
+    for line in completed.stderr.splitlines():
+        if line.startswith("import time:") and "[us]" not in line:
+            _, cumulative, module = line[len("import time:"):].split("|")
+            imports[module.strip()] = int(cumulative)
+    return imports
+
+def test_import_is_lazy():
+    imports = importtime("-c", "import libminutaria")
+    assert("libminutaria" in imports)
+    assert(LAZY_MODULES.isdisjoint(imports))
+    assert(imports["libminutaria"] < IMPORT_BUDGET)
+
+def test_cli_startup_is_lazy():
+    imports = importtime(CLI_SCRIPT, "--help")
+    assert("argparse" in imports)
+    assert((LAZY_MODULES - {"argparse"}).isdisjoint(imports))
+
+def test_cli_countdown_is_lazy():
+    # A plain countdown neither reads presets nor logs
+    imports = importtime(CLI_SCRIPT, "-S", "0.1")
+    assert("libminutaria" in imports)
+    assert((LAZY_MODULES - {"argparse"}).isdisjoint(imports))
+
+def test_preset_does_not_touch_file():
+    Preset('preset_test', 1, 2, 3, 'preset_startup_test.json')
+    assert(not os.path.exists('preset_startup_test.json'))
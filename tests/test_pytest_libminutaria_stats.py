@@ -0,0 +1,103 @@
+import logging
+import pytest
+from libminutaria import (Timer, ThreadSafeTimer, TickScheduler, Histogram,
+                          TimerStats, FakeClock)
+
+@pytest.fixture
+def stats_fixture():
+    return TimerStats()
+
+def test_histogram_buckets():
+    # Buckets are contiguous and their lowest value maps back to them
+    previous = -1
+    for value in range(100000):
+        bucket = Histogram._bucket(value)
+        assert(bucket in (previous, previous + 1))
+        assert(Histogram._lowest(bucket) <= value)
+        assert(Histogram._bucket(Histogram._lowest(bucket)) == bucket)
+        previous = bucket
+
+def test_histogram_percentile():
+    histogram = Histogram()
+    assert(histogram.percentile(0.5) is None)
+    assert(histogram.summary() == "no value")
+    for value in range(1, 1001):
+        histogram.record(value * 1000)
+    assert(histogram.count == 1000)
+    assert(histogram.maximum == 1_000_000)
+    # Accurate to 12.5%
+    assert(437_500 <= histogram.percentile(0.5) <= 500_000)
+    assert(866_250 <= histogram.percentile(0.99) <= 990_000)
+    assert(histogram.percentile(1) <= histogram.maximum)
+
+def test_histogram_negative():
+    histogram = Histogram()
+    histogram.record(-5)
+    assert(histogram.maximum == 0)
+    assert(histogram.percentile(0.5) == 0)
+
+def test_record_poll(stats_fixture):
+    stats_fixture.record_poll(2_000)
+    stats_fixture.record_poll(-300)
+    stats_fixture.record_poll(-900)
+    # Only the first check after the deadline is an overshoot
+    assert(stats_fixture.polls == 3)
+    assert(stats_fixture.overshoot.count == 1)
+    assert(stats_fixture.overshoot.maximum == 300)
+    # A new timer checked with the same stats
+    stats_fixture.record_poll(5_000)
+    stats_fixture.record_poll(-12)
+    assert(stats_fixture.overshoot.count == 2)
+
+def test_record_tick(stats_fixture):
+    stats_fixture.record_tick(1_500)
+    stats_fixture.record_tick(-1_000)
+    assert(stats_fixture.lateness.count == 1)
+
+def test_timer_stats(stats_fixture):
+    timer = Timer(hours=0, minutes=0, seconds=0, stats=stats_fixture)
+    assert(timer.is_timing_reached())
+    assert(stats_fixture.polls == 1)
+    assert(stats_fixture.overshoot.count == 1)
+
+def test_scheduler_stats(stats_fixture):
+    clock = FakeClock()
+    timer = Timer(hours=0, minutes=0, seconds=1, stats=stats_fixture,
+                  clock=clock)
+    clock.advance(0.7)
+    scheduler = TickScheduler(timer)
+    counter = scheduler.wait()
+    while counter is False:
+        counter = scheduler.wait()
+    # Woken up right on each tenth of second
+    assert(stats_fixture.lateness.count == 3)
+    assert(stats_fixture.lateness.maximum == 0)
+    assert(stats_fixture.polls == stats_fixture.lateness.count)
+    assert(stats_fixture.overshoot.count == 1)
+    # A check without a tick to wait for isn't a tick
+    scheduler.check()
+    assert(stats_fixture.polls == stats_fixture.lateness.count + 1)
+
+def test_scheduler_stats_paused(stats_fixture):
+    clock = FakeClock()
+    timer = ThreadSafeTimer(hours=0, minutes=0, seconds=1,
+                            stats=stats_fixture, clock=clock)
+    scheduler = TickScheduler(timer)
+    clock.advance(0.05)
+    timer.pause()
+    clock.advance(scheduler.next_tick() + 0.002)
+    # The lateness is the one of the wake up, not the pause duration
+    assert(not scheduler.check())
+    assert(stats_fixture.lateness.maximum == 2_000_000)
+    assert(timer.get_timing_ns == 950_000_000)
+
+def test_record_tick_without_stats():
+    Timer(hours=0, minutes=0, seconds=1).record_tick(1_000)
+
+def test_stats_log(stats_fixture, caplog):
+    stats_fixture.record_tick(1_500_000)
+    with caplog.at_level(logging.DEBUG):
+        stats_fixture.log(logging.getLogger("test"))
+    assert("max 1.500 ms (1 values)" in caplog.text)
+    assert("Expiry overshoot: no value" in caplog.text)
+    assert("Polls: 0" in caplog.text)
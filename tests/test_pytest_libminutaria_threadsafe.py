@@ -0,0 +1,99 @@
+import sys
+import time
+import threading
+import pytest
+from libminutaria import ThreadSafeTimer, TimerSnapshot
+
+DURATION = 10_000_000_000
+# A reader may take the clock just before a pause taken by a writer
+CLOCK_TOLERANCE = 100_000_000
+
+@pytest.fixture
+def timer_fixture():
+    return ThreadSafeTimer(hours=0, minutes=0, seconds=10)
+
+@pytest.fixture
+def switch_fixture():
+    # Switch threads as often as possible to provoke races
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+def test_snapshot(timer_fixture):
+    snapshot = timer_fixture.snapshot()
+    assert(isinstance(snapshot, TimerSnapshot))
+    assert(not snapshot.paused)
+    assert(0 < snapshot.remaining <= DURATION)
+
+def test_pause_and_continue(timer_fixture):
+    timer_fixture.pause()
+    paused = timer_fixture.snapshot()
+    time.sleep(0.01)
+    # Paused twice, the first pause is kept
+    timer_fixture.pause()
+    assert(timer_fixture.snapshot() == paused)
+    assert(timer_fixture.paused)
+    assert(not timer_fixture.is_timing_reached())
+    assert(timer_fixture.get_timing_ns == paused.remaining)
+
+    timer_fixture.continue_after_pause()
+    assert(not timer_fixture.paused)
+    assert(timer_fixture.snapshot().remaining <= paused.remaining)
+    assert(timer_fixture._deadline - time.monotonic_ns() > paused.remaining
+           - CLOCK_TOLERANCE)
+
+def test_remaining(timer_fixture):
+    deadline = timer_fixture._state[0]
+    assert(timer_fixture.remaining(deadline - 10) == 10)
+    timer_fixture.pause()
+    paused = timer_fixture.snapshot().remaining
+    # The pause is kept whatever the point of time
+    assert(timer_fixture.remaining(deadline + 10) == paused)
+    assert(timer_fixture.snapshot(deadline + 10) == (paused, True))
+
+def test_timing_reached(timer_fixture):
+    timer_fixture._state = (time.monotonic_ns() - 1, None)
+    assert(timer_fixture.is_timing_reached())
+
+def test_stress(timer_fixture, switch_fixture):
+    stop = threading.Event()
+    errors = []
+    reads = []
+
+    def reader():
+        # The remaining time never increases, whatever the transitions
+        previous = DURATION
+        count = 0
+        while not stop.is_set():
+            remaining, paused = timer_fixture.snapshot()
+            timer_fixture.is_timing_reached()
+            if not 0 < remaining <= previous + CLOCK_TOLERANCE:
+                errors.append((previous, remaining, paused))
+            previous = min(previous, remaining)
+            count += 1
+        reads.append(count)
+
+    def writer():
+        for _ in range(2000):
+            timer_fixture.pause()
+            timer_fixture.continue_after_pause()
+
+    start = time.monotonic_ns()
+    readers = [threading.Thread(target=reader) for _ in range(4)]
+    writers = [threading.Thread(target=writer) for _ in range(4)]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    stop.set()
+    for thread in readers:
+        thread.join()
+    elapsed = time.monotonic_ns() - start
+
+    assert(errors == [])
+    assert(sum(reads) > 0)
+    # No time was lost or given back by the concurrent transitions
+    remaining = timer_fixture.snapshot().remaining
+    assert(DURATION - elapsed - CLOCK_TOLERANCE <= remaining <= DURATION)
+    assert(not timer_fixture.paused)
@@ -1,41 +1,117 @@
+import time
 import pytest
-from datetime import datetime, timedelta
-from libminutaria import Timer
+from libminutaria import (Timer, TimerSequence, ThreadSafeTimer, FakeClock,
+                          MonotonicClock)
 
 @pytest.fixture
-def timer_fixture():
+def clock_fixture():
+    return FakeClock(start=1_000_000_000)
+
+@pytest.fixture
+def timer_fixture(clock_fixture):
+    return Timer(hours=0, minutes=0, seconds=5, clock=clock_fixture)
+
+def test_deadline(clock_fixture, timer_fixture):
+    # The deadline is the launch time plus the duration
+    assert(timer_fixture._delta == 5_000_000_000)
+    assert(timer_fixture._deadline == 6_000_000_000)
+
+def test_monotonic_clock_by_default():
     timer = Timer(hours=0, minutes=0, seconds=5)
-    # 2021-01-01 12:00:00
-    timer._base = datetime(2021, 1, 1, 12, 0, 0, 0)
-    timer._actualization = datetime(timer._base.year,
-                                    timer._base.month,
-                                    timer._base.day,
-                                    timer._base.hour,
-                                    timer._base.minute,
-                                    timer._base.second,
-                                    timer._base.microsecond)
-    return timer
-
-def test_convert_delta_to_datetime(timer_fixture):
-    assert(timer_fixture._convert_delta_to_datetime() ==
-           datetime(2021, 1, 1, 12, 0, 5, 0))
-
-def test_rebase_current_time(timer_fixture):
-    # Not really accurate but can't do better
-    timer_fixture._rebase_current_time()
-    # Check if _actualization was updated with a more
-    # recent (greater) datetime
-    assert(timer_fixture._actualization > timer_fixture._base)
-    # Check if _actualized_delta was reduced
-    assert(timer_fixture._actualized_delta < timer_fixture._delta)
-
-
-def test_is_timing_reached(timer_fixture):
-    # Set timer as if it has just begun
-    # Sufficient with a 5sec timer to pass the test
-    timer_fixture._base = datetime.now()
+    assert(isinstance(timer._clock, MonotonicClock))
+    assert(timer._deadline - timer._delta <= time.monotonic_ns())
+
+@pytest.mark.parametrize("duration, expected", [
+    ({"seconds": 0.25}, 250_000_000),
+    ({"seconds": 0.001}, 1_000_000),
+    ({"minutes": 1, "seconds": 12.345}, 72_345_000_000),
+    ({"hours": 168}, 604_800_000_000_000),
+    ({"hours": 167, "minutes": 59, "seconds": 59.999}, 604_799_999_000_000),
+])
+def test_sub_second_and_multi_day_delta(duration, expected):
+    assert(Timer(**duration)._delta == expected)
+
+@pytest.mark.parametrize("timer", [
+    Timer(seconds=5),
+    TimerSequence([("work", 0, 0, 5)]),
+    ThreadSafeTimer(seconds=5),
+], ids=["Timer", "TimerSequence", "ThreadSafeTimer"])
+def test_slots(timer):
+    assert(not hasattr(timer, '__dict__'))
+    with pytest.raises(AttributeError):
+        timer.label = 'tea'
+
+def test_fake_clock(clock_fixture):
+    clock_fixture.advance(1.5)
+    clock_fixture.sleep(0.25)
+    assert(clock_fixture.now() == 2_750_000_000)
+    with pytest.raises(ValueError):
+        clock_fixture.advance(-1)
+
+def test_actualized_delta(clock_fixture, timer_fixture):
+    clock_fixture.advance(1.25)
+    timer_fixture.is_timing_reached()
+    assert(timer_fixture._actualized_delta == 3_750_000_000)
+
+def test_is_timing_reached(clock_fixture, timer_fixture):
+    clock_fixture.advance(4.999)
+    assert(not timer_fixture.is_timing_reached())
+    clock_fixture.advance(0.001)
+    assert(timer_fixture.is_timing_reached())
+    # Ended for a long time
+    clock_fixture.advance(3600)
+    assert(timer_fixture.is_timing_reached())
+    assert(timer_fixture.get_timing_ns == -3600 * 1_000_000_000)
+
+def test_hour_long_countdown(clock_fixture):
+    timer = Timer(hours=1, clock=clock_fixture)
+    for _ in range(59):
+        clock_fixture.advance(60)
+        assert(not timer.is_timing_reached())
+    assert(timer.get_timing == "0:01:00")
+    clock_fixture.advance(60)
+    assert(timer.is_timing_reached())
+
+def test_get_timing(timer_fixture):
+    assert(timer_fixture.get_timing == "0:00:05")
+    timer_fixture._actualized_delta = 4_250_000_000
+    assert(timer_fixture.get_timing[:9] == "0:00:04.2")
+
+def test_continue_after_pause(clock_fixture, timer_fixture):
+    # Pause the timer with 2 sec remaining, for an hour
+    clock_fixture.advance(3)
     assert(not timer_fixture.is_timing_reached())
-    # Set timer as if it was ended for a long time
-    # With a 5sec, the timer already ended to pass the test
-    timer_fixture._base = datetime(2021, 1, 1, 12, 0, 0, 0)
+    clock_fixture.advance(3600)
+    timer_fixture.continue_after_pause()
+    assert(timer_fixture._delta == 2_000_000_000)
+    assert(timer_fixture.remaining() == 2_000_000_000)
+    assert(not timer_fixture.is_timing_reached())
+    clock_fixture.advance(2)
     assert(timer_fixture.is_timing_reached())
+
+def test_remaining(clock_fixture, timer_fixture):
+    now = timer_fixture._deadline - 1_500_000_000
+    assert(timer_fixture.remaining(now) == 1_500_000_000)
+    assert(timer_fixture.remaining(timer_fixture._deadline + 1) == -1)
+    clock_fixture.advance(1)
+    assert(timer_fixture.remaining() == 4_000_000_000)
+    # Nothing is actualized by the query
+    assert(timer_fixture._actualized_delta == 5_000_000_000)
+
+def test_remaining_shared_timestamp():
+    timers = [Timer(seconds=seconds) for seconds in (1, 2, 3)]
+    now = time.monotonic_ns()
+    remaining = [timer.remaining(now) for timer in timers]
+    assert(remaining == [timer._deadline - now for timer in timers])
+    assert(remaining == sorted(remaining))
+
+def test_is_timing_reached_reads_clock_once(clock_fixture, timer_fixture,
+                                            monkeypatch):
+    # A poll is a single clock read and an integer subtraction, its cost
+    # against the former datetime polling is in benchmarks/timer.py
+    reads = []
+    monkeypatch.setattr(clock_fixture, 'now',
+                        lambda: reads.append(None) or 2_000_000_000)
+    assert(not timer_fixture.is_timing_reached())
+    assert(len(reads) == 1)
+    assert(timer_fixture.get_timing_ns == 4_000_000_000)
@@ -1,9 +1,16 @@
 # TODO : make it work one day
 
+import sys
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 import libminutaria
-from argparse import Namespace
+
+
+def cli_args(*arguments):
+    # Parse a command line as the front ends do, all the other options
+    # keeping their default
+    with patch.object(sys, "argv", ["minutaria", *arguments]):
+        return libminutaria.get_cli_args("0:00:05")
 
 #Preset = Mock()
 #add_return_value = {"name": 'truc', "duration": {"hours": 1,
@@ -50,19 +57,7 @@ class TestCommandLine(unittest.TestCase):
 
     def test_handle_cli_args_duration(self):
         # Test with only a duration given
-        # Create Namespace object as handle_cli_args() test's parameter
-        dict_to_args = {"add_preset": None,
-                "debug": False,
-                "del_preset": None,
-                "hours": 4,
-                "minutes": 20,
-                "modify_preset_duration": None,
-                "rename_preset": None,
-                "seconds": 22,
-                "use_preset": None}
-        duration = Namespace()
-        for arg in dict_to_args:
-            setattr(duration, arg, dict_to_args[arg])
+        duration = cli_args("-H", "4", "-M", "20", "-S", "22")
 
         args = libminutaria.handle_cli_args(duration)
         self.assertEqual(args, ({"timer_hours": 4,
@@ -72,19 +67,7 @@ class TestCommandLine(unittest.TestCase):
 
     def test_handle_cli_args_duration_debug(self):
         # Test with only a duration given and debug flag
-        # Create Namespace object as handle_cli_args() test's parameter
-        dict_to_args = {"add_preset": None,
-                "debug": True,
-                "del_preset": None,
-                "hours": 4,
-                "minutes": 20,
-                "modify_preset_duration": None,
-                "rename_preset": None,
-                "seconds": 22,
-                "use_preset": None}
-        duration = Namespace()
-        for arg in dict_to_args:
-            setattr(duration, arg, dict_to_args[arg])
+        duration = cli_args("-H", "4", "-M", "20", "-S", "22", "-d")
 
         args = libminutaria.handle_cli_args(duration)
         self.assertEqual(args, ({"timer_hours": 4,
@@ -99,19 +82,7 @@ class TestCommandLine(unittest.TestCase):
         libminutaria.Preset.return_value.add.side_effect = ValueError
         __builtins__.print = Mock()
         #libminutaria.Preset.return_value.add.return_value = add_return_value
-        # Create Namespace object as handle_cli_args() test's parameter
-        dict_to_args = {"add_preset": 'truc',
-                "debug": False,
-                "del_preset": None,
-                "hours": None,
-                "minutes": None,
-                "modify_preset_duration": None,
-                "rename_preset": None,
-                "seconds": 22,
-                "use_preset": None}
-        add_existing_preset = Namespace()
-        for arg in dict_to_args:
-            setattr(add_existing_preset, arg, dict_to_args[arg])
+        add_existing_preset = cli_args("-ap", "truc", "-S", "22")
 
         with self.assertRaises(SystemExit):
             args = libminutaria.handle_cli_args(add_existing_preset)
@@ -133,19 +104,7 @@ class TestCommandLine(unittest.TestCase):
                            }
 
         libminutaria.Preset.return_value.add.return_value = add_return_value
-        # Create Namespace object as handle_cli_args() test's parameter
-        dict_to_args = {"add_preset": 'truc',
-                "debug": False,
-                "del_preset": None,
-                "hours": None,
-                "minutes": None,
-                "modify_preset_duration": None,
-                "rename_preset": None,
-                "seconds": 22,
-                "use_preset": None}
-        add_preset = Namespace()
-        for arg in dict_to_args:
-            setattr(add_preset, arg, dict_to_args[arg])
+        add_preset = cli_args("-ap", "truc", "-S", "22")
 
         with self.assertRaises(SystemExit):
             args = libminutaria.handle_cli_args(add_preset)
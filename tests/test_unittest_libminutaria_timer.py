@@ -1,41 +1,27 @@
 import unittest
-from datetime import datetime, timedelta
-from libminutaria import Timer
+from libminutaria import Timer, FakeClock
 
 class TestTimer(unittest.TestCase):
     def setUp(self):
-        self.timer = Timer(hours=0, minutes=0, seconds=5)
-        # 2021-01-01 12:00:00
-        self.timer._base = datetime(2021, 1, 1, 12, 0, 0, 0)
-        self.timer._actualization = datetime(self.timer._base.year,
-                                             self.timer._base.month,
-                                             self.timer._base.day,
-                                             self.timer._base.hour,
-                                             self.timer._base.minute,
-                                             self.timer._base.second,
-                                             self.timer._base.microsecond)
+        self.clock = FakeClock(start=1_000_000_000)
+        self.timer = Timer(hours=0, minutes=0, seconds=5, clock=self.clock)
 
-    def test_convert_delta_to_datetime(self):
-        self.assertEqual(self.timer._convert_delta_to_datetime(),
-                         datetime(2021, 1, 1, 12, 0, 5, 0))
+    def test_deadline(self):
+        # The deadline is the launch time plus the duration
+        self.assertEqual(self.timer._delta, 5_000_000_000)
+        self.assertEqual(self.timer._deadline, 6_000_000_000)
 
-    def test_rebase_current_time(self):
-        # Not really accurate but can't do better
-        self.timer._rebase_current_time()
-        # Check if _actualization was updated with a more
-        # recent (greater) datetime
-        self.assertGreater(self.timer._actualization, self.timer._base)
-        # Check if _actualized_delta was reduced
-        self.assertLess(self.timer._actualized_delta, self.timer._delta)
+    def test_actualized_delta(self):
+        self.clock.advance(1.25)
+        self.timer.is_timing_reached()
+        # Check if _actualized_delta was reduced by the time passed
+        self.assertEqual(self.timer._actualized_delta, 3_750_000_000)
 
     def test_is_timing_reached(self):
-        # Set timer as if it has just begun
-        # Sufficient with a 5sec timer to pass the test
-        self.timer._base = datetime.now()
+        self.clock.advance(4.999)
         self.assertFalse(self.timer.is_timing_reached())
-        # Set timer as if it was ended for a long time
-        # With a 5sec, the timer already ended to pass the test
-        self.timer._base = datetime(2021, 1, 1, 12, 0, 0, 0)
+        # Advance the clock as if the timer ended for a long time
+        self.clock.advance(3600)
         self.assertTrue(self.timer.is_timing_reached())
 
 